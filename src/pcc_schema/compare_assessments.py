@@ -9,15 +9,57 @@ of differences.
 import json
 import csv
 import argparse
+import hashlib
+import heapq
+import importlib.metadata
+import io
 import logging
 import os
+import re
+import tarfile
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Callable, Iterator, List, Optional, TextIO, Tuple
 
 from pcc_schema.pcc_assessment_schema import PCCAssessmentSchema
 
 logger = logging.getLogger(__name__)
 
+# State pre-filter: how much of an export to scan for speakcare_chart.state before falling back to a full parse
+STATE_SCAN_BYTES = 64 * 1024
+_STATE_SCAN_FIRST_CHUNK = 4 * 1024
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_json_decoder = json.JSONDecoder()
+
+
+class _IncompleteScan(Exception):
+    """The scanned prefix of an export ends before speakcare_chart.state was found."""
+
+
+# Assessment schema shared by all comparisons in this process, built on first use
+_shared_pcc_schema: Optional[PCCAssessmentSchema] = None
+
+
+def get_pcc_schema() -> PCCAssessmentSchema:
+    """
+    Return the PCCAssessmentSchema shared by all comparisons in this process.
+    
+    Loading and registering every template is by far the most expensive step of a comparison,
+    so it is done once per process instead of once per file.
+    
+    Returns:
+        The shared PCCAssessmentSchema instance
+    """
+    global _shared_pcc_schema
+    if _shared_pcc_schema is None:
+        _shared_pcc_schema = PCCAssessmentSchema()
+    return _shared_pcc_schema
+
 
 def normalize_response_value(value: Any) -> str:
     """
@@ -66,6 +108,20 @@ def is_empty(value: Any) -> bool:
     return normalized == ""
 
 
+def load_chart_file(file_path: str) -> Dict[str, Any]:
+    """
+    Read and parse a chart export JSON file.
+    
+    Args:
+        file_path: Path to JSON file
+        
+    Returns:
+        The parsed document
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def extract_data_from_json(file_path: str) -> Dict[str, Any]:
     """
     Extract speakcare_chart and pcc_assessment data from JSON file.
@@ -73,6 +129,19 @@ def extract_data_from_json(file_path: str) -> Dict[str, Any]:
     Args:
         file_path: Path to JSON file
         
+    Returns:
+        See extract_data_from_document
+    """
+    return extract_data_from_document(load_chart_file(file_path))
+
+
+def extract_data_from_document(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract speakcare_chart and pcc_assessment data from a parsed chart export.
+    
+    Args:
+        data: Parsed JSON document
+        
     Returns:
         Dictionary with:
         - internal_json: Model output from speakcare_chart
@@ -82,9 +151,6 @@ def extract_data_from_json(file_path: str) -> Dict[str, Any]:
         - patient_id: EHR patient ID from pcc_assessment
         - pcc_assessment: The actual PCC assessment object
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
     # Extract speakcare_chart data
     speakcare_chart = data.get("speakcare_chart", {})
     json_internal_filled = speakcare_chart.get("json_internal_filled", [])
@@ -184,7 +250,8 @@ def convert_speakcare_to_pcc_db(
     schema_id: int,
     assessment_id: int,
     patient_id: int,
-    table_name: str
+    table_name: str,
+    pcc_schema: Optional[PCCAssessmentSchema] = None
 ) -> Dict[str, Any]:
     """
     Convert SpeakCare internal_json to PCC-DB format.
@@ -195,11 +262,14 @@ def convert_speakcare_to_pcc_db(
         assessment_id: Assessment ID
         patient_id: Patient ID
         table_name: Table name (for template_name derivation)
+        pcc_schema: Assessment schema to convert with. If None, uses the shared
+                    instance from get_pcc_schema().
         
     Returns:
         PCC-DB formatted dictionary
     """
-    pcc_schema = PCCAssessmentSchema()
+    if pcc_schema is None:
+        pcc_schema = get_pcc_schema()
     
     template_name = convert_table_name_to_template_name(table_name)
     
@@ -283,22 +353,23 @@ def extract_all_fields(pcc_db_obj: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     return fields
 
 
-def compare_fields(
+def compare_field_values(
     speakcare_fields: Dict[str, Dict[str, Any]],
     pcc_fields: Dict[str, Dict[str, Any]]
-) -> Dict[str, str]:
+) -> Dict[str, Tuple[str, str]]:
     """
-    Compare SpeakCare fields with PCC fields and return differences.
+    Compare SpeakCare fields with PCC fields and return differences as (pcc, speakcare) pairs.
     
-    Only shows differences when SpeakCare has a non-empty value that differs from PCC.
-    If SpeakCare is empty, the field is not included in the output.
+    Each side is the quoted normalized value, followed by the quoted response text when only
+    the response texts differ, so that f"{pcc} != {speakcare}" is the difference string of
+    compare_fields.
     
     Args:
         speakcare_fields: Fields from converted SpeakCare data
         pcc_fields: Fields from PCC assessment
         
     Returns:
-        Dictionary mapping field_key to difference string (e.g., '"a" != "b"')
+        Dictionary mapping field_key to (pcc, speakcare) (e.g., ('"a"', '"b"'))
     """
     differences = {}
     
@@ -324,28 +395,196 @@ def compare_fields(
         
         # Compare values
         if speakcare_normalized != pcc_normalized:
-            # Values differ - format difference
-            diff_str = f'"{pcc_normalized}" != "{speakcare_normalized}"'
-            differences[field_key] = diff_str
+            # Values differ
+            differences[field_key] = (f'"{pcc_normalized}"', f'"{speakcare_normalized}"')
         elif speakcare_text and pcc_text and speakcare_text != pcc_text:
             # Values are same but response_text differs
-            diff_str = f'"{pcc_normalized}" (text: "{pcc_text}") != "{speakcare_normalized}" (text: "{speakcare_text}")'
-            differences[field_key] = diff_str
+            differences[field_key] = (
+                f'"{pcc_normalized}" (text: "{pcc_text}")',
+                f'"{speakcare_normalized}" (text: "{speakcare_text}")'
+            )
     
     return differences
 
 
-def should_process_file(file_path: str, state_filter: Optional[List[str]] = None) -> bool:
+FIELD_OUTCOMES = ("matched", "mismatched", "speakcare_only", "pcc_only", "both_empty")
+
+
+def classify_field_values(
+    speakcare_fields: Dict[str, Dict[str, Any]],
+    pcc_fields: Dict[str, Dict[str, Any]]
+) -> Dict[str, str]:
     """
-    Check if a file should be processed based on state filter.
+    Classify every field of a SpeakCare/PCC pair for agreement statistics.
+    
+    Values are normalized as in compare_field_values, and a field with equal values but
+    different response texts counts as mismatched, as it does in the differences.
+    
+    Args:
+        speakcare_fields: Fields from converted SpeakCare data
+        pcc_fields: Fields from PCC assessment
+        
+    Returns:
+        Dictionary mapping field_key to one of FIELD_OUTCOMES
+    """
+    outcomes = {}
+    
+    for field_key in speakcare_fields.keys() | pcc_fields.keys():
+        speakcare_data = speakcare_fields.get(field_key, {})
+        pcc_data = pcc_fields.get(field_key, {})
+        speakcare_normalized = normalize_response_value(speakcare_data.get("response_value", ""))
+        pcc_normalized = normalize_response_value(pcc_data.get("response_value", ""))
+        
+        if not speakcare_normalized:
+            outcomes[field_key] = "pcc_only" if pcc_normalized else "both_empty"
+        elif not pcc_normalized:
+            outcomes[field_key] = "speakcare_only"
+        elif speakcare_normalized != pcc_normalized:
+            outcomes[field_key] = "mismatched"
+        else:
+            speakcare_text = speakcare_data.get("response_text", "")
+            pcc_text = pcc_data.get("response_text", "")
+            outcomes[field_key] = "mismatched" if speakcare_text and pcc_text and speakcare_text != pcc_text else "matched"
+    
+    return outcomes
+
+
+def compare_fields(
+    speakcare_fields: Dict[str, Dict[str, Any]],
+    pcc_fields: Dict[str, Dict[str, Any]]
+) -> Dict[str, str]:
+    """
+    Compare SpeakCare fields with PCC fields and return differences.
+    
+    Only shows differences when SpeakCare has a non-empty value that differs from PCC.
+    If SpeakCare is empty, the field is not included in the output.
+    
+    Args:
+        speakcare_fields: Fields from converted SpeakCare data
+        pcc_fields: Fields from PCC assessment
+        
+    Returns:
+        Dictionary mapping field_key to difference string (e.g., '"a" != "b"')
+    """
+    return {
+        field_key: f"{pcc} != {speakcare}"
+        for field_key, (pcc, speakcare) in compare_field_values(speakcare_fields, pcc_fields).items()
+    }
+
+
+def _scan_skip_whitespace(text: str, pos: int) -> int:
+    """Return the position of the next non-whitespace character, failing at the end of the prefix."""
+    pos = _JSON_WHITESPACE.match(text, pos).end()
+    if pos >= len(text):
+        raise _IncompleteScan()
+    return pos
+
+
+def _scan_value(text: str, pos: int) -> Tuple[Any, int]:
+    """Decode the JSON value at pos with the C decoder; return (value, end position)."""
+    try:
+        value, end = _json_decoder.raw_decode(text, pos)
+    except json.JSONDecodeError:
+        # Most likely cut off by the end of the prefix; a full parse reports real syntax errors
+        raise _IncompleteScan()
+    if end >= len(text):
+        # A number or literal at the very end may continue in the next chunk
+        raise _IncompleteScan()
+    return value, end
+
+
+def _scan_member_value(text: str, pos: int, wanted_key: str) -> int:
+    """Find member wanted_key of the JSON object at pos, skipping other members; return its value position."""
+    if text[pos] != "{":
+        raise ValueError("Expected an object")
+    pos = _scan_skip_whitespace(text, pos + 1)
+    if text[pos] == "}":
+        raise KeyError(wanted_key)
+    while True:
+        if text[pos] != '"':
+            raise ValueError("Expected a string")
+        key, pos = _scan_value(text, pos)
+        pos = _scan_skip_whitespace(text, pos)
+        if text[pos] != ":":
+            raise ValueError("Expected ':'")
+        pos = _scan_skip_whitespace(text, pos + 1)
+        if key == wanted_key:
+            return pos
+        pos = _scan_skip_whitespace(text, _scan_value(text, pos)[1])
+        if text[pos] == "}":
+            raise KeyError(wanted_key)
+        if text[pos] != ",":
+            raise ValueError("Expected ',' or '}'")
+        pos = _scan_skip_whitespace(text, pos + 1)
+
+
+def _scan_chart_state_prefix(text: str) -> Any:
+    """
+    Find speakcare_chart.state in a prefix of an export.
+    
+    Raises:
+        _IncompleteScan: If the prefix ends first
+        ValueError: If the prefix does not look like a chart export
+        KeyError: If the export has no speakcare_chart.state
+    """
+    chart_pos = _scan_member_value(text, _scan_skip_whitespace(text, 0), "speakcare_chart")
+    state_pos = _scan_member_value(text, chart_pos, "state")
+    return _scan_value(text, state_pos)[0]
+
+
+def scan_chart_state(file_path: str, max_scan_bytes: Optional[int] = None) -> Tuple[bool, Any]:
+    """
+    Read speakcare_chart.state from the start of an export without parsing the whole file.
+    
+    The file is read incrementally and scanning stops as soon as the key is found, so large
+    payloads after it are never read. Only the first max_scan_bytes characters are scanned.
+    The first occurrence of a duplicated key is used.
     
     Args:
         file_path: Path to JSON file
+        max_scan_bytes: Maximum number of characters to read (default: STATE_SCAN_BYTES)
+        
+    Returns:
+        (True, state) if the state was found, or (False, None) if it was not found within
+        max_scan_bytes or the export is not a plain object with a speakcare_chart object;
+        callers then fall back to a full parse
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return _scan_chart_state_stream(f, max_scan_bytes)
+
+
+def _scan_chart_state_stream(f: TextIO, max_scan_bytes: Optional[int] = None) -> Tuple[bool, Any]:
+    """Scan an open text stream for speakcare_chart.state, as in scan_chart_state."""
+    if max_scan_bytes is None:
+        max_scan_bytes = STATE_SCAN_BYTES
+    
+    text = ""
+    while len(text) < max_scan_bytes:
+        # Each attempt rescans from the start, so double the prefix to keep the total work linear
+        chunk = f.read(min(max(len(text), _STATE_SCAN_FIRST_CHUNK), max_scan_bytes - len(text)))
+        if not chunk:
+            break
+        text += chunk
+        try:
+            return True, _scan_chart_state_prefix(text)
+        except _IncompleteScan:
+            continue
+        except (ValueError, KeyError):
+            break
+    return False, None
+
+
+def state_matches(state: Any, state_filter: Optional[List[str]] = None) -> bool:
+    """
+    Check if a chart state matches the state filter.
+    
+    Args:
+        state: The speakcare_chart.state value
         state_filter: List of allowed states. If None, defaults to ["draft"].
-                     If empty list, processes all files.
+                     If empty list, every state matches.
         
     Returns:
-        True if file should be processed, False otherwise
+        True if the state is one of the allowed states, False otherwise
     """
     if state_filter is None:
         state_filter = ["draft"]
@@ -354,20 +593,63 @@ def should_process_file(file_path: str, state_filter: Optional[List[str]] = None
     if len(state_filter) == 0:
         return True
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    return state in state_filter
+
+
+def document_matches_state(data: Dict[str, Any], state_filter: Optional[List[str]] = None) -> bool:
+    """
+    Check if a parsed chart export matches the state filter.
+    
+    Args:
+        data: Parsed JSON document
+        state_filter: List of allowed states. If None, defaults to ["draft"].
+                     If empty list, every document matches.
         
-        speakcare_chart = data.get("speakcare_chart", {})
-        file_state = speakcare_chart.get("state", "")
+    Returns:
+        True if speakcare_chart.state is one of the allowed states, False otherwise
+    """
+    # Empty list means process all
+    if state_filter is not None and len(state_filter) == 0:
+        return True
+    
+    speakcare_chart = data.get("speakcare_chart", {})
+    file_state = speakcare_chart.get("state", "")
+    
+    return state_matches(file_state, state_filter)
+
+
+def should_process_file(file_path: str, state_filter: Optional[List[str]] = None) -> bool:
+    """
+    Check if a file should be processed based on state filter.
+    
+    Args:
+        file_path: Path to JSON file
+        state_filter: List of allowed states. If None, defaults to ["draft"].
+                     If empty list, processes all files.
         
-        return file_state in state_filter
+    Returns:
+        True if file should be processed, False otherwise
+    """
+    # Empty list means process all, without reading the file
+    if state_filter is not None and len(state_filter) == 0:
+        return True
+    
+    try:
+        # Most exports are rejected, so try to read just the state before parsing the whole file
+        found, state = scan_chart_state(file_path)
+        if found:
+            return state_matches(state, state_filter)
+        return document_matches_state(load_chart_file(file_path), state_filter)
     except Exception as e:
         logger.warning(f"Error checking state for {file_path}: {e}")
         return False
 
 
-def process_single_file(file_path: str, state_filter: Optional[List[str]] = None) -> Tuple[Dict[str, str], Dict[str, Any]]:
+def process_single_file(
+    file_path: str,
+    state_filter: Optional[List[str]] = None,
+    pcc_schema: Optional[PCCAssessmentSchema] = None
+) -> Tuple[Dict[str, str], Dict[str, Any]]:
     """
     Process a single JSON file and return comparison results.
     
@@ -375,6 +657,8 @@ def process_single_file(file_path: str, state_filter: Optional[List[str]] = None
         file_path: Path to JSON file
         state_filter: List of allowed states. If None, defaults to ["draft"].
                      If empty list, processes all files.
+        pcc_schema: Assessment schema to convert with. If None, uses the shared
+                    instance from get_pcc_schema().
         
     Returns:
         Tuple of (differences_dict, metadata_dict)
@@ -384,13 +668,49 @@ def process_single_file(file_path: str, state_filter: Optional[List[str]] = None
     Raises:
         ValueError: If file state doesn't match filter
     """
+    data = load_chart_file(file_path)
+    
     # Check state filter
-    if not should_process_file(file_path, state_filter):
-        file_state = extract_data_from_json(file_path).get("state", "unknown")
+    if not document_matches_state(data, state_filter):
+        file_state = data.get("speakcare_chart", {}).get("state", "")
         raise ValueError(f"File state '{file_state}' does not match filter {state_filter or ['draft']}")
     
+    return process_document(data, pcc_schema)
+
+
+def process_document(
+    data: Dict[str, Any],
+    pcc_schema: Optional[PCCAssessmentSchema] = None
+) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Compare a parsed chart export, without applying the state filter.
+    
+    Args:
+        data: Parsed JSON document
+        pcc_schema: Assessment schema to convert with. If None, uses the shared
+                    instance from get_pcc_schema().
+        
+    Returns:
+        Tuple of (differences_dict, metadata_dict), as in process_single_file
+    """
+    value_differences, metadata, _ = _compare_document(data, pcc_schema)
+    differences = {field_key: f"{pcc} != {speakcare}" for field_key, (pcc, speakcare) in value_differences.items()}
+    return differences, metadata
+
+
+def _compare_document(
+    data: Dict[str, Any],
+    pcc_schema: Optional[PCCAssessmentSchema] = None
+) -> Tuple[Dict[str, Tuple[str, str]], Dict[str, Any], Dict[str, str]]:
+    """
+    Compare a parsed chart export.
+    
+    Returns:
+        Tuple of (differences, metadata, outcomes): (pcc, speakcare) pairs as in compare_field_values,
+        metadata as in process_single_file plus template_id, and outcomes as in classify_field_values
+    """
     # Extract data
-    extracted = extract_data_from_json(file_path)
+    extracted = extract_data_from_document(data)
     
     # Convert SpeakCare to PCC-DB format
     speakcare_pcc_db = convert_speakcare_to_pcc_db(
@@ -398,7 +718,8 @@ def process_single_file(file_path: str, state_filter: Optional[List[str]] = None
         schema_id=extracted["schema_id"],
         assessment_id=extracted["assessment_id"],
         patient_id=extracted["patient_id"],
-        table_name=extracted["table_name"]
+        table_name=extracted["table_name"],
+        pcc_schema=pcc_schema
     )
     
     # Get the assessment object from the converted result
@@ -410,7 +731,8 @@ def process_single_file(file_path: str, state_filter: Optional[List[str]] = None
     pcc_fields = extract_all_fields(extracted["pcc_assessment"])
     
     # Compare
-    differences = compare_fields(speakcare_fields, pcc_fields)
+    differences = compare_field_values(speakcare_fields, pcc_fields)
+    outcomes = classify_field_values(speakcare_fields, pcc_fields)
     
     # Create metadata
     facility_id = extracted.get("facility_id", "")
@@ -421,7 +743,514 @@ def process_single_file(file_path: str, state_filter: Optional[List[str]] = None
         "assessment_key": f"{facility_id}:{extracted['patient_id']}:{extracted['assessment_id']}"
     }
     
-    return differences, metadata
+    return differences, dict(metadata, template_id=extracted["schema_id"]), outcomes
+
+
+def _compare_chart(
+    open_text: Callable[[], TextIO],
+    name: str,
+    state_filter: Optional[List[str]] = None,
+    pcc_schema: Optional[PCCAssessmentSchema] = None
+) -> Tuple[str, Any]:
+    """
+    Filter and compare one chart export for process_directory.
+    
+    Args:
+        open_text: Returns a new text stream of the export each time it is called
+        name: Name of the export, for log messages
+        state_filter: List of allowed states, as in process_single_file
+        pcc_schema: Assessment schema to convert with, as in process_single_file
+        
+    Returns:
+        ("skipped", None) if the export's state does not match the filter,
+        ("processed", (differences, metadata, outcomes)) on success, as in _compare_document, or
+        ("error", error_message) if the export could not be compared
+    """
+    # Each export is read and parsed once; the document goes through filter, extraction and comparison.
+    # Rejected exports whose state is near the start are not parsed at all.
+    try:
+        if state_filter is None or len(state_filter) > 0:
+            with open_text() as f:
+                found, state = _scan_chart_state_stream(f)
+            if found and not state_matches(state, state_filter):
+                return "skipped", None
+        with open_text() as f:
+            data = json.load(f)
+    except Exception as e:
+        if state_filter is not None and len(state_filter) == 0:
+            return "error", str(e)
+        logger.warning(f"Error checking state for {name}: {e}")
+        return "skipped", None
+    
+    if not document_matches_state(data, state_filter):
+        return "skipped", None
+    
+    try:
+        return "processed", _compare_document(data, pcc_schema)
+    except Exception as e:
+        return "error", str(e)
+
+
+def _compare_file(
+    file_path: str,
+    state_filter: Optional[List[str]] = None,
+    pcc_schema: Optional[PCCAssessmentSchema] = None
+) -> Tuple[str, Any]:
+    """Filter and compare one JSON file, as in _compare_chart."""
+    return _compare_chart(lambda: open(file_path, 'r', encoding='utf-8'), file_path, state_filter, pcc_schema)
+
+
+# Zip archives opened by this process, by path; each worker process opens its own
+_zip_files: Dict[str, zipfile.ZipFile] = {}
+
+
+def _compare_zip_member(
+    archive_path: str,
+    member_name: str,
+    state_filter: Optional[List[str]] = None,
+    pcc_schema: Optional[PCCAssessmentSchema] = None
+) -> Tuple[str, Any]:
+    """
+    Filter and compare one member of a zip archive, as in _compare_chart.
+    
+    The member is decompressed in this process, so worker processes decompress in parallel,
+    and the state pre-filter decompresses only the start of a rejected member.
+    """
+    zip_file = _zip_files.get(archive_path)
+    if zip_file is None:
+        zip_file = _zip_files[archive_path] = zipfile.ZipFile(archive_path)
+    return _compare_chart(
+        lambda: io.TextIOWrapper(zip_file.open(member_name), encoding='utf-8'),
+        f"{archive_path}:{member_name}",
+        state_filter,
+        pcc_schema
+    )
+
+
+def _compare_chart_bytes(
+    name: str,
+    data: bytes,
+    state_filter: Optional[List[str]] = None,
+    pcc_schema: Optional[PCCAssessmentSchema] = None
+) -> Tuple[str, Any]:
+    """Filter and compare one export already read into memory (a tar archive member), as in _compare_chart."""
+    return _compare_chart(lambda: io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'), name, state_filter, pcc_schema)
+
+
+def _iter_chart_inputs(input_path: Path) -> Iterator[Tuple[str, Tuple[int, int], Callable[[], Tuple[Callable, tuple]]]]:
+    """
+    Yield (name, signature, make_task) for each chart export of a directory or archive, in order.
+    
+    Directories yield their *.json files, and .zip and tar archives (optionally compressed) yield
+    their *.json members, streamed without extracting to disk. signature identifies the version of
+    the export: (size, mtime_ns) for files and tar members, (size, CRC-32) for zip members.
+    make_task() returns (function, args) such that function(*args, state_filter=..., pcc_schema=...)
+    compares the export. A tar archive is read as one stream, so make_task must be called before
+    the next input is requested; only then are the member's bytes read.
+    
+    Raises:
+        ValueError: If input_path is a file that is not a zip or tar archive
+    """
+    if input_path.is_dir() or not input_path.exists():
+        for json_file in input_path.glob("*.json"):
+            stat = json_file.stat()
+            yield json_file.name, (stat.st_size, stat.st_mtime_ns), lambda json_file=json_file: (_compare_file, (str(json_file),))
+    
+    elif zipfile.is_zipfile(input_path):
+        with zipfile.ZipFile(input_path) as zip_file:
+            members = zip_file.infolist()
+        for info in members:
+            if info.is_dir() or not info.filename.endswith(".json"):
+                continue
+            yield info.filename, (info.file_size, info.CRC), lambda info=info: (_compare_zip_member, (str(input_path), info.filename))
+    
+    elif tarfile.is_tarfile(input_path):
+        # Stream mode: members are decompressed once, in order, and never extracted to disk
+        with tarfile.open(input_path, 'r|*') as tar_file:
+            for member in tar_file:
+                if not member.isfile() or not member.name.endswith(".json"):
+                    continue
+                yield member.name, (member.size, int(member.mtime) * 10 ** 9), \
+                    lambda member=member: (_compare_chart_bytes, (member.name, tar_file.extractfile(member).read()))
+    
+    else:
+        raise ValueError(f"Not a directory, zip or tar archive: {input_path}")
+
+
+def _init_compare_worker() -> None:
+    """Build the shared assessment schema once per process_directory worker process."""
+    get_pcc_schema()
+
+
+def _iter_compare_results(
+    inputs: Iterator[Tuple[str, Tuple[int, int], Callable[[], Tuple[Callable, tuple]]]],
+    state_filter: Optional[List[str]],
+    pcc_schema: Optional[PCCAssessmentSchema],
+    workers: int,
+    lookup: Optional[Callable[[str, Tuple[int, int]], Optional[Tuple[str, Any]]]] = None
+) -> Iterator[Tuple[str, Tuple[int, int], Tuple[str, Any], bool]]:
+    """
+    Yield (name, signature, result, cached) for each input of _iter_chart_inputs, in input order.
+    
+    result is the (status, value) of the input's task, computed in-process or by a process pool,
+    or the result returned by lookup(name, signature) when that is not None (cached is then True).
+    The pool is fed at most a few tasks per worker ahead of the results consumed, so tar members
+    held in memory stay bounded.
+    """
+    if workers > 1:
+        max_pending = workers * 4
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_compare_worker) as executor:
+            pending = deque()
+            for name, signature, make_task in inputs:
+                cached = lookup(name, signature) if lookup else None
+                if cached is None:
+                    function, args = make_task()
+                    pending.append((name, signature, executor.submit(function, *args, state_filter=state_filter)))
+                else:
+                    pending.append((name, signature, cached))
+                while len(pending) > max_pending:
+                    yield _resolve_pending(pending.popleft())
+            while pending:
+                yield _resolve_pending(pending.popleft())
+    else:
+        if pcc_schema is None:
+            pcc_schema = get_pcc_schema()
+        for name, signature, make_task in inputs:
+            cached = lookup(name, signature) if lookup else None
+            if cached is not None:
+                yield name, signature, cached, True
+                continue
+            function, args = make_task()
+            yield name, signature, function(*args, state_filter=state_filter, pcc_schema=pcc_schema), False
+
+
+def _resolve_pending(item: Tuple[str, Tuple[int, int], Any]) -> Tuple[str, Tuple[int, int], Tuple[str, Any], bool]:
+    name, signature, result = item
+    if isinstance(result, Future):
+        return name, signature, result.result(), False
+    return name, signature, result, True
+
+
+class _WideCsvAggregator:
+    """Collect the differences of every assessment in memory and write the wide CSV."""
+    
+    def __init__(self, output_csv: str):
+        self.output_csv = output_csv
+        self.all_differences: Dict[str, Dict[str, Tuple[str, str]]] = {}  # {assessment_key: {field_key: (pcc, speakcare)}}
+        self.all_fields = set()  # All unique field keys across all files
+    
+    def add(self, assessment_key: str, differences: Dict[str, Tuple[str, str]]) -> None:
+        # A later file with the same assessment key replaces the earlier one
+        self.all_differences[assessment_key] = differences
+        self.all_fields.update(differences.keys())
+    
+    def close(self) -> int:
+        with open(self.output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+            
+            # Header: fields, then one column per assessment_key
+            header_assessments = list(sorted(self.all_differences.keys()))
+            header = ["fields"] + header_assessments
+            writer.writerow(header)
+            
+            # Sort fields for consistent output
+            sorted_fields = sorted(self.all_fields)
+            
+            # Data rows
+            for field_key in sorted_fields:
+                row = [field_key]
+                
+                # Add difference for each assessment (empty if no difference for this field)
+                for assessment_key in header_assessments:
+                    difference = self.all_differences[assessment_key].get(field_key)
+                    row.append(f"{difference[0]} != {difference[1]}" if difference else "")
+                
+                writer.writerow(row)
+        
+        return len(header_assessments)
+
+
+class _SpillingWideCsvAggregator:
+    """
+    Write the same wide CSV as _WideCsvAggregator with at most max_rows differences in memory.
+    
+    Differences are buffered as (field_key, assessment_key, file_number, pcc, speakcare) records;
+    full buffers are sorted and spilled to temporary run files, which are merged at the end to
+    write one CSV row per field. Besides the buffer, memory holds one entry per assessment.
+    """
+    
+    def __init__(self, output_csv: str, max_rows: int):
+        self.output_csv = output_csv
+        self.max_rows = max(1, max_rows)
+        self.buffer: List[Tuple[str, str, int, str, str]] = []
+        self.run_paths: List[str] = []
+        self.spill_dir = tempfile.TemporaryDirectory(prefix="compare_assessments_")
+        self.file_number = 0
+        self.final_file_number: Dict[str, int] = {}  # assessment_key -> number of the file that counts
+    
+    def add(self, assessment_key: str, differences: Dict[str, Tuple[str, str]]) -> None:
+        # A later file with the same assessment key replaces the earlier one
+        self.final_file_number[assessment_key] = self.file_number
+        for field_key, (pcc, speakcare) in differences.items():
+            self.buffer.append((field_key, assessment_key, self.file_number, pcc, speakcare))
+            if len(self.buffer) >= self.max_rows:
+                self._spill()
+        self.file_number += 1
+    
+    def _spill(self) -> None:
+        self.buffer.sort()
+        run_path = os.path.join(self.spill_dir.name, f"run_{len(self.run_paths)}.csv")
+        with open(run_path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(self.buffer)
+        self.run_paths.append(run_path)
+        self.buffer = []
+    
+    @staticmethod
+    def _read_run(run_path: str) -> Iterator[Tuple[str, str, int, str, str]]:
+        with open(run_path, 'r', newline='', encoding='utf-8') as f:
+            for field_key, assessment_key, file_number, pcc, speakcare in csv.reader(f):
+                yield field_key, assessment_key, int(file_number), pcc, speakcare
+    
+    def close(self) -> int:
+        try:
+            self.buffer.sort()
+            records = heapq.merge(self.buffer, *(self._read_run(run_path) for run_path in self.run_paths))
+            
+            header_assessments = sorted(self.final_file_number)
+            columns = {assessment_key: index for index, assessment_key in enumerate(header_assessments)}
+            
+            with open(self.output_csv, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(["fields"] + header_assessments)
+                
+                for field_key, field_records in groupby(records, key=itemgetter(0)):
+                    row = [""] * len(header_assessments)
+                    for _, assessment_key, file_number, pcc, speakcare in field_records:
+                        if file_number == self.final_file_number[assessment_key]:
+                            row[columns[assessment_key]] = f"{pcc} != {speakcare}"
+                    writer.writerow([field_key] + row)
+        finally:
+            self.spill_dir.cleanup()
+        
+        return len(header_assessments)
+
+
+class _LongCsvWriter:
+    """Stream differences as long-format rows (assessment_key, field_key, pcc, speakcare) as each file finishes."""
+    
+    HEADER = ["assessment_key", "field_key", "pcc", "speakcare"]
+    
+    def __init__(self, output_csv: str):
+        self.file = open(output_csv, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file, quoting=csv.QUOTE_MINIMAL)
+        self.writer.writerow(self.HEADER)
+        self.assessment_keys = set()
+    
+    def add(self, assessment_key: str, differences: Dict[str, Tuple[str, str]]) -> None:
+        self.assessment_keys.add(assessment_key)
+        for field_key in sorted(differences):
+            pcc, speakcare = differences[field_key]
+            self.writer.writerow([assessment_key, field_key, pcc, speakcare])
+        self.file.flush()
+    
+    def close(self) -> int:
+        self.file.close()
+        return len(self.assessment_keys)
+
+
+class _FieldStatsAggregator:
+    """Count field outcomes per (template_id, field_key) as each file is compared, for agreement statistics."""
+    
+    OUTCOME_INDEX = {outcome: index for index, outcome in enumerate(FIELD_OUTCOMES)}
+    
+    def __init__(self):
+        self.counts: Dict[Tuple[Any, str], List[int]] = {}  # (template_id, field_key) -> count per outcome
+    
+    def add(self, template_id: Any, outcomes: Dict[str, str]) -> None:
+        for field_key, outcome in outcomes.items():
+            counts = self.counts.get((template_id, field_key))
+            if counts is None:
+                counts = self.counts[(template_id, field_key)] = [0] * len(FIELD_OUTCOMES)
+            counts[self.OUTCOME_INDEX[outcome]] += 1
+    
+    @staticmethod
+    def _agreement(counts: List[int]) -> str:
+        # Share of matched values among fields where either side has a value
+        answered = sum(counts) - counts[FIELD_OUTCOMES.index("both_empty")]
+        return f"{counts[0] / answered:.4f}" if answered else ""
+    
+    @staticmethod
+    def _question_types(pcc_schema: PCCAssessmentSchema, template_id: Any) -> Dict[str, str]:
+        try:
+            return {meta["key"]: meta["original_schema_type"] for meta in pcc_schema.get_field_metadata(template_id)}
+        except Exception as e:
+            logger.warning(f"No field metadata for template {template_id}: {e}")
+            return {}
+    
+    def write(
+        self,
+        field_stats_csv: Optional[str],
+        type_stats_csv: Optional[str],
+        pcc_schema: PCCAssessmentSchema
+    ) -> None:
+        """Write the per-field and per-question-type summary tables (either path may be None)."""
+        question_types = {}
+        type_counts: Dict[str, List[int]] = {}
+        type_fields: Dict[str, int] = {}
+        field_rows = []
+        
+        for (template_id, field_key) in sorted(self.counts, key=lambda key: (str(key[0]), key[1])):
+            if template_id not in question_types:
+                question_types[template_id] = self._question_types(pcc_schema, template_id)
+            question_type = question_types[template_id].get(field_key.split(":", 1)[0], "unknown")
+            counts = self.counts[(template_id, field_key)]
+            field_rows.append([template_id, field_key, question_type, sum(counts)] + counts + [self._agreement(counts)])
+            
+            totals = type_counts.setdefault(question_type, [0] * len(FIELD_OUTCOMES))
+            for index, count in enumerate(counts):
+                totals[index] += count
+            type_fields[question_type] = type_fields.get(question_type, 0) + 1
+        
+        if field_stats_csv:
+            with open(field_stats_csv, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(["template_id", "field_key", "question_type", "charts"] + list(FIELD_OUTCOMES) + ["agreement"])
+                writer.writerows(field_rows)
+            logger.info(f"Generated field statistics CSV: {field_stats_csv}")
+        
+        if type_stats_csv:
+            with open(type_stats_csv, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(["question_type", "fields"] + list(FIELD_OUTCOMES) + ["agreement"])
+                for question_type in sorted(type_counts):
+                    counts = type_counts[question_type]
+                    writer.writerow([question_type, type_fields[question_type]] + counts + [self._agreement(counts)])
+            logger.info(f"Generated question type statistics CSV: {type_stats_csv}")
+
+
+# Bump when a change to the comparison logic makes cached manifest results stale
+_MANIFEST_LOGIC_VERSION = 1
+
+
+def _comparison_fingerprint(pcc_schema: PCCAssessmentSchema) -> str:
+    """
+    Fingerprint what a cached comparison result depends on besides the chart file itself.
+    
+    Covers the installed package version, _MANIFEST_LOGIC_VERSION and the field metadata (questions,
+    types and response options) of every registered template.
+    
+    Args:
+        pcc_schema: The assessment schema the comparison converts with
+        
+    Returns:
+        Hex digest stored in each manifest entry
+    """
+    try:
+        package_version = importlib.metadata.version("spkc-ehr-schema")
+    except importlib.metadata.PackageNotFoundError:
+        package_version = "unknown"
+    digest = hashlib.sha256(f"{package_version}:{_MANIFEST_LOGIC_VERSION}".encode("utf-8"))
+    for template_id in pcc_schema.list_assessments():
+        field_metadata = pcc_schema.get_field_metadata(template_id)
+        digest.update(json.dumps([template_id, field_metadata], default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _ComparisonManifest:
+    """
+    JSON Lines cache of per-file comparison results for incremental and resumable directory runs.
+    
+    Each line records one file by name, signature (see _iter_chart_inputs), state filter and
+    comparison fingerprint (see _comparison_fingerprint), with its status and, for processed files,
+    the metadata, (pcc, speakcare) differences and field outcomes. Lines are appended and flushed
+    as files finish, so an interrupted run keeps everything done so far; later lines for the same
+    file win, and a truncated last line is ignored. A cached result is reused only while the
+    file's signature, the state filter and the fingerprint are unchanged. With rebuild, existing
+    entries are discarded.
+    """
+    
+    def __init__(self, manifest_path: str, state_filter: Optional[List[str]], fingerprint: str, rebuild: bool = False):
+        self.manifest_path = manifest_path
+        self.state_filter = sorted(set(["draft"] if state_filter is None else state_filter))
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        
+        if os.path.exists(manifest_path) and not rebuild:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry["path"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning(f"Ignoring unreadable manifest line in {manifest_path}")
+            stale = sum(1 for entry in self.entries.values() if entry.get("fingerprint") != fingerprint)
+            if stale:
+                logger.warning(
+                    f"{stale} manifest entries in {manifest_path} were written with different templates "
+                    f"or comparison code; their files are compared again"
+                )
+        
+        self.file = open(manifest_path, 'w' if rebuild else 'a', encoding='utf-8')
+        if self.file.tell() > 0:
+            # Start on a fresh line after a run interrupted mid-write
+            with open(manifest_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self.file.write("\n")
+    
+    def _is_current(self, entry: Dict[str, Any], signature: Tuple[int, int]) -> bool:
+        return (
+            tuple(entry.get("signature") or ()) == signature
+            and entry.get("state_filter") == self.state_filter
+            and entry.get("fingerprint") == self.fingerprint
+        )
+    
+    def lookup(self, name: str, signature: Tuple[int, int]) -> Optional[Tuple[str, Any]]:
+        """Return the cached _compare_chart result of an unchanged file, or None."""
+        entry = self.entries.get(name)
+        if entry is None or not self._is_current(entry, signature):
+            return None
+        if entry["status"] == "skipped":
+            return "skipped", None
+        differences = {field_key: tuple(pair) for field_key, pair in entry["differences"].items()}
+        return "processed", (differences, entry["metadata"], entry["outcomes"])
+    
+    def record(self, name: str, signature: Tuple[int, int], status: str, result: Any) -> None:
+        """Append the _compare_chart result of a file; errors are not cached, so they are retried."""
+        if status == "error":
+            return
+        entry = {
+            "path": name,
+            "signature": list(signature),
+            "state_filter": self.state_filter,
+            "fingerprint": self.fingerprint,
+            "status": status,
+        }
+        if status == "processed":
+            differences, metadata, outcomes = result
+            entry["metadata"] = metadata
+            entry["differences"] = differences
+            entry["outcomes"] = outcomes
+        self.entries[entry["path"]] = entry
+        self.file.write(json.dumps(entry) + "\n")
+        self.file.flush()
+    
+    def close(self, current_files: Optional[Dict[str, Tuple[int, int]]] = None) -> None:
+        """
+        Close the manifest. After a complete run, pass the signatures of the directory's files to
+        rewrite it with only their current entries, dropping superseded lines and removed files.
+        """
+        self.file.close()
+        if current_files is None:
+            return
+        
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for name, signature in current_files.items():
+                entry = self.entries.get(name)
+                if entry is not None and self._is_current(entry, signature):
+                    f.write(json.dumps(entry) + "\n")
+        os.replace(temp_path, self.manifest_path)
 
 
 def generate_comparison_csv_single(
@@ -452,81 +1281,144 @@ def generate_comparison_csv_single(
             writer.writerow([field_key, diff_str])
 
 
-def process_directory(directory_path: str, output_csv: str, state_filter: Optional[List[str]] = None):
+def process_directory(
+    directory_path: str,
+    output_csv: str,
+    state_filter: Optional[List[str]] = None,
+    pcc_schema: Optional[PCCAssessmentSchema] = None,
+    workers: int = 1,
+    output_format: str = "wide",
+    max_rows_in_memory: Optional[int] = None,
+    manifest_path: Optional[str] = None,
+    field_stats_csv: Optional[str] = None,
+    type_stats_csv: Optional[str] = None,
+    rebuild_manifest: bool = False
+):
     """
     Process all JSON files in a directory and generate aggregated CSV.
     
     Args:
-        directory_path: Path to directory containing JSON files
+        directory_path: Path to directory containing JSON files, or to a .zip or tar
+                        (.tar, .tar.gz, .tgz, .tar.bz2, .tar.xz) archive whose *.json members
+                        are streamed into the comparison without extracting them to disk.
+                        With workers, zip members are decompressed in the workers; a tar
+                        archive is one stream, decompressed in this process.
         output_csv: Path to output CSV file
         state_filter: List of allowed states. If None, defaults to ["draft"].
                      If empty list, processes all files.
+        pcc_schema: Assessment schema to convert with, built once and reused for
+                    every file. If None, uses the shared instance from get_pcc_schema().
+        workers: Number of worker processes (default: 1, compare in this process).
+                 Each worker builds its own shared schema once, so pcc_schema is not
+                 used by workers. Results are merged in file order, so the CSV is the
+                 same as a serial run.
+        output_format: "wide" (default) writes one row per field and one column per
+                       assessment. "long" streams one row per difference with columns
+                       assessment_key, field_key, pcc, speakcare as each file finishes;
+                       f"{pcc} != {speakcare}" is the wide-format cell.
+        max_rows_in_memory: Wide format only. If set, hold at most this many differences in
+                            memory and spill sorted runs to a temporary directory, merging
+                            them into the same wide CSV at the end. If None, all differences
+                            are held in memory.
+        manifest_path: If set, a JSON Lines manifest of per-file results (see
+                       _ComparisonManifest). Files whose size, mtime (CRC-32 for zip members)
+                       and state filter match their manifest entry are not read again; only new or changed files are
+                       compared, and the CSV is rebuilt from cached and new results. Results are
+                       appended as files finish, so an interrupted run resumes where it stopped.
+                       Entries written with different templates or comparison code (see
+                       _comparison_fingerprint) are recomputed.
+        field_stats_csv: If set, write agreement statistics per (template_id, field_key): the
+                         number of charts with each of FIELD_OUTCOMES (see classify_field_values),
+                         the field's question type, and agreement = matched / charts where
+                         either side has a value. Counters are updated as each file finishes.
+        type_stats_csv: If set, write the same statistics summed per question type.
+        rebuild_manifest: If True, discard the manifest's entries and compare every file.
+        
+    Raises:
+        ValueError: If output_format is not "wide" or "long", or directory_path is a file
+                    that is not a zip or tar archive
     """
-    directory = Path(directory_path)
-    json_files = list(directory.glob("*.json"))
+    if output_format not in ("wide", "long"):
+        raise ValueError(f"Unknown output_format: {output_format!r} (expected 'wide' or 'long')")
     
-    if not json_files:
+    inputs = _iter_chart_inputs(Path(directory_path))
+    first_input = next(inputs, None)
+    
+    if first_input is None:
         logger.warning(f"No JSON files found in {directory_path}")
         return
     
+    if output_format == "long":
+        aggregator = _LongCsvWriter(output_csv)
+    elif max_rows_in_memory is not None:
+        aggregator = _SpillingWideCsvAggregator(output_csv, max_rows_in_memory)
+    else:
+        aggregator = _WideCsvAggregator(output_csv)
+    
     # Process all files and collect differences
-    all_differences: Dict[str, Dict[str, str]] = {}  # {assessment_key: {field_key: diff_str, ...}}
-    all_fields = set()  # All unique field keys across all files
     skipped_count = 0
     files_processed = 0
     total_differences = 0
+    cached_count = 0
     
-    for json_file in json_files:
-        # Check state filter first
-        if not should_process_file(str(json_file), state_filter):
-            skipped_count += 1
-            continue
-        
-        try:
-            differences, metadata = process_single_file(str(json_file), state_filter)
-            assessment_key = metadata["assessment_key"]
+    field_stats = _FieldStatsAggregator() if field_stats_csv or type_stats_csv else None
+    manifest = None
+    if manifest_path:
+        fingerprint = _comparison_fingerprint(pcc_schema or get_pcc_schema())
+        manifest = _ComparisonManifest(manifest_path, state_filter, fingerprint, rebuild=rebuild_manifest)
+    signatures = {}
+    
+    results = _iter_compare_results(
+        chain([first_input], inputs),
+        state_filter,
+        pcc_schema,
+        workers,
+        lookup=manifest.lookup if manifest is not None else None
+    )
+    
+    # Results are in file order, so the merge is the same for any number of workers
+    completed = False
+    try:
+        for name, signature, (status, result), cached in results:
+            signatures[name] = signature
+            if cached:
+                cached_count += 1
+            elif manifest is not None:
+                manifest.record(name, signature, status, result)
             
-            # Store differences for this assessment
-            all_differences[assessment_key] = differences
+            if status == "skipped":
+                skipped_count += 1
+                continue
+            if status == "error":
+                logger.error(f"Error processing {name}: {result}")
+                continue
             
-            # Collect all field keys
-            all_fields.update(differences.keys())
+            differences, metadata, outcomes = result
+            aggregator.add(metadata["assessment_key"], differences)
+            if field_stats is not None:
+                field_stats.add(metadata["template_id"], outcomes)
             
             files_processed += 1
             num_diffs = len(differences)
             total_differences += num_diffs
-            logger.info(f"Processed {json_file.name}: {num_diffs} differences")
-        except Exception as e:
-            logger.error(f"Error processing {json_file.name}: {e}")
-            continue
+            logger.info(f"Processed {name}: {num_diffs} differences")
+        completed = True
+    finally:
+        # Generate CSV with all assessments
+        num_assessments = aggregator.close()
+        if manifest is not None:
+            manifest.close(signatures if completed else None)
+            logger.info(f"Reused {cached_count} cached result(s) from {manifest_path}")
+        for zip_file in _zip_files.values():
+            zip_file.close()
+        _zip_files.clear()
+    
+    if field_stats is not None:
+        field_stats.write(field_stats_csv, type_stats_csv, pcc_schema or get_pcc_schema())
     
     if skipped_count > 0:
         logger.info(f"Skipped {skipped_count} file(s) due to state filter")
     
-    # Generate CSV with all assessments
-    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-        
-        # Header: fields, then one column per assessment_key
-        header_assessments = list(sorted(all_differences.keys()))
-        header = ["fields"] + header_assessments
-        writer.writerow(header)
-        
-        # Sort fields for consistent output
-        sorted_fields = sorted(all_fields)
-        
-        # Data rows
-        for field_key in sorted_fields:
-            row = [field_key]
-            
-            # Add difference for each assessment (empty if no difference for this field)
-            for assessment_key in header_assessments:
-                diff_str = all_differences[assessment_key].get(field_key, "")
-                row.append(diff_str)
-            
-            writer.writerow(row)
-    
-    num_assessments = len(header_assessments)
     logger.info(f"Generated comparison CSV: {output_csv}")
     logger.info(f"Summary: processed {files_processed} file(s), "
                 f"wrote {num_assessments} assessment(s), "
@@ -548,7 +1440,8 @@ def main():
     parser.add_argument(
         "--directory",
         type=str,
-        help="Path to directory containing JSON files to process"
+        help="Path to directory containing JSON files to process, or to a .zip or tar "
+             "(.tar, .tar.gz, ...) archive of them, read without extracting to disk"
     )
     
     parser.add_argument(
@@ -558,6 +1451,63 @@ def main():
         help="Path to output CSV file"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for --directory mode (default: 1). "
+             "The CSV is the same for any number of workers."
+    )
+    
+    parser.add_argument(
+        "--output-format",
+        choices=["wide", "long"],
+        default="wide",
+        help="wide (default): one row per field, one column per assessment. "
+             "long: one row per difference (assessment_key, field_key, pcc, speakcare), "
+             "streamed as each file finishes"
+    )
+    
+    parser.add_argument(
+        "--max-rows-in-memory",
+        type=int,
+        default=None,
+        help="Wide format only: hold at most this many differences in memory, spilling "
+             "sorted runs to a temporary directory and merging them at the end"
+    )
+    
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        nargs="?",
+        const="",
+        default=None,
+        help="Directory mode: cache per-file results in a JSON Lines manifest so later runs "
+             "compare only new or changed files and interrupted runs resume. "
+             "Default path with no value: <output>.manifest.jsonl"
+    )
+    
+    parser.add_argument(
+        "--rebuild-manifest",
+        action="store_true",
+        help="Directory mode: discard the --manifest entries and compare every file again"
+    )
+    
+    parser.add_argument(
+        "--field-stats",
+        type=str,
+        default=None,
+        help="Directory mode: write per-field agreement statistics (matched, mismatched, "
+             "speakcare_only, pcc_only, both_empty) to this CSV"
+    )
+    
+    parser.add_argument(
+        "--type-stats",
+        type=str,
+        default=None,
+        help="Directory mode: write agreement statistics per question type to this CSV"
+    )
+    
     parser.add_argument(
         "--verbose",
         "-v",
@@ -613,7 +1563,18 @@ def main():
         
     elif args.directory:
         # Directory mode
-        process_directory(args.directory, args.output, state_filter)
+        process_directory(
+            args.directory,
+            args.output,
+            state_filter,
+            workers=args.workers,
+            output_format=args.output_format,
+            max_rows_in_memory=args.max_rows_in_memory,
+            manifest_path=(args.manifest or f"{args.output}.manifest.jsonl") if args.manifest is not None else None,
+            field_stats_csv=args.field_stats,
+            type_stats_csv=args.type_stats,
+            rebuild_manifest=args.rebuild_manifest
+        )
         
     else:
         parser.error("Either --file or --directory must be specified")
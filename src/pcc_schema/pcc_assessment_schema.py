@@ -10,10 +10,13 @@ API for working with PCC assessments.
 import logging
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
-from typing import Dict, Any, List, Optional, Tuple, Union
+from itertools import islice
+from typing import Dict, Any, IO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from schema_engine.schema_engine import SchemaEngine
+from schema_engine.sanitize_text import sanitize_for_json
 from schema_engine.csv_to_dict import (
     read_key_value_csv_path,
     read_key_value_csv_s3,
@@ -276,6 +279,152 @@ def get_all_section_states(formatted_json: Dict[str, Any]) -> List[str]:
     return states
 
 
+def get_html_type(original_type, field_schema=None):
+    """Determine HTML input type based on PCC field type and characteristics."""
+    match original_type:
+        case "rad" | "radh":
+            return "radio_buttons"
+        case "hck":
+            return "horizontal_single_check"
+        case "cmb":
+            return "combobox"
+        case "chk":
+            return "checkbox_single"
+        case "mcs" | "mcsh":
+            return "checkbox_multi"
+        case "txt" | "diag":
+            length = field_schema.get("length", 0) if field_schema else 0
+            return "textarea_singleline" if length <= 50 else "textarea_multiline"
+        case "dte" | "dttm":
+            return "text"
+        case "num" | "numde":
+            return "textarea_singleline"
+        case "gbdy_entry":
+            return "combobox"
+        case "gbdy_description":
+            return "textarea_singleline"
+        case _:
+            return "text"  # Default fallback
+
+
+def build_response_option_maps(field_schema: Dict[str, Any], last_wins: bool = False) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+    """
+    Build responseText -> responseValue lookup maps for a PCC question.
+
+    Args:
+        field_schema: The PCC question definition (with optional 'responseOptions')
+        last_wins: When several options share the same text, map it to the last of them
+                   instead of the first
+
+    Returns:
+        Tuple of (raw_text_to_value, sanitized_text_to_value). By default the first option
+        wins, as in the linear scans of the radio, combo, hck and multi-select formatters; the
+        object-array (gbdy) formatters build their lookup with last_wins=True.
+    """
+    raw_text_to_value: Dict[Any, Any] = {}
+    sanitized_text_to_value: Dict[Any, Any] = {}
+    options = field_schema.get("responseOptions", []) or []
+    for option in reversed(options) if last_wins else options:
+        response_value = option.get("responseValue")
+        raw_text_to_value.setdefault(option.get("responseText"), response_value)
+        sanitized_text_to_value.setdefault(sanitize_for_json(option.get("responseText", "")), response_value)
+    return raw_text_to_value, sanitized_text_to_value
+
+
+def build_response_value_map(field_schema: Dict[str, Any]) -> Dict[Any, str]:
+    """
+    Build a responseValue -> sanitized responseText lookup map for a PCC question.
+
+    Args:
+        field_schema: The PCC question definition (with optional 'responseOptions')
+
+    Returns:
+        Dict of responseValue -> sanitized responseText (the enum text the model uses). The first
+        option wins when several options share the same value, matching a linear scan.
+    """
+    value_to_text: Dict[Any, str] = {}
+    for option in field_schema.get("responseOptions", []) or []:
+        response_value = option.get("responseValue")
+        if response_value is not None:
+            value_to_text.setdefault(response_value, sanitize_for_json(option.get("responseText", "")))
+    return value_to_text
+
+
+def pcc_field_metadata_enricher(engine: SchemaEngine, field_meta: Dict[str, Any]) -> None:
+    """
+    Precompute per-question lookups used by the PCC reverse formatters (in place).
+
+    Adds:
+    - response_text_to_value: raw responseText -> responseValue
+    - sanitized_response_text_to_value: sanitized responseText -> responseValue
+      (model output carries sanitized enum texts)
+    - html_type: UI input type for the question
+
+    For object-array (gbdy) questions the last option wins when options share a text.
+    """
+    field_schema = field_meta.get("field_schema", {})
+    raw_text_to_value, sanitized_text_to_value = build_response_option_maps(
+        field_schema, last_wins=field_meta.get("original_schema_type") == "gbdy")
+    field_meta["response_text_to_value"] = raw_text_to_value
+    field_meta["sanitized_response_text_to_value"] = sanitized_text_to_value
+    try:
+        field_meta["html_type"] = get_html_type(field_meta.get("original_schema_type"), field_schema)
+    except Exception:
+        # Leave it to the formatter so malformed questions surface at format time as before
+        field_meta.pop("html_type", None)
+
+
+def _field_option_map(field_meta: Dict[str, Any], sanitized: bool) -> Dict[Any, Any]:
+    """Return the precomputed option map for a field, building it on first use if missing."""
+    map_key = "sanitized_response_text_to_value" if sanitized else "response_text_to_value"
+    text_to_value = field_meta.get(map_key)
+    if text_to_value is None:
+        raw_text_to_value, sanitized_text_to_value = build_response_option_maps(
+            field_meta.get("field_schema", {}), last_wins=field_meta.get("original_schema_type") == "gbdy")
+        field_meta["response_text_to_value"] = raw_text_to_value
+        field_meta["sanitized_response_text_to_value"] = sanitized_text_to_value
+        text_to_value = field_meta[map_key]
+    return text_to_value
+
+
+def _lookup_option_value(text_to_value: Dict[Any, Any], text: Any, default: Any) -> Any:
+    """Look up a responseValue by text; unhashable model values never match an option."""
+    try:
+        return text_to_value.get(text, default)
+    except TypeError:
+        return default
+
+
+def _field_html_type(field_meta: Dict[str, Any]) -> str:
+    """Return the precomputed html_type for a field, computing it if missing."""
+    html_type = field_meta.get("html_type")
+    if html_type is None:
+        html_type = get_html_type(field_meta["original_schema_type"], field_meta.get("field_schema", {}))
+    return html_type
+
+
+# from_pcc_db checkbox values: format_to_pcc_db writes "1" for chk questions and str(bool) for others
+_PCC_DB_CHECKBOX_VALUES = {"1": True, "True": True, "False": False}
+
+
+# Per-process state of format_to_pcc_db_batch worker processes
+_pcc_db_worker: Dict[str, Any] = {}
+
+
+def _init_pcc_db_worker(schema_class: type, table_id: int, external_schema: Dict[str, Any], template_name: str) -> None:
+    """Build the assessment schema once per format_to_pcc_db_batch worker process."""
+    pcc_schema = schema_class()
+    pcc_schema.register_assessment(table_id, external_schema)
+    _pcc_db_worker.update(schema=pcc_schema, table_id=table_id, template_name=template_name)
+
+
+def _format_pcc_db_line(record: Tuple[Dict[str, Any], int, int, Optional[Dict[str, Any]]]) -> str:
+    """Format one (model_response, assessment_id, patient_id, metadata) record as a JSON line in a worker."""
+    pcc_schema = _pcc_db_worker["schema"]
+    output = next(pcc_schema.iter_format_to_pcc_db(_pcc_db_worker["table_id"], [record], _pcc_db_worker["template_name"]))
+    return pcc_schema._pcc_db_json_line(output)
+
+
 class PCCAssessmentSchema:
     """
     PointClickCare Assessment Schema wrapper around SchemaConverterEngine.
@@ -336,9 +485,16 @@ class PCCAssessmentSchema:
     def __init__(self):
         """Initialize the PCC Assessment Schema engine."""
         self.engine = SchemaEngine(PCC_META_SCHEMA, use_id_in_property_name=True)
+        # format_to_pcc_db layouts: table_id -> (field index the layout was built from, layout)
+        self._pcc_db_layouts: Dict[int, Tuple[List[Dict[str, Any]], List[Tuple[str, List[Tuple[str, str, List[Dict[str, Any]]]]]]]] = {}
+        # from_pcc_db indexes: table_id -> (field index the index was built from, (defaults, questions))
+        self._pcc_db_inverse_indexes: Dict[int, Tuple[List[Dict[str, Any]], Tuple[List[Tuple[Tuple[str, ...], Dict[str, Any]]], Dict[str, Any]]]] = {}
         
         # Register the options extractor
         self.engine.register_options_extractor("extract_response_options", extract_response_options)
+
+        # Precompute option lookup maps and html_type per question at registration
+        self.engine.register_field_metadata_enricher(pcc_field_metadata_enricher)
         
         # Register object_array builder for gbdy fields
         def pcc_object_array_schema_builder(engine: SchemaEngine, target_type: str, enum_values: List[str], nullable: bool, property_def: Dict[str, Any], prop: Dict[str, Any]):
@@ -384,43 +540,32 @@ class PCCAssessmentSchema:
             if model_value is None:
                 return {field_meta["key"]: {"type": "radio", "value": None}}
             
-            field_schema = field_meta["field_schema"]
-            response_options = field_schema.get("responseOptions", [])
-            
-            for option in response_options:
-                if option.get("responseText") == model_value:
-                    return {field_meta["key"]: {"type": "radio", "value": option.get("responseValue")}}
-            
-            return {field_meta["key"]: {"type": "radio", "value": model_value}}
+            text_to_value = _field_option_map(field_meta, sanitized=False)
+            value = _lookup_option_value(text_to_value, model_value, model_value)
+            return {field_meta["key"]: {"type": "radio", "value": value}}
         
         def pcc_combo_formatter(engine, field_meta, model_value, table_name):
             """Format combo boxes - extract responseValue from responseOptions."""
             if model_value is None:
                 return {field_meta["key"]: {"type": "combo", "value": None}}
             
-            field_schema = field_meta["field_schema"]
-            response_options = field_schema.get("responseOptions", [])
-            
-            for option in response_options:
-                if option.get("responseText") == model_value:
-                    return {field_meta["key"]: {"type": "combo", "value": option.get("responseValue")}}
-            
-            return {field_meta["key"]: {"type": "combo", "value": model_value}}
+            text_to_value = _field_option_map(field_meta, sanitized=False)
+            value = _lookup_option_value(text_to_value, model_value, model_value)
+            return {field_meta["key"]: {"type": "combo", "value": value}}
         
         def pcc_multi_select_formatter(engine, field_meta, model_value, table_name):
             """Format multi select - return list of responseValues."""
             if not model_value or not isinstance(model_value, list):
                 return {field_meta["key"]: {"type": "multi", "value": None}}
             
-            field_schema = field_meta["field_schema"]
-            response_options = field_schema.get("responseOptions", [])
+            text_to_value = _field_option_map(field_meta, sanitized=False)
+            _not_found = object()
             results = []
             
             for selected_text in model_value:
-                for option in response_options:
-                    if option.get("responseText") == selected_text:
-                        results.append(option.get("responseValue"))
-                        break
+                response_value = _lookup_option_value(text_to_value, selected_text, _not_found)
+                if response_value is not _not_found:
+                    results.append(response_value)
             
             return {field_meta["key"]: {"type": "multi", "value": results if results else None}}
         
@@ -430,11 +575,9 @@ class PCCAssessmentSchema:
                 return {}
             
             field_key = field_meta.get("key", "unknown")
-            field_schema = field_meta.get("field_schema", {})
-            response_options = field_schema.get("responseOptions", [])
             
-            # Build a map from responseText to responseValue
-            text_to_value = {opt["responseText"]: opt["responseValue"] for opt in response_options}
+            # Precomputed map from responseText to responseValue
+            text_to_value = _field_option_map(field_meta, sanitized=False)
             
             # Convert array format to PCC aN/bN format
             table_rows = []
@@ -443,7 +586,7 @@ class PCCAssessmentSchema:
                 description_text = item.get("description", "")
                 
                 # Look up the responseValue for this entry
-                entry_value = text_to_value.get(entry_text, "")
+                entry_value = _lookup_option_value(text_to_value, entry_text, "")
                 
                 row = {
                     f"a{idx}_{field_key}": entry_value,
@@ -487,14 +630,9 @@ class PCCAssessmentSchema:
             if model_value is None:
                 return {field_meta["key"]: {"type": "hck", "value": None}}
             
-            field_schema = field_meta["field_schema"]
-            response_options = field_schema.get("responseOptions", [])
-            
-            for option in response_options:
-                if option.get("responseText") == model_value:
-                    return {field_meta["key"]: {"type": "hck", "value": option.get("responseValue")}}
-            
-            return {field_meta["key"]: {"type": "hck", "value": model_value}}
+            text_to_value = _field_option_map(field_meta, sanitized=False)
+            value = _lookup_option_value(text_to_value, model_value, model_value)
+            return {field_meta["key"]: {"type": "hck", "value": value}}
         
         # Register builders and formatters by original schema type
         self.engine.register_field_schema_builder("chk", pcc_chk_schema_builder)
@@ -517,49 +655,20 @@ class PCCAssessmentSchema:
         self.engine.register_reverse_formatter("default", "hck", pcc_hck_formatter)
         
         # PCC-UI formatters with unpacking capabilities
-        def get_html_type(original_type, field_schema=None):
-            """Determine HTML input type based on PCC field type and characteristics."""
-            match original_type:
-                case "rad" | "radh":
-                    return "radio_buttons"
-                case "hck":
-                    return "horizontal_single_check"
-                case "cmb":
-                    return "combobox"
-                case "chk":
-                    return "checkbox_single"
-                case "mcs" | "mcsh":
-                    return "checkbox_multi"
-                case "txt" | "diag":
-                    length = field_schema.get("length", 0) if field_schema else 0
-                    return "textarea_singleline" if length <= 50 else "textarea_multiline"
-                case "dte" | "dttm":
-                    return "text"
-                case "num" | "numde":
-                    return "textarea_singleline"
-                case "gbdy_entry":
-                    return "combobox"
-                case "gbdy_description":
-                    return "textarea_singleline"
-                case _:
-                    return "text"  # Default fallback
-        
         def pcc_ui_basic_formatter(engine, field_meta, model_value, table_name):
             """Format basic fields with original type."""
             original_type = field_meta["original_schema_type"]
-            field_schema = field_meta.get("field_schema", {})
             
             return [{
                 "key": field_meta["key"],
                 "type": original_type,
-                "html_type": get_html_type(original_type, field_schema),
+                "html_type": _field_html_type(field_meta),
                 "value": model_value
             }]
         
         def pcc_ui_number_formatter(engine, field_meta, model_value, table_name):
             """Format number fields - convert to string for UI."""
             original_type = field_meta["original_schema_type"]
-            field_schema = field_meta.get("field_schema", {})
             
             # Convert numeric values to strings
             if model_value is not None:
@@ -568,44 +677,36 @@ class PCCAssessmentSchema:
             return [{
                 "key": field_meta["key"],
                 "type": original_type,
-                "html_type": get_html_type(original_type, field_schema),
+                "html_type": _field_html_type(field_meta),
                 "value": model_value
             }]
         
         def pcc_ui_single_select_formatter(engine, field_meta, model_value, table_name):
             """Format single select - extract responseValue."""
             original_type = field_meta["original_schema_type"]
-            field_schema = field_meta.get("field_schema", {})
             
             if model_value is None:
                 return [{
                     "key": field_meta["key"],
                     "type": original_type,
-                    "html_type": get_html_type(original_type, field_schema),
+                    "html_type": _field_html_type(field_meta),
                     "value": None
                 }]
             
-            response_options = field_schema.get("responseOptions", [])
-            
-            response_value = model_value
-            for option in response_options:
-                # Sanitize the responseText to match the sanitized model_value
-                sanitized_response_text = engine._sanitize_for_json(option.get("responseText", ""))
-                if sanitized_response_text == model_value:
-                    response_value = option.get("responseValue")
-                    break
+            # Option texts are pre-sanitized to match the sanitized model_value
+            text_to_value = _field_option_map(field_meta, sanitized=True)
+            response_value = _lookup_option_value(text_to_value, model_value, model_value)
             
             return [{
                 "key": field_meta["key"],
                 "type": original_type,
-                "html_type": get_html_type(original_type, field_schema),
+                "html_type": _field_html_type(field_meta),
                 "value": response_value
             }]
         
         def pcc_ui_multi_select_formatter(engine, field_meta, model_value, table_name):
             """Format multi-select - UNPACK into separate fields."""
             original_type = field_meta["original_schema_type"]
-            field_schema = field_meta.get("field_schema", {})
             base_key = field_meta["key"]
             
             # Handle None/null values - return field with None value
@@ -613,7 +714,7 @@ class PCCAssessmentSchema:
                 return [{
                     "key": base_key,
                     "type": original_type,
-                    "html_type": get_html_type(original_type, field_schema),
+                    "html_type": _field_html_type(field_meta),
                     "value": None
                 }]
             
@@ -622,27 +723,23 @@ class PCCAssessmentSchema:
                 return [{
                     "key": base_key,
                     "type": original_type,
-                    "html_type": get_html_type(original_type, field_schema),
+                    "html_type": _field_html_type(field_meta),
                     "value": None
                 }]
             
             # Process list values (existing unpacking logic)
-            response_options = field_schema.get("responseOptions", [])
+            # Option texts are pre-sanitized to match the sanitized model_value
+            text_to_value = _field_option_map(field_meta, sanitized=True)
+            html_type = _field_html_type(field_meta)
             
             results = []
             for i, selected_text in enumerate(model_value):
-                response_value = selected_text
-                for option in response_options:
-                    # Sanitize the responseText to match the sanitized model_value
-                    sanitized_response_text = engine._sanitize_for_json(option.get("responseText", ""))
-                    if sanitized_response_text == selected_text:
-                        response_value = option.get("responseValue")
-                        break
+                response_value = _lookup_option_value(text_to_value, selected_text, selected_text)
                 
                 results.append({
                     "key": base_key,
                     "type": original_type,
-                    "html_type": get_html_type(original_type, field_schema),
+                    "html_type": html_type,
                     "value": response_value,
                     "_original_field_key": base_key,
                     # Provide unique storage key so engine can store without collision
@@ -663,12 +760,11 @@ class PCCAssessmentSchema:
               with \"null\" string values for both entry and description.
             """
             field_schema = field_meta["field_schema"]
-            response_options = field_schema.get("responseOptions", [])
             base_key = field_meta["key"]
             original_type = field_meta["original_schema_type"]
             
-            # Create mapping using sanitized responseText
-            text_to_value = {engine._sanitize_for_json(opt["responseText"]): opt["responseValue"] for opt in response_options}
+            # Precomputed mapping using sanitized responseText
+            text_to_value = _field_option_map(field_meta, sanitized=True)
             
             results = []
             items: List[Dict[str, Any]] = model_value if isinstance(model_value, list) else []
@@ -679,7 +775,7 @@ class PCCAssessmentSchema:
                     item = items[idx]
                     entry_text = item.get("entry", "")
                     description_text = item.get("description", "")
-                    entry_value = text_to_value.get(entry_text, "null")
+                    entry_value = _lookup_option_value(text_to_value, entry_text, "null")
                     if entry_value is None or entry_value == "":
                         entry_value = "null"
                     if description_text is None or description_text == "":
@@ -713,7 +809,6 @@ class PCCAssessmentSchema:
         def pcc_ui_checkbox_formatter(engine, field_meta, model_value, table_name):
             """Format checkbox - convert true/false to "1"/"null"."""
             original_type = field_meta["original_schema_type"]
-            field_schema = field_meta.get("field_schema", {})
             
             # Convert boolean to PCC format: true -> "1", false -> "null"
             if model_value is True:
@@ -726,7 +821,7 @@ class PCCAssessmentSchema:
             return [{
                 "key": field_meta["key"],
                 "type": original_type,
-                "html_type": get_html_type(original_type, field_schema),
+                "html_type": _field_html_type(field_meta),
                 "value": value
             }]
         
@@ -754,6 +849,52 @@ class PCCAssessmentSchema:
         self.engine.register_reverse_formatter("pcc-ui", "gbdy", pcc_ui_object_array_formatter)
         self.engine.register_reverse_formatter("pcc-ui", "inst", pcc_ui_instructions_formatter)
         
+        # Column variants of the common pcc-ui formatters for iter_reverse_map_batch:
+        # field metadata (type, html_type, option map) is resolved once per column
+        def pcc_ui_basic_batch_formatter(engine, field_meta, model_values, table_name):
+            """Format a column of basic fields with original type."""
+            key = field_meta["key"]
+            original_type = field_meta["original_schema_type"]
+            html_type = _field_html_type(field_meta)
+            return [[{"key": key, "type": original_type, "html_type": html_type, "value": model_value}]
+                    for model_value in model_values]
+        
+        def pcc_ui_number_batch_formatter(engine, field_meta, model_values, table_name):
+            """Format a column of number fields - convert to string for UI."""
+            return pcc_ui_basic_batch_formatter(
+                engine, field_meta,
+                [str(model_value) if model_value is not None else None for model_value in model_values],
+                table_name
+            )
+        
+        def pcc_ui_single_select_batch_formatter(engine, field_meta, model_values, table_name):
+            """Format a column of single selects - extract responseValue."""
+            # Option texts are pre-sanitized to match the sanitized model_value
+            text_to_value = _field_option_map(field_meta, sanitized=True)
+            return pcc_ui_basic_batch_formatter(
+                engine, field_meta,
+                [_lookup_option_value(text_to_value, model_value, model_value) if model_value is not None else None
+                 for model_value in model_values],
+                table_name
+            )
+        
+        def pcc_ui_checkbox_batch_formatter(engine, field_meta, model_values, table_name):
+            """Format a column of checkboxes - convert true/false to "1"/"null"."""
+            return pcc_ui_basic_batch_formatter(
+                engine, field_meta,
+                ["1" if model_value is True else "null" if model_value is False else model_value
+                 for model_value in model_values],
+                table_name
+            )
+        
+        for original_type in ("txt", "dte", "dttm", "diag"):
+            self.engine.register_batch_reverse_formatter("pcc-ui", original_type, pcc_ui_basic_batch_formatter)
+        for original_type in ("num", "numde"):
+            self.engine.register_batch_reverse_formatter("pcc-ui", original_type, pcc_ui_number_batch_formatter)
+        for original_type in ("hck", "rad", "radh", "cmb"):
+            self.engine.register_batch_reverse_formatter("pcc-ui", original_type, pcc_ui_single_select_batch_formatter)
+        self.engine.register_batch_reverse_formatter("pcc-ui", "chk", pcc_ui_checkbox_batch_formatter)
+        
         # Load and register the 7 assessment templates
         self._load_and_register_templates()
     
@@ -880,19 +1021,55 @@ class PCCAssessmentSchema:
             KeyError: If assessment_identifier not found
         """
         return self.engine.get_container_count(assessment_identifier, "sections")
-    
-    def validate(self, assessment_identifier: Union[int, str], data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+
+    def get_section_keys(self, assessment_identifier: Union[int, str]) -> List[str]:
+        """
+        Get the section keys of a registered assessment, in schema order.
+
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+
+        Returns:
+            Section property keys of the JSON schema (e.g. "Cust_1.Medications")
+        """
+        sections = self.engine.get_json_schema(assessment_identifier)["properties"].get("sections", {})
+        return list(sections.get("properties", {}))
+
+    def get_section_schema(self, assessment_identifier: Union[int, str], section_key: str) -> Dict[str, Any]:
+        """
+        Get the standalone JSON schema of one section of a registered assessment.
+
+        A response to it has the shape of a response to the full schema, limited to this section.
+        Validate it with validate(..., container_path=["sections", section_key]).
+
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            section_key: A key from get_section_keys
+
+        Returns:
+            Cached, read-only JSON schema dictionary
+
+        Raises:
+            ValueError: If the assessment has no such section
+        """
+        return self.engine.get_container_schema(assessment_identifier, ["sections", section_key])
+
+    def validate(self, assessment_identifier: Union[int, str], data: Dict[str, Any],
+                 container_path: Optional[Sequence[str]] = None) -> Tuple[bool, List[str]]:
         """
         Validate data against a registered assessment schema.
         
         Args:
             assessment_identifier: Either an integer assessment ID or string assessment name
             data: Data to validate
+            container_path: If given, validate a response to the schema of this container only
+                            (e.g. ["sections", "Cust_1.Medications"]), as returned by
+                            get_section_schema
             
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        return self.engine.validate(assessment_identifier, data)
+        return self.engine.validate(assessment_identifier, data, container_path=container_path)
     
     def get_field_metadata(self, assessment_identifier: Union[int, str]) -> List[Dict[str, Any]]:
         """
@@ -942,18 +1119,6 @@ class PCCAssessmentSchema:
         Returns:
             Dictionary with reverse mapped data in the specified format
         """
-        # Default to grouping by sections for PCC assessments
-        if group_by_containers is None:
-            group_by_containers = ["sections"]
-        
-        # Apply PCC-specific default field name overrides if not provided
-        if metadata_field_overrides is None:
-            metadata_field_overrides = {
-                "schema_name": "assessment_title",
-                "schema_id": "assessment_std_id",
-                "schema_type": {"name": "doc_type", "value": "pcc_assessment"}
-            }
-        
         # Resolve assessment identifier to table name
         table_id = self.engine.resolve_table_id(assessment_identifier)
         table_data = self.engine._SchemaEngine__tables[table_id]
@@ -962,21 +1127,216 @@ class PCCAssessmentSchema:
         result = self.engine.reverse_map(
             table_name, 
             model_response, 
+            **self._pcc_reverse_map_options(
+                formatter_name=formatter_name,
+                group_by_containers=group_by_containers,
+                properties_key=properties_key,
+                pack_properties_as=pack_properties_as,
+                pack_containers_as=pack_containers_as,
+                metadata_field_overrides=metadata_field_overrides
+            )
+        )
+        
+        self._add_section_states(result)
+        return result
+
+    def reverse_map_delta(self, assessment_identifier: Union[int, str], model_response: Dict[str, Any],
+                          previous_response: Optional[Dict[str, Any]] = None,
+                          previous_state: Optional[Dict[str, Any]] = None,
+                          **reverse_map_options: Any) -> Tuple[Dict[str, Any], List[str], Dict[str, Any]]:
+        """
+        Reverse map a model response, reformatting only the fields changed since an earlier response.
+        
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            model_response: The new model response
+            previous_response: Optional earlier model response to diff against
+            previous_state: Optional state returned by an earlier reverse_map_delta call
+            **reverse_map_options: reverse_map keyword arguments (formatter_name, properties_key, ...),
+                with the same PCC defaults as reverse_map
+            
+        Returns:
+            Tuple of (result, changed_keys, state); see SchemaEngine.reverse_map_delta
+        """
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        table_name = self.engine._SchemaEngine__tables[table_id]["table_name"]
+        
+        result, changed_keys, state = self.engine.reverse_map_delta(
+            table_name,
+            model_response,
+            previous_response=previous_response,
+            previous_state=previous_state,
+            **self._pcc_reverse_map_options(**reverse_map_options)
+        )
+        self._add_section_states(result)
+        return result, changed_keys, state
+
+    def iter_reverse_map(self, assessment_identifier: Union[int, str], model_response: Dict[str, Any],
+                         formatter_name: str = "pcc-ui", properties_key: str = "fields",
+                         pack_properties_as: str = "array",
+                         pack_containers_as: str = "object") -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Reverse map a model response one section at a time.
+        
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            model_response: The model response data to reverse map
+            formatter_name: Name of the formatter set to use (default: "pcc-ui")
+            properties_key: Name for the innermost properties container (default: "fields")
+            pack_properties_as: Format for properties - "object" or "array" (default: "array")
+            pack_containers_as: Format for each section - "array" or "object" (default: "object")
+            
+        Yields:
+            (section_code, section_data) pairs in template order; section_data matches the
+            corresponding entry of reverse_map output, including the "state" field.
+        """
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        table_name = self.engine._SchemaEngine__tables[table_id]["table_name"]
+        
+        for section_code, section_data in self.engine.iter_reverse_map(
+            table_name,
+            model_response,
             formatter_name=formatter_name,
-            group_by_containers=group_by_containers,
             properties_key=properties_key,
             pack_properties_as=pack_properties_as,
-            pack_containers_as=pack_containers_as,
-            metadata_field_overrides=metadata_field_overrides
+            pack_containers_as=pack_containers_as
+        ):
+            # reverse_map only adds state when sections are packed as an object
+            if pack_containers_as == "object" and "state" not in section_data:
+                section_data["state"] = "draft"
+            yield section_code, section_data
+
+    def iter_reverse_map_batch(self, assessment_identifier: Union[int, str],
+                               model_responses: Iterable[Dict[str, Any]], batch_size: int = 64,
+                               **reverse_map_options: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Reverse map many model responses of one assessment, formatting one field column at a time.
+        
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            model_responses: Iterable of model responses to reverse map
+            batch_size: Number of responses formatted together (default: 64)
+            **reverse_map_options: reverse_map keyword arguments (formatter_name, properties_key, ...),
+                with the same PCC defaults as reverse_map
+            
+        Yields:
+            For each response, in input order, the result reverse_map would return for it
+        """
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        table_name = self.engine._SchemaEngine__tables[table_id]["table_name"]
+        
+        for result in self.engine.iter_reverse_map_batch(
+            table_name,
+            model_responses,
+            batch_size=batch_size,
+            **self._pcc_reverse_map_options(**reverse_map_options)
+        ):
+            self._add_section_states(result)
+            yield result
+
+    def ingest(self, assessment_identifier: Union[int, str], raw_response: Union[str, bytes],
+               **reverse_map_options: Any) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
+        """
+        Parse, validate and reverse map a raw model response in one pass.
+        
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            raw_response: The model response as JSON text (str or bytes)
+            **reverse_map_options: reverse_map keyword arguments (formatter_name, properties_key, ...),
+                with the same PCC defaults as reverse_map
+            
+        Returns:
+            Tuple of (is_valid, errors, formatted); see SchemaEngine.ingest
+        """
+        is_valid, errors, formatted = self.engine.ingest(
+            assessment_identifier,
+            raw_response,
+            **self._pcc_reverse_map_options(**reverse_map_options)
         )
+        if formatted is not None:
+            self._add_section_states(formatted)
+        return is_valid, errors, formatted
+
+    def reverse_map_many(self, assessment_identifier: Union[int, str], model_response: Dict[str, Any],
+                         targets: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Produce several outputs (reverse_map formatter sets and/or PCC DB format) from one model response.
         
-        # Post-process to add state field to each section
+        Every field value is extracted from the model response once and shared by all targets.
+        
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            model_response: The model response data to convert
+            targets: Dict mapping output name to a target spec:
+                - {"target": "pcc_db", "assessment_id": ..., "patient_id": ..., "template_name": ...,
+                   "additional_metadata": ...} for format_to_pcc_db output
+                - otherwise the reverse_map keyword arguments (formatter_name, group_by_containers, ...),
+                  with the same PCC defaults as reverse_map
+                Example: {
+                    "ui": {"formatter_name": "pcc-ui"},
+                    "audit": {"formatter_name": "default", "pack_containers_as": "array"},
+                    "db": {"target": "pcc_db", "assessment_id": 1001, "patient_id": 42}
+                }
+            
+        Returns:
+            Dict mapping each output name to the same result reverse_map / format_to_pcc_db would return
+        """
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        table_name = self.engine._SchemaEngine__tables[table_id]["table_name"]
+        model_values = self.engine.extract_model_values(table_id, model_response)
+        
+        reverse_map_targets = {}
+        pcc_db_targets = {}
+        for output_name, target in targets.items():
+            target = dict(target)
+            if target.pop("target", "reverse_map") == "pcc_db":
+                pcc_db_targets[output_name] = target
+            else:
+                reverse_map_targets[output_name] = self._pcc_reverse_map_options(**target)
+        
+        outputs = self.engine.reverse_map_many(table_name, model_response, reverse_map_targets, model_values=model_values)
+        for result in outputs.values():
+            self._add_section_states(result)
+        for output_name, target in pcc_db_targets.items():
+            outputs[output_name] = self._build_pcc_db_output(assessment_identifier, model_values, **target)
+        
+        # Keep the caller's target order
+        return {output_name: outputs[output_name] for output_name in targets}
+
+    @staticmethod
+    def _pcc_reverse_map_options(formatter_name: str = "pcc-ui", group_by_containers: Optional[List[str]] = None,
+                                 properties_key: str = "fields", pack_properties_as: str = "array",
+                                 pack_containers_as: str = "object",
+                                 metadata_field_overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Fill in PCC defaults for engine reverse_map keyword arguments."""
+        # Default to grouping by sections for PCC assessments
+        if group_by_containers is None:
+            group_by_containers = ["sections"]
+        
+        # Apply PCC-specific default field name overrides if not provided
+        if metadata_field_overrides is None:
+            metadata_field_overrides = {
+                "schema_name": "assessment_title",
+                "schema_id": "assessment_std_id",
+                "schema_type": {"name": "doc_type", "value": "pcc_assessment"}
+            }
+        
+        return {
+            "formatter_name": formatter_name,
+            "group_by_containers": group_by_containers,
+            "properties_key": properties_key,
+            "pack_properties_as": pack_properties_as,
+            "pack_containers_as": pack_containers_as,
+            "metadata_field_overrides": metadata_field_overrides,
+        }
+
+    @staticmethod
+    def _add_section_states(result: Dict[str, Any]) -> None:
+        """Post-process reverse_map output to add state field to each section."""
         if "sections" in result and isinstance(result["sections"], dict):
             for section_key, section_data in result["sections"].items():
                 if isinstance(section_data, dict) and "state" not in section_data:
                     section_data["state"] = "draft"
-        
-        return result
 
     def list_assessments_info(self) -> List[Dict[str, Any]]:
         """
@@ -1149,6 +1509,27 @@ class PCCAssessmentSchema:
         
         return None
     
+    def _map_model_text_to_value(self, field_meta: Dict[str, Any], response_text: str,
+                                 response_options: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Map a model's option text to its response_value.
+        
+        The raw responseText is tried first; model output carries sanitized enum texts, so the
+        sanitized text of the question's options is tried next.
+        
+        Args:
+            field_meta: Field metadata dictionary
+            response_text: The option text from the model response
+            response_options: List of response option dictionaries
+            
+        Returns:
+            The corresponding response_value, or None if not found
+        """
+        response_value = self._map_response_text_to_value(response_text, response_options)
+        if response_value is None and response_text:
+            response_value = _lookup_option_value(_field_option_map(field_meta, sanitized=True), response_text, None)
+        return response_value
+    
     def _parse_multi_select_value(self, value: Any) -> List[str]:
         """
         Parse multi-select value which can be:
@@ -1214,7 +1595,7 @@ class PCCAssessmentSchema:
             else:
                 response_text = str(model_value)
                 # Try to map response_text to response_value
-                response_value = self._map_response_text_to_value(response_text, response_options)
+                response_value = self._map_model_text_to_value(field_meta, response_text, response_options)
                 
                 if response_value is None:
                     # If mapping fails, assume model_value is already a response_value
@@ -1236,7 +1617,7 @@ class PCCAssessmentSchema:
                 for item in model_value:
                     if item:
                         response_text = str(item)
-                        response_value = self._map_response_text_to_value(response_text, response_options)
+                        response_value = self._map_model_text_to_value(field_meta, response_text, response_options)
                         if response_value:
                             response_values.append(response_value)
                         else:
@@ -1256,7 +1637,7 @@ class PCCAssessmentSchema:
                 mapped_values = []
                 for rv in response_values:
                     # Try to map as response_text first
-                    mapped = self._map_response_text_to_value(rv, response_options)
+                    mapped = self._map_model_text_to_value(field_meta, rv, response_options)
                     if mapped:
                         mapped_values.append(mapped)
                     else:
@@ -1359,115 +1740,247 @@ class PCCAssessmentSchema:
         """
         # Get template ID
         table_id = self.engine.resolve_table_id(assessment_identifier)
+        model_values = self.engine.extract_model_values(table_id, model_response)
         
-        # Get template name if not provided
-        if template_name is None:
-            template_name = self._get_template_name(assessment_identifier)
+        return self._build_pcc_db_output(assessment_identifier, model_values, assessment_id, patient_id, template_name, additional_metadata)
+
+    def iter_format_to_pcc_db(
+        self,
+        assessment_identifier: Union[int, str],
+        records: Iterable[Tuple[Dict[str, Any], int, int, Optional[Dict[str, Any]]]],
+        template_name: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Convert many model outputs of one assessment to PCC database format.
         
-        # Get field metadata
-        field_metadata = self.get_field_metadata(assessment_identifier)
+        The table, template name and section/group layout are resolved once for the whole batch.
         
-        # Get external schema for group titles
-        table_data = self.engine._SchemaEngine__tables[table_id]
-        external_schema = table_data["external_schema"]
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            records: Iterable of (model_response, assessment_id, patient_id, additional_metadata) tuples;
+                additional_metadata may be None. See format_to_pcc_db.
+            template_name: Optional template name, as in format_to_pcc_db
+            
+        Yields:
+            The format_to_pcc_db output of each record, in input order
+        """
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        if template_name is None:
+            template_name = self._get_template_name(table_id)
         
-        # Organize fields by section and group
-        sections_dict: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
-        # Structure: {section_code: {group_number: [field_meta, ...]}}
+        for model_response, assessment_id, patient_id, additional_metadata in records:
+            model_values = self.engine.extract_model_values(table_id, model_response)
+            yield self._build_pcc_db_output(
+                table_id, model_values, assessment_id, patient_id, template_name, additional_metadata
+            )
+
+    def format_to_pcc_db_batch(
+        self,
+        assessment_identifier: Union[int, str],
+        records: Iterable[Tuple[Dict[str, Any], int, int, Optional[Dict[str, Any]]]],
+        sink: Union[str, os.PathLike, IO[str]],
+        template_name: Optional[str] = None,
+        workers: int = 1,
+        chunksize: int = 32
+    ) -> int:
+        """
+        Convert many model outputs of one assessment to PCC database format, written as JSON Lines.
         
-        for field_meta in field_metadata:
-            if field_meta.get("is_virtual_container_child"):
-                continue
-            
-            level_keys = field_meta.get("level_keys", [])
-            if len(level_keys) < 2:
-                continue
-            
-            # Extract section_code from level_keys
-            # level_keys format: ["sections", "Cust.MHCS Nursing Daily Skilled Note", "assessmentQuestionGroups", "A", "questions"]
-            section_code = None
-            group_number = None
-            
-            # Find section code (first container after "sections")
-            if len(level_keys) > 1 and level_keys[0] == "sections":
-                section_key = level_keys[1]
-                # Extract section code (before the dot)
-                if "." in section_key:
-                    section_code = section_key.split(".")[0]
-                else:
-                    section_code = section_key
-            
-            # Find group number (after "assessmentQuestionGroups")
-            # level_keys format should have "assessmentQuestionGroups" at index 2, group number at index 3
-            if len(level_keys) > 3 and level_keys[2] == "assessmentQuestionGroups":
-                group_number = level_keys[3]
-            
-            if not section_code or not group_number:
-                continue
+        Records are read lazily and each output is written as soon as it is ready, so only a bounded
+        window of records is held in memory.
+        
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            records: Iterable of (model_response, assessment_id, patient_id, additional_metadata) tuples;
+                additional_metadata may be None. See format_to_pcc_db.
+            sink: Output file path, or a text file-like object with write()
+            template_name: Optional template name, as in format_to_pcc_db
+            workers: Number of worker processes (default: 1, convert in this process). Each worker
+                builds its own assessment schema once, so custom formatters or validators registered
+                on this instance are not seen by workers.
+            chunksize: Records sent to a worker at a time (default: 32)
             
-            # Initialize section if needed
-            if section_code not in sections_dict:
-                sections_dict[section_code] = {}
+        Returns:
+            Number of records written
+        """
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        if template_name is None:
+            template_name = self._get_template_name(table_id)
+        
+        if isinstance(sink, (str, os.PathLike)):
+            with open(sink, "w", encoding="utf-8") as f:
+                return self.format_to_pcc_db_batch(table_id, records, f, template_name, workers, chunksize)
+        
+        if workers > 1:
+            lines = self._iter_pcc_db_lines_parallel(table_id, records, template_name, workers, chunksize)
+        else:
+            lines = (self._pcc_db_json_line(output) for output in self.iter_format_to_pcc_db(table_id, records, template_name))
+        
+        count = 0
+        for line in lines:
+            sink.write(line)
+            count += 1
+        return count
+
+    def _iter_pcc_db_lines_parallel(
+        self,
+        table_id: int,
+        records: Iterable[Tuple[Dict[str, Any], int, int, Optional[Dict[str, Any]]]],
+        template_name: str,
+        workers: int,
+        chunksize: int
+    ) -> Iterator[str]:
+        """Yield format_to_pcc_db JSON lines computed by a process pool, in input order."""
+        external_schema = self.engine._SchemaEngine__tables[table_id]["external_schema"]
+        records = iter(records)
+        window = workers * chunksize
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_pcc_db_worker,
+            initargs=(type(self), table_id, external_schema, template_name)
+        ) as executor:
+            # Keep one window in flight while the previous one is written
+            pending = executor.map(_format_pcc_db_line, list(islice(records, window)), chunksize=chunksize)
+            while pending is not None:
+                batch = list(islice(records, window))
+                following = executor.map(_format_pcc_db_line, batch, chunksize=chunksize) if batch else None
+                yield from pending
+                pending = following
+
+    @staticmethod
+    def _pcc_db_json_line(output: Dict[str, Any]) -> str:
+        """Serialize one format_to_pcc_db output as a JSON Lines record."""
+        return json.dumps(output, ensure_ascii=False) + "\n"
+
+    def from_pcc_db(self, assessment_identifier: Union[int, str], pcc_db_obj: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a PCC database assessment back to the model response shape (inverse of format_to_pcc_db).
+        
+        Responses are placed by question_key; response values of select questions are mapped back to
+        their (sanitized) option texts, checkboxes to booleans and numbers to int/float. Questions
+        without a response are null, instructions keep their constant text and table (gbdy) questions,
+        which format_to_pcc_db does not write, are empty lists. Unknown question keys are ignored.
+        
+        Args:
+            assessment_identifier: Either an integer assessment ID or string assessment name
+            pcc_db_obj: A format_to_pcc_db output holding exactly one assessment, or the
+                assessment object itself (with "sections")
             
-            # Initialize group if needed
-            if group_number not in sections_dict[section_code]:
-                sections_dict[section_code][group_number] = []
+        Returns:
+            Model response dictionary ({"table_name": ..., "sections": {...}})
             
-            # Add field to group
-            sections_dict[section_code][group_number].append(field_meta)
+        Raises:
+            ValueError: If pcc_db_obj does not hold exactly one assessment
+        """
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        defaults, questions = self._get_pcc_db_inverse_index(table_id)
+        
+        assessment = pcc_db_obj
+        if "assessments" in pcc_db_obj:
+            items = (pcc_db_obj.get("assessments") or {}).get("items") or {}
+            if len(items) != 1:
+                raise ValueError(f"Expected exactly one assessment in PCC DB object, got {len(items)}")
+            assessment = next(iter(items.values()))
+        
+        # Every property starts at its default, so the result has all required properties
+        model_response: Dict[str, Any] = {}
+        questions_by_level: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        for level_keys, level_defaults in defaults:
+            current = model_response
+            for key in level_keys:
+                current = current.setdefault(key, {})
+            for property_key, default in level_defaults.items():
+                current[property_key] = deepcopy(default) if isinstance(default, (list, dict)) else default
+            questions_by_level[level_keys] = current
+        
+        for section in assessment.get("sections") or []:
+            for group in section.get("assessment_question_groups") or []:
+                for assessment_response in group.get("assessment_responses") or []:
+                    question = questions.get(assessment_response.get("question_key"))
+                    if question is None:
+                        continue
+                    level_keys, property_key, target_type, value_to_text = question
+                    questions_by_level[level_keys][property_key] = self._pcc_db_response_to_model_value(
+                        assessment_response.get("responses") or [], target_type, value_to_text
+                    )
+        
+        return model_response
+
+    def _pcc_db_response_to_model_value(self, responses: List[Dict[str, Any]], target_type: str,
+                                        value_to_text: Dict[Any, str]) -> Any:
+        """Convert the PCC DB responses of one question to its model value."""
+        response_values = [r["response_value"] for r in responses if r.get("response_value") not in (None, "")]
+        if not response_values:
+            return None
+        
+        if target_type == "multiple_select":
+            # Multi-select values are comma-joined response_values
+            texts = []
+            for response_value in response_values:
+                for value in self._parse_multi_select_value(response_value):
+                    texts.append(value_to_text.get(value, value))
+            return texts or None
+        
+        response_value = response_values[0]
+        if target_type == "single_select":
+            # Unknown values were written as-is by format_to_pcc_db
+            text = _lookup_option_value(value_to_text, response_value, None)
+            if text is None:
+                text = next((r["response_text"] for r in responses if r.get("response_text")), response_value)
+            return text
+        if target_type == "chk":
+            # chk questions are written as "1"; other checkbox types as the str() of the boolean
+            return _PCC_DB_CHECKBOX_VALUES.get(str(response_value))
+        if target_type in ("positive_integer", "positive_number"):
+            try:
+                return int(response_value)
+            except (TypeError, ValueError):
+                pass
+            if target_type == "positive_number":
+                try:
+                    return float(response_value)
+                except (TypeError, ValueError):
+                    pass
+            # Leave unparseable numbers as text so validation reports them
+            return response_value
+        return response_value
+
+    def _build_pcc_db_output(
+        self,
+        assessment_identifier: Union[int, str],
+        model_values: Dict[str, Any],
+        assessment_id: int,
+        patient_id: int,
+        template_name: Optional[str] = None,
+        additional_metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the format_to_pcc_db output from model values already extracted by field key."""
+        table_id = self.engine.resolve_table_id(assessment_identifier)
+        
+        # Get template name if not provided
+        if template_name is None:
+            template_name = self._get_template_name(assessment_identifier)
         
-        # Build sections array
+        # Build sections array from the precomputed section -> group -> fields layout
         sections_array = []
         
-        for section_code, groups_dict in sections_dict.items():
-            # Get group titles from external schema
+        for section_code, groups in self._get_pcc_db_layout(table_id):
             assessment_question_groups = []
             
-            for group_number in sorted(groups_dict.keys()):
-                field_metas = groups_dict[group_number]
-                
-                # Get group title from first field's field_schema or external schema
-                group_title = ""
-                if field_metas:
-                    first_field_schema = field_metas[0].get("field_schema", {})
-                    # Try to get from external schema
-                    for section in external_schema.get("sections", []):
-                        if section.get("sectionCode") == section_code:
-                            for group in section.get("assessmentQuestionGroups", []):
-                                if group.get("groupNumber") == group_number:
-                                    group_title = group.get("groupTitle", "")
-                                    break
-                            if group_title:
-                                break
-                
+            for group_number, group_title, field_metas in groups:
                 # Build assessment responses for this group
                 assessment_responses = []
                 
                 for field_meta in field_metas:
-                    # Extract model value
-                    model_value = self._extract_model_value(model_response, field_meta)
+                    # Look up extracted model value
+                    model_value = model_values.get(field_meta.get("key"))
                     
                     # Get field schema info
                     field_schema = field_meta.get("field_schema", {})
                     original_type = field_meta.get("original_schema_type", "")
                     response_options = field_schema.get("responseOptions", [])
                     
-                    # Handle table fields (gbdy) separately
-                    if original_type == "gbdy":
-                        # Table fields (gbdy) are represented as arrays of {entry, description}
-                        # In model output, they come as an array
-                        # In PCC DB format, we need to create separate response entries for each row
-                        # For now, we'll create a single response with the table data
-                        # Note: Table fields may need special handling depending on PCC requirements
-                        if model_value and isinstance(model_value, list) and len(model_value) > 0:
-                            # Create a response for the table field
-                            # The table data is typically stored differently in PCC DB
-                            # For now, we'll skip table fields as they may require special formatting
-                            continue
-                        else:
-                            # Empty table field
-                            continue
-                    
                     # Build assessment response
                     assessment_response = self._build_assessment_response(
                         field_meta, model_value, response_options, original_type
@@ -1527,4 +2040,143 @@ class PCCAssessmentSchema:
                 }
             }
         }
-    
+
+    def _get_pcc_db_layout(self, table_id: int) -> List[Tuple[str, List[Tuple[str, str, List[Dict[str, Any]]]]]]:
+        """Return the format_to_pcc_db layout of a table, rebuilding it when the table was re-registered."""
+        field_index = self.get_field_metadata(table_id)
+        cached = self._pcc_db_layouts.get(table_id)
+        if cached is not None and cached[0] is field_index:
+            return cached[1]
+        
+        external_schema = self.engine._SchemaEngine__tables[table_id]["external_schema"]
+        layout = self._build_pcc_db_layout(field_index, external_schema)
+        self._pcc_db_layouts[table_id] = (field_index, layout)
+        return layout
+
+    @staticmethod
+    def _build_pcc_db_layout(field_index: List[Dict[str, Any]],
+                             external_schema: Dict[str, Any]) -> List[Tuple[str, List[Tuple[str, str, List[Dict[str, Any]]]]]]:
+        """
+        Bucket the fields of an assessment by section and question group for format_to_pcc_db.
+        
+        Returns:
+            [(section_code, [(group_number, group_title, [field_meta, ...]), ...]), ...] with sections in
+            field order and groups sorted by group number. Table (gbdy) fields are left out of the
+            field lists.
+        """
+        # Organize fields by section and group
+        sections_dict: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        # Structure: {section_code: {group_number: [field_meta, ...]}}
+        
+        for field_meta in field_index:
+            if field_meta.get("is_virtual_container_child"):
+                continue
+            
+            level_keys = field_meta.get("level_keys", [])
+            if len(level_keys) < 2:
+                continue
+            
+            # Extract section_code from level_keys
+            # level_keys format: ["sections", "Cust.MHCS Nursing Daily Skilled Note", "assessmentQuestionGroups", "A", "questions"]
+            section_code = None
+            group_number = None
+            
+            # Find section code (first container after "sections")
+            if level_keys[0] == "sections":
+                section_key = level_keys[1]
+                # Extract section code (before the dot)
+                if "." in section_key:
+                    section_code = section_key.split(".")[0]
+                else:
+                    section_code = section_key
+            
+            # Find group number (after "assessmentQuestionGroups")
+            # level_keys format should have "assessmentQuestionGroups" at index 2, group number at index 3
+            if len(level_keys) > 3 and level_keys[2] == "assessmentQuestionGroups":
+                group_number = level_keys[3]
+            
+            if not section_code or not group_number:
+                continue
+            
+            group_fields = sections_dict.setdefault(section_code, {}).setdefault(group_number, [])
+            
+            # Table fields (gbdy) are not written to the PCC DB format yet, but still open their section
+            if field_meta.get("original_schema_type", "") != "gbdy":
+                group_fields.append(field_meta)
+        
+        # Group titles from the external schema: the first non-empty title of a
+        # (sectionCode, groupNumber) pair wins
+        group_titles: Dict[Tuple[str, str], str] = {}
+        for section in external_schema.get("sections", []):
+            seen_in_section = set()
+            for group in section.get("assessmentQuestionGroups", []):
+                group_number = group.get("groupNumber")
+                if group_number in seen_in_section:
+                    continue
+                seen_in_section.add(group_number)
+                title_key = (section.get("sectionCode"), group_number)
+                if not group_titles.get(title_key):
+                    group_titles[title_key] = group.get("groupTitle", "")
+        
+        return [
+            (section_code, [
+                (group_number, group_titles.get((section_code, group_number), ""), groups_dict[group_number])
+                for group_number in sorted(groups_dict.keys())
+            ])
+            for section_code, groups_dict in sections_dict.items()
+        ]
+
+    def _get_pcc_db_inverse_index(self, table_id: int) -> Tuple[List[Tuple[Tuple[str, ...], Dict[str, Any]]],
+                                                                Dict[str, Tuple[Tuple[str, ...], str, str, Dict[Any, str]]]]:
+        """Return the from_pcc_db index of a table, rebuilding it when the table was re-registered."""
+        field_index = self.get_field_metadata(table_id)
+        cached = self._pcc_db_inverse_indexes.get(table_id)
+        if cached is not None and cached[0] is field_index:
+            return cached[1]
+        
+        index = self._build_pcc_db_inverse_index(field_index, self.engine.get_json_schema(table_id))
+        self._pcc_db_inverse_indexes[table_id] = (field_index, index)
+        return index
+
+    @staticmethod
+    def _build_pcc_db_inverse_index(field_index: List[Dict[str, Any]], json_schema: Dict[str, Any]) -> Tuple[
+            List[Tuple[Tuple[str, ...], Dict[str, Any]]], Dict[str, Tuple[Tuple[str, ...], str, str, Dict[Any, str]]]]:
+        """
+        Index the questions of an assessment for from_pcc_db.
+        
+        Returns:
+            (defaults, questions). defaults is [(level_keys, {property_key: default_value})] for every
+            object of the JSON schema, parents first, so that the result always has every required
+            property: the constant of table_name and instructions, [] for non-nullable arrays (gbdy) and
+            None otherwise. questions maps question_key -> (level_keys, property_key, target_type,
+            response_value -> sanitized response_text); table (gbdy) questions are left out.
+        """
+        defaults: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = []
+        
+        def collect_defaults(node: Dict[str, Any], level_keys: Tuple[str, ...]) -> None:
+            level_defaults: Dict[str, Any] = {}
+            defaults.append((level_keys, level_defaults))
+            for key, property_schema in node.get("properties", {}).items():
+                if property_schema.get("type") == "object":
+                    collect_defaults(property_schema, level_keys + (key,))
+                elif "const" in property_schema:
+                    level_defaults[key] = property_schema["const"]
+                elif property_schema.get("type") == "array":
+                    level_defaults[key] = []
+                else:
+                    level_defaults[key] = None
+        
+        collect_defaults(json_schema, ())
+        
+        questions: Dict[str, Tuple[Tuple[str, ...], str, str, Dict[Any, str]]] = {}
+        for field_meta in field_index:
+            if field_meta.get("is_virtual_container_child") or field_meta.get("original_schema_type") == "gbdy":
+                continue
+            questions.setdefault(field_meta.get("key"), (
+                tuple(field_meta.get("level_keys", [])),
+                field_meta.get("property_key"),
+                field_meta.get("target_type"),
+                build_response_value_map(field_meta.get("field_schema", {}))
+            ))
+        
+        return defaults, questions
@@ -0,0 +1,211 @@
+"""
+Fill a PCC assessment with one model request per section.
+
+A single request for a large assessment (e.g. the Nursing Admission Assessment) is slow and its
+response can be truncated at the provider's completion token limit. fill_sections sends the
+standalone schema of each section as its own request instead, with a bounded number of requests
+in flight, validates each section response as it arrives, retries the ones that fail, and merges
+the rest into one model response for reverse_map.
+
+The model client is pluggable: any SectionClient implementation works. ThreadedSectionClient
+adapts a blocking client function, and FakeSectionClient answers locally for tests and timing.
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from pcc_schema.pcc_assessment_schema import PCCAssessmentSchema, merge_update
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYSTEM_PROMPT = "You are an expert filling json objects according to the provided json schema."
+
+
+class SectionClient(ABC):
+    """Interface of the model clients used by fill_sections."""
+
+    @abstractmethod
+    async def complete(self, system_prompt: str, user_prompt: str, json_schema: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        """
+        Request a response to json_schema from the model.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt, e.g. the transcript
+            json_schema: The section schema to answer with (strict structured output)
+
+        Returns:
+            The response content, as JSON text or an already parsed dictionary
+        """
+
+
+class ThreadedSectionClient(SectionClient):
+    """Run a blocking client function, such as an OpenAI SDK call, in a worker thread per request."""
+
+    def __init__(self, complete_func: Callable[[str, str, Dict[str, Any]], Union[str, Dict[str, Any]]]):
+        """
+        Args:
+            complete_func: Called as complete_func(system_prompt, user_prompt, json_schema) and
+                           returning the response content
+        """
+        self.complete_func = complete_func
+
+    async def complete(self, system_prompt: str, user_prompt: str, json_schema: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        return await asyncio.to_thread(self.complete_func, system_prompt, user_prompt, json_schema)
+
+
+class FakeSectionClient(SectionClient):
+    """
+    Local stand-in for a model, for tests and timing.
+
+    Answers each schema with the matching part of a complete model response. Each response takes
+    latency seconds plus latency_per_kb seconds per KB of response, like token generation does.
+    """
+
+    def __init__(self, model_response: Dict[str, Any], latency: float = 0.0, latency_per_kb: float = 0.0,
+                 failures: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            model_response: A complete model response to the full assessment schema
+            latency: Seconds to wait before each response
+            latency_per_kb: Additional seconds to wait per KB of response content
+            failures: Section key -> number of first requests for that section answered with
+                      truncated JSON
+        """
+        self.model_response = model_response
+        self.latency = latency
+        self.latency_per_kb = latency_per_kb
+        self.failures = dict(failures or {})
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete(self, system_prompt: str, user_prompt: str, json_schema: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        content = json.dumps(_select_schema_properties(json_schema, self.model_response))
+        try:
+            await asyncio.sleep(self.latency + self.latency_per_kb * len(content) / 1024)
+        finally:
+            self.in_flight -= 1
+
+        for section_key in json_schema.get("properties", {}).get("sections", {}).get("properties", {}):
+            if self.failures.get(section_key, 0) > 0:
+                self.failures[section_key] -= 1
+                return content[:len(content) // 2]
+        return content
+
+
+def _select_schema_properties(json_schema: Dict[str, Any], value: Any) -> Any:
+    """Return the part of value covered by the object properties of json_schema."""
+    properties = json_schema.get("properties") if isinstance(json_schema, dict) else None
+    if not properties or not isinstance(value, dict):
+        return value
+    return {key: _select_schema_properties(prop, value.get(key)) for key, prop in properties.items()}
+
+
+async def fill_sections_async(
+    pcc: PCCAssessmentSchema,
+    assessment_identifier: Union[int, str],
+    user_prompt: str,
+    client: SectionClient,
+    system_prompt: Optional[str] = None,
+    max_concurrency: int = 4,
+    max_attempts: int = 3,
+    section_keys: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Fill an assessment with one concurrent model request per section.
+
+    Each section response is validated against its section schema as soon as it arrives. Invalid
+    responses and client errors are retried up to max_attempts requests per section. Valid
+    responses are merged with merge_update; the sections of the merged response follow schema
+    order, so a complete result has the same shape as a response to the full schema.
+
+    Args:
+        pcc: The PCCAssessmentSchema the assessment is registered with
+        assessment_identifier: Either an integer assessment ID or string assessment name
+        user_prompt: User prompt sent with every section, e.g. the transcript
+        client: The model client
+        system_prompt: System prompt; defaults to DEFAULT_SYSTEM_PROMPT
+        max_concurrency: Maximum number of requests in flight
+        max_attempts: Maximum number of requests per section
+        section_keys: Sections to fill (default: all sections, see get_section_keys)
+
+    Returns:
+        Dictionary with:
+        - model_response: The merged model response (sections that failed are missing)
+        - failed_sections: Section key -> errors of the last attempt, for sections that failed
+        - attempts: Section key -> number of requests made
+
+    Raises:
+        ValueError: If max_concurrency or max_attempts is less than 1, or a section key is unknown
+    """
+    if max_concurrency < 1 or max_attempts < 1:
+        raise ValueError("max_concurrency and max_attempts must be at least 1")
+    if system_prompt is None:
+        system_prompt = DEFAULT_SYSTEM_PROMPT
+
+    all_section_keys = pcc.get_section_keys(assessment_identifier)
+    if section_keys is None:
+        section_keys = all_section_keys
+    unknown = [key for key in section_keys if key not in all_section_keys]
+    if unknown:
+        raise ValueError(f"Unknown sections for assessment '{assessment_identifier}': {unknown}")
+
+    # Build (and cache) the section schemas before fanning out
+    section_schemas = {key: pcc.get_section_schema(assessment_identifier, key) for key in section_keys}
+    semaphore = asyncio.Semaphore(max_concurrency)
+    attempts = {key: 0 for key in section_keys}
+
+    async def fill_section(section_key: str) -> Tuple[str, Optional[Dict[str, Any]], List[str]]:
+        errors: List[str] = []
+        container_path = ["sections", section_key]
+        while attempts[section_key] < max_attempts:
+            attempts[section_key] += 1
+            try:
+                async with semaphore:
+                    content = await client.complete(system_prompt, user_prompt, section_schemas[section_key])
+                response = json.loads(content) if isinstance(content, (str, bytes)) else content
+                if not isinstance(response, dict):
+                    raise ValueError(f"Expected a JSON object, got {type(response).__name__}")
+            except Exception as e:
+                errors = [f"{type(e).__name__}: {e}"]
+            else:
+                is_valid, errors = pcc.validate(assessment_identifier, response, container_path=container_path)
+                if is_valid:
+                    return section_key, response, []
+            logger.warning(f"Section '{section_key}' attempt {attempts[section_key]}/{max_attempts} failed: {errors[:3]}")
+        return section_key, None, errors
+
+    json_schema = pcc.get_json_schema(assessment_identifier)
+    merged: Dict[str, Any] = {"table_name": json_schema["properties"]["table_name"]["const"], "sections": {}}
+    failed_sections: Dict[str, List[str]] = {}
+    for next_result in asyncio.as_completed([fill_section(key) for key in section_keys]):
+        section_key, response, errors = await next_result
+        if response is None:
+            failed_sections[section_key] = errors
+        else:
+            merged = merge_update(merged, response, "sections")
+
+    merged["sections"] = {key: merged["sections"][key] for key in all_section_keys if key in merged["sections"]}
+    return {"model_response": merged, "failed_sections": failed_sections, "attempts": attempts}
+
+
+def fill_sections(
+    pcc: PCCAssessmentSchema,
+    assessment_identifier: Union[int, str],
+    user_prompt: str,
+    client: SectionClient,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Run fill_sections_async in a new event loop; for callers that are not async themselves.
+
+    Takes the same arguments and returns the same result as fill_sections_async.
+    """
+    return asyncio.run(fill_sections_async(pcc, assessment_identifier, user_prompt, client, **kwargs))
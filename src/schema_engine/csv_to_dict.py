@@ -1,6 +1,6 @@
 import csv
 import os
-from typing import Dict, Literal, TextIO, Optional
+from typing import Dict, List, Literal, Mapping, Optional, Sequence, TextIO, Tuple, Union
 from contextlib import closing
 import io
 
@@ -47,7 +47,72 @@ def read_key_value_csv_stream(
     Returns:
         dict mapping keys -> single string values
     """
-    result: Dict[str, str] = {}
+    return read_multi_value_csv_stream(
+        stream,
+        key_col,
+        [value_col],
+        case_insensitive=case_insensitive,
+        on_duplicate=on_duplicate,
+        skip_blank_keys=skip_blank_keys,
+        strip_whitespace=strip_whitespace,
+        concat_sep=concat_sep,
+        key_prefix=key_prefix,
+        sanitize_values=sanitize_values,
+        skip_first_row=skip_first_row,
+    )[value_col]
+
+
+def read_multi_value_csv_stream(
+    stream: TextIO,
+    key_col: str,
+    value_cols: Sequence[str],
+    *,
+    case_insensitive: bool = False,
+    on_duplicate: Union[DuplicatePolicy, Mapping[str, DuplicatePolicy]] = "last",
+    skip_blank_keys: bool = True,
+    strip_whitespace: bool = True,
+    concat_sep: str = ". ",
+    key_prefix: Optional[str] = None,
+    sanitize_values: Union[bool, Mapping[str, bool]] = True,
+    skip_first_row: bool = False,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Build one dict per value column from a CSV in a single streaming pass.
+
+    Every value column shares the same key column, so instruction CSVs that carry
+    several useful columns (model instruction, clinical notes, display hints, ...)
+    are read and decoded once instead of once per column.
+
+    Note: The stream must yield text (not bytes). For bytes (e.g., S3 StreamingBody),
+    wrap with io.TextIOWrapper(..., encoding="utf-8-sig", newline="").
+
+    Args:
+        stream: Text stream positioned at the start of a CSV with a header row.
+        key_col: Column name to use for dictionary keys.
+        value_cols: Column names to extract; one result dict is built per column.
+        case_insensitive: If True, match headers case-insensitively.
+        on_duplicate: Duplicate policy ("last" | "first" | "error" | "concat"), either
+            one policy for all columns or a mapping of column name -> policy.
+            Columns missing from the mapping use "last".
+        skip_blank_keys: If True, ignore rows where key is empty/only spaces.
+        strip_whitespace: If True, strip leading/trailing whitespace from keys/values.
+        concat_sep: Separator used when a column's policy is "concat" (default: ". ").
+        key_prefix: If provided, prefix keys with "{key_prefix}_" unless already prefixed.
+        sanitize_values: Sanitize values by removing HTML tags and JSON-breaking characters,
+            either one flag for all columns or a mapping of column name -> flag.
+            Columns missing from the mapping are sanitized.
+
+    Returns:
+        dict mapping each requested value column name -> {key: value}
+    """
+    if isinstance(value_cols, str):
+        raise TypeError("value_cols must be a sequence of column names, not a string.")
+    if not value_cols:
+        raise ValueError("value_cols must contain at least one column name.")
+    seen_cols: set = set()
+    duplicates = sorted({name for name in value_cols if name in seen_cols or seen_cols.add(name)})
+    if duplicates:
+        raise ValueError(f"value_cols contains duplicate column names: {duplicates}")
 
     # csv module recommendation: pass newline="" to the *file open* call;
     # here we assume the caller opened the stream correctly.
@@ -68,14 +133,26 @@ def read_key_value_csv_stream(
         return actual
 
     key_h = find_header(key_col)
-    val_h = find_header(value_col)
+
+    # Resolve each requested column once: (output name, header, policy, sanitize)
+    columns: List[Tuple[str, str, str, bool]] = []
+    for value_col in value_cols:
+        if isinstance(on_duplicate, Mapping):
+            policy = on_duplicate.get(value_col, "last")
+        else:
+            policy = on_duplicate
+        if isinstance(sanitize_values, Mapping):
+            sanitize = bool(sanitize_values.get(value_col, True))
+        else:
+            sanitize = sanitize_values
+        columns.append((value_col, find_header(value_col), policy, sanitize))
+
+    results: Dict[str, Dict[str, str]] = {value_col: {} for value_col in value_cols}
 
     for line_no, row in enumerate(reader, start=2):  # header is line 1
         k = row.get(key_h, "")
-        v = row.get(val_h, "")
         if strip_whitespace:
             k = (k or "").strip()
-            v = (v or "").strip()
 
         if skip_blank_keys and not k:
             continue
@@ -86,28 +163,45 @@ def read_key_value_csv_stream(
             if not k.startswith(prefix_with_underscore):
                 k = f"{prefix_with_underscore}{k}"
 
-        # Sanitize value if requested
-        if sanitize_values:
-            v = sanitize_for_json(v)
+        for value_col, val_h, policy, sanitize in columns:
+            v = row.get(val_h, "")
+            if strip_whitespace:
+                v = (v or "").strip()
 
-        if on_duplicate == "last":
+            # Sanitize value if requested
+            if sanitize:
+                v = sanitize_for_json(v)
+
+            _apply_duplicate_policy(results[value_col], k, v, policy, concat_sep, line_no)
+
+    return results
+
+
+def _apply_duplicate_policy(
+    result: Dict[str, str],
+    k: str,
+    v: str,
+    on_duplicate: str,
+    concat_sep: str,
+    line_no: int,
+) -> None:
+    """Store `v` under `k` in `result` according to the duplicate policy."""
+    if on_duplicate == "last":
+        result[k] = v
+    elif on_duplicate == "first":
+        if k not in result:
             result[k] = v
-        elif on_duplicate == "first":
-            if k not in result:
-                result[k] = v
-        elif on_duplicate == "error":
-            if k in result:
-                raise ValueError(f"Duplicate key '{k}' on CSV line {line_no}.")
+    elif on_duplicate == "error":
+        if k in result:
+            raise ValueError(f"Duplicate key '{k}' on CSV line {line_no}.")
+        result[k] = v
+    elif on_duplicate == "concat":
+        if k not in result or not result[k]:
             result[k] = v
-        elif on_duplicate == "concat":
-            if k not in result or not result[k]:
-                result[k] = v
-            else:
-                result[k] = f"{result[k]}{concat_sep}{v}"
         else:
-            raise ValueError(f"Unknown on_duplicate policy: {on_duplicate}")
-
-    return result
+            result[k] = f"{result[k]}{concat_sep}{v}"
+    else:
+        raise ValueError(f"Unknown on_duplicate policy: {on_duplicate}")
 
 
 # ----------------- Convenience wrappers -----------------
@@ -149,3 +243,42 @@ def read_key_value_csv_s3(
     # Ensure wrapper gets closed (also closes underlying StreamingBody when GC'd)
     with closing(text_stream) as f:
         return read_key_value_csv_stream(f, key_col, value_col, **kwargs)
+
+
+def read_multi_value_csv_path(
+    path: str,
+    key_col: str,
+    value_cols: Sequence[str],
+    **kwargs
+) -> Dict[str, Dict[str, str]]:
+    """
+    Open a *local file* and delegate to read_multi_value_csv_stream.
+    Uses encoding='utf-8-sig' to gracefully handle BOM and newline='' as recommended by csv.
+    """
+    with open(path, mode="r", encoding="utf-8-sig", newline="") as f:
+        return read_multi_value_csv_stream(f, key_col, value_cols, **kwargs)
+
+
+def read_multi_value_csv_s3(
+    bucket: str,
+    key: str,
+    key_col: str,
+    value_cols: Sequence[str],
+    *,
+    s3_client: Optional[object] = None,
+    **kwargs
+) -> Dict[str, Dict[str, str]]:
+    """
+    Fetch a CSV from S3 once and delegate to read_multi_value_csv_stream.
+    Wraps the StreamingBody (bytes) in a TextIOWrapper with utf-8-sig handling.
+    """
+    s3 = s3_client
+    if s3 is None:
+        import boto3  # Available by default in AWS Lambda; add to your container if needed
+        s3 = boto3.client("s3")
+    obj = s3.get_object(Bucket=bucket, Key=key)
+    # Decode bytes → text; handle BOM; set newline="" for csv correctness
+    text_stream = io.TextIOWrapper(obj["Body"], encoding="utf-8-sig", newline="")
+    # Ensure wrapper gets closed (also closes underlying StreamingBody when GC'd)
+    with closing(text_stream) as f:
+        return read_multi_value_csv_stream(f, key_col, value_cols, **kwargs)
@@ -324,13 +324,16 @@ Notes:
   - Returns: dict mapping field key to {"type": <label>, "value": <payload or null>}
   - Formatters are registered by original schema type (e.g., "rad", "cmb", "chk") with precedence over target type defaults
 - The engine stores both `key` and `id` for bottom-level fields (for reverse mapping).
+- Field metadata enricher signature: `(engine, field_meta) -> None`; enrichers run at
+  register_table time and may add precomputed data (e.g., option lookup maps) to field_meta.
 - Supports schema enrichment, reverse conversion, and container grouping.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 from copy import deepcopy
+from itertools import islice
 import json
 import logging
 import re
@@ -352,6 +355,23 @@ logger = logging.getLogger(__name__)
 MAX_TABLES_PER_ENGINE = 1000
 MAX_NESTING_LEVELS = 7
 
+# JSON schema keywords the compiled ingest checks evaluate natively; nodes using any
+# other keyword are checked with a jsonschema validator instead
+_ANNOTATION_KEYWORDS = frozenset({"title", "description", "format", "default", "examples", "$comment"})
+_COMPILED_CHECK_KEYWORDS = _ANNOTATION_KEYWORDS | frozenset({
+    "type", "enum", "const", "properties", "required", "additionalProperties",
+    "items", "minItems", "maxItems", "minimum", "maximum",
+})
+_JSON_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: (isinstance(v, int) and not isinstance(v, bool)) or (isinstance(v, float) and v.is_integer()),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+}
+
 # Function registries for schema builders and validators
 __field_schema_builders_registry: Dict[str, Callable] = {}
 __validator_registry: Dict[str, Callable] = {}
@@ -382,6 +402,11 @@ def _get_validator(internal_type: str) -> Optional[Callable]:
     return __validator_registry.get(internal_type)
 
 
+def _encode_json(value: Any) -> bytes:
+    """Serialize value as canonical (compact, UTF-8) JSON bytes, as returned by get_json_schema_bytes."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 class SchemaEngine:
     """Engine for comprehensive schema operations including conversion, validation, enrichment, and reverse mapping."""
 
@@ -404,6 +429,10 @@ class SchemaEngine:
         self.__instance_field_schema_builder_registry: Dict[str, Callable] = {}
         # Named formatter sets: {formatter_name: {original_schema_type: formatter_func}}
         self.__named_formatter_sets: Dict[str, Dict[str, Callable]] = {}
+        # Optional column formatters for batch reverse mapping: {formatter_name: {original_schema_type: batch_func}}
+        self.__named_batch_formatter_sets: Dict[str, Dict[str, Callable]] = {}
+        # Field metadata enrichers, run in registration order on every field at register_table time
+        self.__field_metadata_enrichers: List[Callable] = []
 
         # Table registry: table_id -> registry record
         self.__tables: Dict[int, Dict[str, Any]] = {}
@@ -496,8 +525,58 @@ class SchemaEngine:
             self.__named_formatter_sets[formatter_name] = {}
         
         self.__named_formatter_sets[formatter_name][original_schema_type] = formatter_func
+        # A batch formatter registered for the replaced formatter no longer matches it; the type
+        # falls back to the scalar formatter until a new batch variant is registered
+        self.__named_batch_formatter_sets.get(formatter_name, {}).pop(original_schema_type, None)
+        
+        # Compiled dispatch plans for this formatter set are stale now
+        for rec in self.__tables.values():
+            rec["formatter_plans"].pop(formatter_name, None)
+            rec["container_plans"].pop(formatter_name, None)
+            rec["ingest_plans"].pop(formatter_name, None)
         logger.debug(f"Registered reverse formatter for '{original_schema_type}' in formatter set '{formatter_name}'")
 
+    def register_batch_reverse_formatter(self, formatter_name: str, original_schema_type: str, batch_formatter_func: Callable) -> None:
+        """
+        Register a vectorized variant of a reverse formatter, used by iter_reverse_map_batch.
+        
+        The batch formatter formats a whole column of values (one field across many responses) in a
+        single call, so per-field work such as metadata lookups is done once per column instead of
+        once per response. Fields without a batch formatter fall back to the scalar formatter, which
+        must be registered as well with register_reverse_formatter. Registering a scalar formatter
+        again drops the batch formatter of the same type, so register the batch variant after it.
+        
+        Args:
+            formatter_name: Name of the formatter set (e.g., "default", "ui-app")
+            original_schema_type: The original schema type (e.g., "rad", "cmb", "gbdy")
+            batch_formatter_func: Batch formatter function with signature:
+                (engine, field_meta, model_values, table_name) -> List[Dict[str, Dict[str, Any]]]
+                where model_values is a list of model values and the result holds, in the same order,
+                what the scalar formatter returns for each value
+        """
+        if formatter_name not in self.__named_batch_formatter_sets:
+            self.__named_batch_formatter_sets[formatter_name] = {}
+        
+        self.__named_batch_formatter_sets[formatter_name][original_schema_type] = batch_formatter_func
+        logger.debug(f"Registered batch reverse formatter for '{original_schema_type}' in formatter set '{formatter_name}'")
+
+    def register_field_metadata_enricher(self, enricher_func: Callable) -> None:
+        """
+        Register a function that precomputes extra data on each field's metadata at registration.
+
+        Enricher signature: func(engine, field_meta) -> None
+        - field_meta is the metadata dict stored in the table's field index; the enricher
+          adds keys to it in place (e.g., option lookup maps used by reverse formatters).
+
+        Enrichers run in registration order for every field of every table registered
+        afterwards, so register them before registering tables.
+
+        Args:
+            enricher_func: Enricher function
+        """
+        self.__field_metadata_enrichers.append(enricher_func)
+        logger.debug(f"Registered field metadata enricher '{getattr(enricher_func, '__name__', enricher_func)}'")
+
     def register_table(self, table_id: Optional[int], external_schema: Dict[str, Any]) -> Tuple[int, str]:
         """Register (or re-register) a table schema.
 
@@ -531,12 +610,24 @@ class SchemaEngine:
 
         json_schema, field_index, container_counts = self._build_table_schema(external_schema, table_name)
 
+        for enricher in self.__field_metadata_enrichers:
+            for field_meta in field_index:
+                enricher(self, field_meta)
+
         self.__tables[table_id] = {
             "external_schema": external_schema,
             "json_schema": json_schema,
             "field_index": field_index,  # list of {key, id, level_keys}
             "table_name": table_name,
             "container_counts": container_counts,  # dict mapping container_name -> count
+            "container_grouping": self._build_container_grouping(field_index),  # precomputed for reverse_map grouping
+            "formatter_plans": {},  # formatter_name -> compiled dispatch plan, built lazily by reverse_map
+            "container_plans": {},  # formatter_name -> dispatch plan split by top-level container, for iter_reverse_map
+            "field_value_schemas": None,  # field_key -> (field_meta, response path, JSON schema node), built lazily by validate_field
+            "ingest_checks": None,  # (structure check, {field_key: value check}), compiled lazily by ingest
+            "ingest_plans": {},  # formatter_name -> fused validate + format plan, built lazily by ingest
+            "container_schemas": {},  # container path -> standalone JSON schema, built lazily by get_container_schema
+            "schema_bytes": {},  # container path (None: full schema) -> (JSON bytes, field spans), built lazily by get_json_schema_bytes
         }
         
         # Update name-to-ID mapping
@@ -650,12 +741,399 @@ class SchemaEngine:
             raise KeyError(f"Unknown table_id: {table_id}")
         return rec["json_schema"]
 
-    def validate(self, table_identifier: Union[int, str], data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def get_container_schema(self, table_identifier: Union[int, str], container_path: Sequence[str]) -> Dict[str, Any]:
+        """Get a standalone JSON schema for one container (e.g. a section or group) of a registered table.
+
+        The schema keeps the root object with its title and table_name, and every wrapper object on
+        the way down to the container, each reduced to the single property on the path. A model
+        response to it has the same shape as a response to the full schema, limited to that container,
+        so its values are found by reverse_map and extract_model_values. Like the full schema, it is
+        valid for OpenAI strict structured outputs.
+
+        Container schemas are cached per table registration; enrich_schema and re-registration
+        discard the cache. Do not modify the returned schema; use get_schema_with_overrides with
+        container_path for a modified copy.
+
+        Args:
+            table_identifier: Either an integer table ID or string table name
+            container_path: Property keys from the root to the container, as in field level_keys
+                            (e.g. ["sections", "A.Section A"] or
+                            ["sections", "A.Section A", "assessmentQuestionGroups", "1"])
+
+        Returns:
+            JSON schema dictionary
+
+        Raises:
+            ValueError: If container_path is empty or is not a container of the table
+        """
+        table_id = self.resolve_table_id(table_identifier)
+        rec = self.__tables.get(table_id)
+        if not rec:
+            raise KeyError(f"Unknown table_id: {table_id}")
+
+        path = tuple(container_path)
+        cached = rec["container_schemas"].get(path)
+        if cached is not None:
+            return cached
+
+        if not path or not any(tuple(f.get("level_keys", ()))[:len(path)] == path for f in rec["field_index"]):
+            raise ValueError(f"Unknown container path for table '{rec['table_name']}': {list(path)}")
+
+        container_schema = self._slice_container_schema(rec["json_schema"], path)
+        rec["container_schemas"][path] = container_schema
+        return container_schema
+
+    def get_json_schema_bytes(
+        self,
+        table_identifier: Union[int, str],
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+        container_path: Optional[Sequence[str]] = None,
+    ) -> bytes:
+        """Get a registered table's JSON schema serialized as UTF-8 JSON, ready to send in a request.
+
+        The serialization is canonical: compact separators, keys in schema order and non-ASCII
+        characters as UTF-8, i.e. json.dumps(schema, ensure_ascii=False, separators=(",", ":")).
+        It is cached per table registration (and container path); enrich_schema and re-registration
+        discard the cache.
+
+        With overrides, the result equals serializing get_schema_with_overrides(table_identifier,
+        overrides, container_path), but only the overridden fields' property schemas are copied and
+        serialized; the rest is spliced from the cached bytes.
+
+        Args:
+            table_identifier: Either an integer table ID or string table name
+            overrides: Optional per-field overrides, as in get_schema_with_overrides
+            container_path: If given, serialize get_container_schema(table_identifier, container_path)
+
+        Returns:
+            The serialized schema
+        """
+        table_id = self.resolve_table_id(table_identifier)
+        rec = self.__tables.get(table_id)
+        if not rec:
+            raise KeyError(f"Unknown table_id: {table_id}")
+        if overrides is not None and not isinstance(overrides, dict):
+            raise TypeError("overrides must be a dictionary.")
+
+        path = None if container_path is None else tuple(container_path)
+        json_schema = rec["json_schema"] if path is None else self.get_container_schema(table_id, path)
+        cached = rec["schema_bytes"].get(path)
+        if cached is None:
+            field_paths = {
+                tuple(field_meta.get("level_keys", [])) + (field_meta["property_key"],)
+                for field_meta in rec["field_index"] if field_meta.get("property_key")
+            }
+            cached = self._serialize_schema_with_spans(json_schema, field_paths)
+            rec["schema_bytes"][path] = cached
+        schema_bytes, spans = cached
+        if not overrides:
+            return schema_bytes
+
+        schema_copy = dict(json_schema)
+        overridden_paths = self._apply_schema_overrides(rec, schema_copy, overrides, copy_on_write=True)
+
+        # Re-serialize the outermost field property holding each change
+        replaced: Dict[Tuple[str, ...], Tuple[int, int]] = {}
+        for overridden_path in overridden_paths:
+            span_path = next((overridden_path[:i] for i in range(1, len(overridden_path) + 1) if overridden_path[:i] in spans), None)
+            if span_path is None:
+                return _encode_json(schema_copy)
+            replaced[span_path] = spans[span_path]
+
+        pieces: List[bytes] = []
+        position = 0
+        for span_path, (start, end) in sorted(replaced.items(), key=lambda item: item[1]):
+            node = schema_copy
+            for key in span_path:
+                node = node["properties"][key]
+            pieces.append(schema_bytes[position:start])
+            pieces.append(_encode_json(node))
+            position = end
+        pieces.append(schema_bytes[position:])
+        return b"".join(pieces)
+
+    @staticmethod
+    def _serialize_schema_with_spans(
+        json_schema: Dict[str, Any], field_paths: Set[Tuple[str, ...]]
+    ) -> Tuple[bytes, Dict[Tuple[str, ...], Tuple[int, int]]]:
+        """Serialize json_schema like _encode_json, recording the byte span of each field property schema."""
+        prefixes = {field_path[:i] for field_path in field_paths for i in range(len(field_path))}
+        parts: List[bytes] = []
+        spans: Dict[Tuple[str, ...], Tuple[int, int]] = {}
+        size = 0
+
+        def emit(chunk: bytes) -> None:
+            nonlocal size
+            parts.append(chunk)
+            size += len(chunk)
+
+        def encode_node(node: Any, path: Tuple[str, ...]) -> None:
+            if path in field_paths:
+                start = size
+                emit(_encode_json(node))
+                spans[path] = (start, size)
+                return
+            if path not in prefixes or not isinstance(node, dict):
+                emit(_encode_json(node))
+                return
+            emit(b"{")
+            for index, (key, value) in enumerate(node.items()):
+                emit(b"," + _encode_json(key) + b":" if index else _encode_json(key) + b":")
+                if key != "properties" or not isinstance(value, dict):
+                    emit(_encode_json(value))
+                    continue
+                emit(b"{")
+                for prop_index, (prop_key, prop) in enumerate(value.items()):
+                    emit(b"," + _encode_json(prop_key) + b":" if prop_index else _encode_json(prop_key) + b":")
+                    encode_node(prop, path + (prop_key,))
+                emit(b"}")
+            emit(b"}")
+
+        encode_node(json_schema, ())
+        return b"".join(parts), spans
+
+    @staticmethod
+    def _slice_container_schema(json_schema: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any]:
+        """Copy json_schema keeping, at each level above the container, only the path property and non-object properties."""
+        root: Dict[str, Any] = {key: value for key, value in json_schema.items() if key not in ("properties", "required")}
+        node, sliced = json_schema, root
+        for key in path:
+            properties = node["properties"]
+            kept = [
+                name for name, prop in properties.items()
+                if name == key or not (isinstance(prop, dict) and "properties" in prop)
+            ]
+            sliced["properties"] = {
+                name: deepcopy(prop) if name != key else {k: v for k, v in prop.items() if k not in ("properties", "required")}
+                for name, prop in properties.items() if name in kept
+            }
+            sliced["required"] = [name for name in node.get("required", []) if name in kept]
+            node, sliced = properties[key], sliced["properties"][key]
+        sliced.update(deepcopy({k: v for k, v in node.items() if k in ("properties", "required")}))
+        return root
+
+    def partition_schema(
+        self,
+        table_identifier: Union[int, str],
+        max_depth: Optional[int] = None,
+        max_properties: Optional[int] = None,
+        max_enum_values: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Split a registered table's JSON schema into sub-schemas that fit provider budgets.
+
+        Partitions follow container boundaries. A partition is the schema object at a container
+        path (re-rooted there, so wrapper levels above it do not count towards max_depth) limited
+        to some of its properties. A container that does not fit is split into its children, and
+        fitting siblings are packed together first-fit decreasing, to keep the number of
+        partitions low. The object holding a table's fields is never split.
+
+        Budgets (None means unlimited) apply to each partition schema:
+            max_depth: Nesting depth, counted as in tests/gemini_client.get_schema_depth
+            max_properties: Total number of object properties at all levels
+            max_enum_values: Total number of enum values at all levels
+            max_tokens: Approximate token count of the serialized schema (4 characters per token)
+
+        When the whole schema fits, the result is one partition with the registered schema.
+
+        Args:
+            table_identifier: Either an integer table ID or string table name
+
+        Returns:
+            {"partitions": [json_schema, ...], "merge_plan": merge_plan}; pass merge_plan and the
+            model responses to the partitions, in order, to merge_partition_responses
+
+        Raises:
+            ValueError: If a part of the schema that cannot be split exceeds a budget
+        """
+        table_id = self.resolve_table_id(table_identifier)
+        rec = self.__tables[table_id]
+        json_schema = rec["json_schema"]
+        budgets = {"depth": max_depth, "properties": max_properties, "enum_values": max_enum_values, "tokens": max_tokens}
+
+        # Container paths: wrappers can be split further, the objects holding fields cannot
+        field_level_keys = [
+            tuple(field_meta.get("level_keys", []))
+            for field_meta in rec["field_index"] if not field_meta.get("is_virtual_container_child")
+        ]
+        splittable = {level_keys[:i] for level_keys in field_level_keys for i in range(len(level_keys))}
+        container_paths = splittable | set(field_level_keys)
+
+        def over_budget(stats: Dict[str, int]) -> List[str]:
+            return [name for name, limit in budgets.items() if limit is not None and stats[name] > limit]
+
+        def partition_stats(node: Dict[str, Any], keys: List[str], property_stats: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+            # Stats of node re-rooted and limited to keys, summed from its properties' stats
+            chars = len(json.dumps({k: v for k, v in node.items() if k not in ("properties", "required")})) + 40
+            stats = {"depth": 0, "properties": 0, "enum_values": 0}
+            for key in keys:
+                prop_stats = property_stats[key]
+                stats["depth"] = max(stats["depth"], prop_stats["depth"])
+                stats["properties"] += prop_stats["properties"]
+                stats["enum_values"] += prop_stats["enum_values"]
+                chars += prop_stats["chars"]
+            stats["tokens"] = -(-chars // 4)
+            return stats
+
+        def partition_node(path: Tuple[str, ...], node: Dict[str, Any]) -> List[Tuple[Tuple[str, ...], List[str]]]:
+            properties = node.get("properties", {})
+            property_stats = {}
+            for key, prop in properties.items():
+                depth, num_properties, enum_values = self._schema_stats({"properties": {key: prop}})
+                property_stats[key] = {
+                    "depth": depth, "properties": num_properties, "enum_values": enum_values,
+                    "chars": 2 * len(json.dumps(key)) + 4 + len(json.dumps(prop)),
+                }
+
+            # Non-container properties (the root table_name) go into every packed partition of this node
+            leaves = [key for key in properties if path + (key,) not in container_paths]
+            containers = [key for key in properties if path + (key,) in container_paths]
+
+            # Shortcut: the node fits as a whole
+            if not over_budget(partition_stats(node, list(properties), property_stats)):
+                return [(path, list(properties))]
+
+            fitting: List[str] = []
+            split: List[Tuple[Tuple[str, ...], List[str]]] = []
+            for key in containers:
+                if not over_budget(partition_stats(node, leaves + [key], property_stats)):
+                    fitting.append(key)
+                elif path + (key,) in splittable:
+                    split.extend(partition_node(path + (key,), properties[key]))
+                else:
+                    exceeded = over_budget(partition_stats(node, leaves + [key], property_stats))
+                    raise ValueError(
+                        f"Container {list(path + (key,))} of table '{rec['table_name']}' cannot be split "
+                        f"and exceeds the {', '.join(exceeded)} budget"
+                    )
+
+            # First-fit decreasing, by the largest share of any additive budget
+            def size(key: str) -> float:
+                prop_stats = dict(property_stats[key], tokens=property_stats[key]["chars"] / 4)
+                return max(
+                    [prop_stats[name] / limit for name, limit in budgets.items() if name != "depth" and limit] or [0.0]
+                )
+
+            bins: List[List[str]] = []
+            for key in sorted(fitting, key=size, reverse=True):
+                for keys in bins:
+                    if not over_budget(partition_stats(node, leaves + keys + [key], property_stats)):
+                        keys.append(key)
+                        break
+                else:
+                    bins.append([key])
+
+            order = {key: index for index, key in enumerate(properties)}
+            packed = [(path, leaves + sorted(keys, key=order.get)) for keys in bins]
+            packed.sort(key=lambda item: order[item[1][len(leaves)]])
+
+            # All containers were split, so the leaves need a partition of their own; the root's
+            # const leaves (table_name) are restored by merge_partition_responses instead
+            if not bins and any(path or "const" not in properties[key] for key in leaves):
+                exceeded = over_budget(partition_stats(node, leaves, property_stats))
+                if exceeded:
+                    raise ValueError(
+                        f"Properties {leaves} at {list(path)} of table '{rec['table_name']}' "
+                        f"exceed the {', '.join(exceeded)} budget"
+                    )
+                packed = [(path, leaves)]
+            return packed + split
+
+        parts = partition_node((), json_schema)
+
+        partitions: List[Dict[str, Any]] = []
+        steps: List[Dict[str, Any]] = []
+        for path, keys in parts:
+            node = json_schema
+            for key in path:
+                node = node["properties"][key]
+            if not path and keys == list(node.get("properties", {})):
+                partitions.append(json_schema)
+            else:
+                partition = {k: v for k, v in node.items() if k not in ("properties", "required")}
+                partition.setdefault("title", rec["table_name"])
+                partition["properties"] = {key: deepcopy(node["properties"][key]) for key in keys}
+                partition["required"] = [key for key in node.get("required", []) if key in keys]
+                partitions.append(partition)
+            steps.append({"path": list(path), "keys": list(keys)})
+
+        constants = {
+            key: prop["const"]
+            for key, prop in json_schema.get("properties", {}).items()
+            if isinstance(prop, dict) and "const" in prop
+        }
+        return {"partitions": partitions, "merge_plan": {"constants": constants, "steps": steps}}
+
+    @staticmethod
+    def merge_partition_responses(merge_plan: Dict[str, Any], responses: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """Reassemble model responses to partition_schema partitions into one response for the full schema.
+
+        Args:
+            merge_plan: The "merge_plan" returned by partition_schema
+            responses: One model response per partition, in partition order
+
+        Returns:
+            The merged model response, accepted by validate and reverse_map when each response
+            is valid for its partition
+
+        Raises:
+            ValueError: If the number of responses does not match the plan, or a response is
+                        missing a property of its partition
+        """
+        steps = merge_plan["steps"]
+        if len(responses) != len(steps):
+            raise ValueError(f"Expected {len(steps)} partition responses, got {len(responses)}")
+
+        merged: Dict[str, Any] = dict(merge_plan.get("constants", {}))
+        for index, (step, response) in enumerate(zip(steps, responses)):
+            target = merged
+            for key in step["path"]:
+                target = target.setdefault(key, {})
+            for key in step["keys"]:
+                if not isinstance(response, dict) or key not in response:
+                    raise ValueError(f"Response to partition {index} is missing '{key}'")
+                target[key] = response[key]
+        return merged
+
+    @staticmethod
+    def _schema_stats(node: Any) -> Tuple[int, int, int]:
+        """Return (depth, properties, enum values) of a JSON schema node, counted at all levels."""
+        if not isinstance(node, dict):
+            return 0, 0, 0
+        enum_values = len(node["enum"]) if isinstance(node.get("enum"), list) else 0
+        num_properties = 0
+        depth = 0
+        for prop in node.get("properties", {}).values():
+            prop_depth, prop_properties, prop_enum_values = SchemaEngine._schema_stats(prop)
+            num_properties += 1 + prop_properties
+            enum_values += prop_enum_values
+            if isinstance(prop, dict):
+                prop_type = prop.get("type")
+                prop_types = prop_type if isinstance(prop_type, list) else [prop_type]
+                if "object" in prop_types:
+                    depth = max(depth, 1 + prop_depth)
+                elif "array" in prop_types and "items" in prop:
+                    depth = max(depth, 1 + SchemaEngine._schema_stats(prop["items"])[0])
+        items = node.get("items")
+        if isinstance(items, dict):
+            _, item_properties, item_enum_values = SchemaEngine._schema_stats(items)
+            num_properties += item_properties
+            enum_values += item_enum_values
+        return depth, num_properties, enum_values
+
+    def validate(
+        self,
+        table_identifier: Union[int, str],
+        data: Dict[str, Any],
+        container_path: Optional[Sequence[str]] = None,
+    ) -> Tuple[bool, List[str]]:
         """Validate data against registered JSON schema and custom validators.
         
         Args:
             table_identifier: Either an integer table ID or string table name
             data: Data to validate
+            container_path: If given, validate a response to get_container_schema(table_identifier,
+                container_path) instead of a response to the full schema
         
         Returns:
             Tuple of (is_valid, errors).
@@ -667,7 +1145,7 @@ class SchemaEngine:
         if not rec:
             raise KeyError(f"Unknown table_id: {table_id}")
         
-        schema = rec["json_schema"]
+        schema = rec["json_schema"] if container_path is None else self.get_container_schema(table_id, container_path)
         field_index = rec["field_index"]
         
         # Step 1: JSON schema validation (structure, types, required fields, enums)
@@ -685,6 +1163,302 @@ class SchemaEngine:
         all_errors = errors + validation_errors
         return is_valid, all_errors
 
+    def validate_field(self, table_identifier: Union[int, str], field_key: str, value: Any) -> Tuple[bool, List[str]]:
+        """Validate a single field value against its JSON schema node and custom validator.
+        
+        Args:
+            table_identifier: Either an integer table ID or string table name
+            field_key: Key of the field (as in get_field_metadata)
+            value: The field value as it appears in a model response
+        
+        Returns:
+            Tuple of (is_valid, errors), with error locations given as full response paths.
+        
+        Raises:
+            KeyError: If the table has no field with this key
+        """
+        table_id = self.resolve_table_id(table_identifier)
+        rec = self.__tables[table_id]
+        
+        field_schemas = rec["field_value_schemas"]
+        if field_schemas is None:
+            field_schemas = self._build_field_value_schemas(rec["json_schema"], rec["field_index"])
+            rec["field_value_schemas"] = field_schemas
+        
+        if field_key not in field_schemas:
+            raise KeyError(f"Unknown field '{field_key}' in table_id {table_id}")
+        field_meta, value_path, value_schema = field_schemas[field_key]
+        
+        # Step 1: JSON schema validation of the property node
+        errors = []
+        if value_schema is not None:
+            for err in DefaultValidator(value_schema).iter_errors(value):
+                loc = ".".join(str(p) for p in value_path + list(err.path))
+                errors.append(f"{loc}: {err.message}")
+        if errors:
+            return False, errors
+        
+        # Step 2: Custom validator (instance overrides global)
+        if value is not None:
+            self._run_custom_validator(field_meta, value, self._build_field_path(field_meta), errors)
+        return len(errors) == 0, errors
+
+    def ingest(
+        self,
+        table_identifier: Union[int, str],
+        raw_response: Union[str, bytes],
+        formatter_name: str = "default",
+        group_by_containers: Optional[List[str]] = None,
+        properties_key: str = "properties",
+        pack_properties_as: str = "object",
+        pack_containers_as: str = "array",
+        metadata_field_overrides: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
+        """
+        Parse, validate and reverse map a raw model response in one pass over its fields.
+        
+        Equivalent to json.loads + validate + reverse_map, but every field value is looked up once
+        and checked against a compiled per-table plan while it is formatted. When a compiled check
+        fails, the response is validated again with jsonschema so the errors are exactly the ones
+        validate() reports.
+        
+        Args:
+            table_identifier: Either an integer table ID or string table name
+            raw_response: The model response as JSON text (str or bytes)
+            formatter_name, group_by_containers, properties_key, pack_properties_as,
+            pack_containers_as, metadata_field_overrides: Same as reverse_map
+        
+        Returns:
+            Tuple of (is_valid, errors, formatted):
+            - is_valid, errors: as returned by validate()
+            - formatted: as returned by reverse_map(), or None if raw_response is not valid JSON
+        
+        Raises:
+            ValueError: Same conditions as reverse_map
+        """
+        table_id = self.resolve_table_id(table_identifier)
+        rec = self.__tables[table_id]
+        self._check_reverse_map_options(formatter_name, pack_properties_as, pack_containers_as)
+        
+        try:
+            model_response = json.loads(raw_response)
+        except ValueError as e:
+            return False, [f"Invalid JSON: {e}"], None
+        
+        structure_check, plan = self._get_ingest_plan(rec, formatter_name)
+        schema_ok = structure_check is None or structure_check(model_response)
+        
+        table_name = rec["table_name"]
+        custom_errors: List[str] = []
+        formatted_results: Dict[str, Any] = {}
+        parents: Dict[Tuple[str, ...], Optional[Dict[str, Any]]] = {}
+        for field_meta, field_key, level_path, property_key, value_check, field_path, validator_path, formats, formatter in plan:
+            if level_path in parents:
+                parent = parents[level_path]
+            else:
+                parent = self._resolve_level(model_response, level_path)
+                parents[level_path] = parent
+            present = parent is not None and property_key in parent
+            model_value = parent[property_key] if present else None
+            
+            if schema_ok:
+                if value_check is not None and present and not value_check(model_value):
+                    # Custom validation results are discarded once the schema check fails
+                    schema_ok = False
+                else:
+                    value = model_value if validator_path is None else self._get_nested_value(model_response, validator_path)
+                    if value is not None:
+                        self._run_custom_validator(field_meta, value, field_path, custom_errors)
+            
+            if not formats:
+                continue
+            if formatter is None:
+                logger.error(f"Field {field_key} missing target_type")
+                formatted_results[field_key] = {"type": "unknown", "value": None}
+                continue
+            try:
+                field_result = formatter(self, field_meta, model_value, table_name)
+            except Exception as e:
+                logger.error(f"Error formatting field '{field_key}' with type '{field_meta.get('original_schema_type')}': {e}")
+                continue
+            self._merge_field_result(formatted_results, field_result)
+        
+        formatted = self._assemble_reverse_map_output(
+            rec, formatted_results, group_by_containers, properties_key,
+            pack_properties_as, pack_containers_as, metadata_field_overrides
+        )
+        
+        if schema_ok:
+            return len(custom_errors) == 0, custom_errors, formatted
+        
+        # Compiled checks are conservative: let jsonschema produce the errors
+        is_valid, errors = self.validate(table_id, model_response)
+        return is_valid, errors, formatted
+
+    def _get_ingest_plan(self, rec: Dict[str, Any], formatter_name: str) -> Tuple[Optional[Callable[[Any], bool]], List[Tuple]]:
+        """
+        Return (structure check, fused plan) for ingest, compiling them on first use.
+        
+        The structure check covers the container objects of the JSON schema; each field value is
+        checked by its plan entry. Plan entries follow the field index order, as a tuple of
+        (field_meta, field_key, level_path, property_key, value_check, field_path, validator_path,
+        formats, formatter): validator_path is None when the custom validator reads the same value
+        that is formatted, and formats is False for fields reverse_map does not format.
+        """
+        if rec["ingest_checks"] is None:
+            field_schemas = rec["field_value_schemas"]
+            if field_schemas is None:
+                field_schemas = self._build_field_value_schemas(rec["json_schema"], rec["field_index"])
+                rec["field_value_schemas"] = field_schemas
+            value_paths = frozenset(tuple(value_path) for _, value_path, _ in field_schemas.values())
+            rec["ingest_checks"] = (
+                self._compile_value_check(rec["json_schema"], value_paths),
+                {
+                    field_key: self._compile_value_check(value_schema) if value_schema is not None else None
+                    for field_key, (_, _, value_schema) in field_schemas.items()
+                },
+            )
+        structure_check, value_checks = rec["ingest_checks"]
+        
+        plan = rec["ingest_plans"].get(formatter_name)
+        if plan is None:
+            formatters = {
+                field_key: formatter
+                for _, field_key, _, _, formatter in self._get_formatter_plan(rec, formatter_name)
+            }
+            plan = []
+            for field_meta in rec["field_index"]:
+                field_key = field_meta.get("key", "unknown")
+                level_keys = field_meta.get("level_keys", [])
+                property_key = field_meta.get("property_key")
+                field_path = self._build_field_path(field_meta)
+                is_child = bool(field_meta.get("is_virtual_container_child"))
+                plan.append((
+                    field_meta,
+                    field_key,
+                    tuple(level_keys),
+                    property_key,
+                    None if is_child else value_checks.get(field_key),
+                    field_path,
+                    None if field_path == level_keys + [property_key] else field_path,
+                    not is_child and field_key in formatters,
+                    formatters.get(field_key),
+                ))
+            rec["ingest_plans"][formatter_name] = plan
+        return structure_check, plan
+
+    @staticmethod
+    def _compile_value_check(node: Any, skip_paths: frozenset = frozenset(), path: Tuple[str, ...] = ()) -> Optional[Callable[[Any], bool]]:
+        """
+        Compile a JSON schema node into a predicate that is True only for values jsonschema accepts.
+        
+        Nodes at skip_paths (relative to the compiled root) are not checked. A node using keywords
+        outside _COMPILED_CHECK_KEYWORDS, or values the fast checks do not model, is checked with a
+        jsonschema validator. Returns None when the node accepts any value.
+        """
+        if path in skip_paths:
+            return None
+        if not isinstance(node, dict) or set(node) - _COMPILED_CHECK_KEYWORDS:
+            return DefaultValidator(node).is_valid
+        
+        additional = node.get("additionalProperties", True)
+        enum = node.get("enum")
+        has_const = "const" in node
+        const = node.get("const")
+        if (not isinstance(additional, bool)
+                or ("items" in node and not isinstance(node["items"], dict))
+                or (enum is not None and not all(member is None or isinstance(member, str) for member in enum))
+                or (has_const and const is not None and not isinstance(const, (str, bool)))):
+            return DefaultValidator(node).is_valid
+        
+        checks: List[Callable[[Any], bool]] = []
+        
+        json_types = node.get("type")
+        if json_types is not None:
+            if isinstance(json_types, str):
+                json_types = [json_types]
+            if any(json_type not in _JSON_TYPE_CHECKS for json_type in json_types):
+                return DefaultValidator(node).is_valid
+            type_checks = [_JSON_TYPE_CHECKS[json_type] for json_type in json_types]
+            checks.append(lambda v: any(type_check(v) for type_check in type_checks))
+        
+        if enum is not None:
+            texts = frozenset(member for member in enum if member is not None)
+            allow_null = None in enum
+            checks.append(lambda v: (v is None and allow_null) or (isinstance(v, str) and v in texts))
+        
+        if has_const:
+            if const is None or isinstance(const, bool):
+                checks.append(lambda v: v is const)
+            else:
+                checks.append(lambda v: isinstance(v, str) and v == const)
+        
+        for keyword, holds in (("minimum", lambda v, bound: v >= bound), ("maximum", lambda v, bound: v <= bound)):
+            if keyword in node:
+                bound = node[keyword]
+                checks.append(lambda v, bound=bound, holds=holds: not _JSON_TYPE_CHECKS["number"](v) or holds(v, bound))
+        
+        if "items" in node or "minItems" in node or "maxItems" in node:
+            item_check = SchemaEngine._compile_value_check(node["items"]) if "items" in node else None
+            min_items = node.get("minItems", 0)
+            max_items = node.get("maxItems")
+            
+            def check_array(v: Any) -> bool:
+                if not isinstance(v, list):
+                    return True
+                if len(v) < min_items or (max_items is not None and len(v) > max_items):
+                    return False
+                return item_check is None or all(item_check(item) for item in v)
+            
+            checks.append(check_array)
+        
+        if "properties" in node or "required" in node or additional is False:
+            properties = node.get("properties", {})
+            property_checks = [
+                (name, prop_check)
+                for name, prop_node in properties.items()
+                for prop_check in [SchemaEngine._compile_value_check(prop_node, skip_paths, path + (name,))]
+                if prop_check is not None
+            ]
+            required = list(node.get("required", []))
+            allowed = frozenset(properties) if additional is False else None
+            
+            def check_object(v: Any) -> bool:
+                if not isinstance(v, dict):
+                    return True
+                for name in required:
+                    if name not in v:
+                        return False
+                if allowed is not None and any(name not in allowed for name in v):
+                    return False
+                for name, prop_check in property_checks:
+                    if name in v and not prop_check(v[name]):
+                        return False
+                return True
+            
+            checks.append(check_object)
+        
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda v: all(check(v) for check in checks)
+
+    @staticmethod
+    def _build_field_value_schemas(json_schema: Dict[str, Any], field_index: List[Dict[str, Any]]) -> Dict[str, Tuple[Dict[str, Any], List[str], Optional[Dict[str, Any]]]]:
+        """Map each field key to (field_meta, response path, JSON schema node of its value)."""
+        field_schemas = {}
+        for field_meta in field_index:
+            if field_meta.get("is_virtual_container_child"):
+                continue
+            
+            value_path = field_meta.get("level_keys", []) + [field_meta.get("property_key")]
+            node: Optional[Dict[str, Any]] = json_schema
+            for key in value_path:
+                node = node.get("properties", {}).get(key) if node is not None else None
+            field_schemas[field_meta.get("key")] = (field_meta, value_path, node)
+        return field_schemas
+
     def _apply_custom_validators(self, data: Dict[str, Any], field_index: List[Dict[str, Any]], errors: List[str]) -> None:
         """Apply custom validators to each field (no value transformation)."""
         for field_meta in field_index:
@@ -694,30 +1468,34 @@ class SchemaEngine:
             if value is None:
                 continue  # Skip null values (already validated by JSON schema)
             
-            target_type = field_meta.get("target_type")
-            if not target_type:
-                continue
-            
-            # Get validator (instance overrides global)
-            validator = self.__instance_validator_registry.get(target_type) or _get_validator(target_type)
-            
-            if validator:
-                try:
-                    # Instance validators use: (engine, value, field_metadata)
-                    # Global validators use: (engine, value)
-                    if target_type in self.__instance_validator_registry:
-                        is_valid, error_msg = validator(self, value, field_meta)
-                    else:
-                        is_valid, error_msg = validator(self, value)
-                    
-                    if not is_valid and error_msg:
-                        field_path_str = '.'.join(str(p) for p in field_path)
-                        errors.append(f"{field_path_str}: {error_msg}")
-                        
-                except Exception as e:
+            self._run_custom_validator(field_meta, value, field_path, errors)
+
+    def _run_custom_validator(self, field_meta: Dict[str, Any], value: Any, field_path: List[str], errors: List[str]) -> None:
+        """Run the custom validator of one field's target type, appending any error."""
+        target_type = field_meta.get("target_type")
+        if not target_type:
+            return
+        
+        # Get validator (instance overrides global)
+        validator = self.__instance_validator_registry.get(target_type) or _get_validator(target_type)
+        
+        if validator:
+            try:
+                # Instance validators use: (engine, value, field_metadata)
+                # Global validators use: (engine, value)
+                if target_type in self.__instance_validator_registry:
+                    is_valid, error_msg = validator(self, value, field_meta)
+                else:
+                    is_valid, error_msg = validator(self, value)
+                
+                if not is_valid and error_msg:
                     field_path_str = '.'.join(str(p) for p in field_path)
-                    logger.error(f"Validator error for {field_path_str}: {e}")
-                    errors.append(f"{field_path_str}: Validator exception: {str(e)}")
+                    errors.append(f"{field_path_str}: {error_msg}")
+                    
+            except Exception as e:
+                field_path_str = '.'.join(str(p) for p in field_path)
+                logger.error(f"Validator error for {field_path_str}: {e}")
+                errors.append(f"{field_path_str}: Validator exception: {str(e)}")
 
     def _build_field_path(self, field_meta: Dict[str, Any]) -> List[str]:
         """Build path to field from metadata (e.g., ['fields', 'Patient Name'])."""
@@ -1409,6 +2187,9 @@ class SchemaEngine:
         json_schema = schema_data["json_schema"]
         field_index = schema_data["field_index"]
         table_name = schema_data["table_name"]
+        # Descriptions change, so container schemas copied from the previous ones are stale
+        schema_data["container_schemas"] = {}
+        schema_data["schema_bytes"] = {}
         
         unmatched_keys: List[str] = []
         
@@ -1445,6 +2226,7 @@ class SchemaEngine:
         self,
         table_identifier: Union[int, str],
         overrides: Dict[str, Dict[str, Any]],
+        container_path: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Return a deep-copied schema with per-field overrides applied.
@@ -1461,20 +2243,47 @@ class SchemaEngine:
                   - "prepend": Prepends new description to beginning of existing with space separator
                 - "value" key: When supplied, the property schema will be replaced with a const
                   schema after successful validation.
+            container_path: If given, start from get_container_schema(table_identifier, container_path)
+                instead of the full schema. Overrides for fields outside the container are skipped
+                with a warning.
 
         Returns:
-            A deep copy of the registered JSON schema with overrides applied.
+            A deep copy of the registered JSON schema (or container schema) with overrides applied.
         """
         if not isinstance(overrides, dict):
             raise TypeError("overrides must be a dictionary.")
 
         table_id = self.resolve_table_id(table_identifier)
         schema_data = self.__tables[table_id]
-        original_schema = schema_data["json_schema"]
-        field_index = schema_data["field_index"]
-        table_name = schema_data["table_name"]
+        if container_path is None:
+            original_schema = schema_data["json_schema"]
+        else:
+            original_schema = self.get_container_schema(table_id, container_path)
 
         schema_copy = deepcopy(original_schema)
+        self._apply_schema_overrides(schema_data, schema_copy, overrides)
+        return schema_copy
+
+    def _apply_schema_overrides(
+        self,
+        schema_data: Dict[str, Any],
+        schema_copy: Dict[str, Any],
+        overrides: Dict[str, Dict[str, Any]],
+        copy_on_write: bool = False,
+    ) -> List[Tuple[str, ...]]:
+        """
+        Apply per-field overrides (see get_schema_with_overrides) in place to a copy of a registered schema.
+
+        With copy_on_write, schema_copy only needs to be a shallow copy of the root: the objects on
+        the path to each overridden property are copied, and the property schema deep-copied,
+        before it is changed.
+
+        Returns:
+            The paths (level keys and property key) of the overridden property schemas.
+        """
+        field_index = schema_data["field_index"]
+        table_name = schema_data["table_name"]
+        overridden_paths: List[Tuple[str, ...]] = []
 
         _missing = object()
 
@@ -1692,6 +2501,9 @@ class SchemaEngine:
                 if not isinstance(properties, dict) or key not in properties:
                     current = None
                     break
+                if copy_on_write:
+                    properties = current["properties"] = dict(properties)
+                    properties[key] = dict(properties[key])
                 current = properties[key]
 
             if current is None:
@@ -1707,9 +2519,13 @@ class SchemaEngine:
                 )
                 continue
 
+            if copy_on_write:
+                properties = current["properties"] = dict(properties)
+                properties[property_key] = deepcopy(properties[property_key])
             prop_schema = properties[property_key]
             original_description = prop_schema.get("description")
             original_title = prop_schema.get("title")
+            overridden_paths.append(tuple(level_keys) + (property_key,))
 
             if constant_override is not _missing:
                 prop_schema_for_validation = deepcopy(prop_schema)
@@ -1768,7 +2584,7 @@ class SchemaEngine:
                         prop_schema, description_override, description_op, original_description
                     )
 
-        return schema_copy
+        return overridden_paths
 
     def reverse_map(
         self,
@@ -1839,77 +2655,238 @@ class SchemaEngine:
         if table_name not in self.__table_names:
             raise ValueError(f"Table '{table_name}' not registered")
         
-        # Validate formatter set exists
-        if formatter_name not in self.__named_formatter_sets:
-            raise ValueError(f"Formatter set '{formatter_name}' is not registered. "
-                            f"Available formatter sets: {list(self.__named_formatter_sets.keys())}")
+        schema_data = self.__tables[self.__table_names[table_name]]
+        return self._reverse_map_record(
+            schema_data, model_response, None, formatter_name, group_by_containers,
+            properties_key, pack_properties_as, pack_containers_as, metadata_field_overrides
+        )
+
+    def reverse_map_many(
+        self,
+        table_name: str,
+        model_response: Dict[str, Any],
+        targets: Dict[str, Dict[str, Any]],
+        model_values: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Produce several reverse_map outputs from one model response, extracting each field value once.
         
-        # Validate pack_properties_as parameter
-        if pack_properties_as not in ["object", "array"]:
-            raise ValueError(f"pack_properties_as must be 'object' or 'array', got '{pack_properties_as}'")
+        Args:
+            table_name: The name of the registered table
+            model_response: The JSON response from the model
+            targets: Dict mapping output name to the reverse_map keyword arguments for that output
+                (formatter_name, group_by_containers, properties_key, pack_properties_as,
+                pack_containers_as, metadata_field_overrides). Example: {
+                    "ui": {"formatter_name": "ui-app", "group_by_containers": ["sections"]},
+                    "audit": {"formatter_name": "default"}
+                }
+            model_values: Optional values already extracted with extract_model_values()
         
-        # Validate pack_containers_as parameter
-        if pack_containers_as not in ["object", "array"]:
-            raise ValueError(f"pack_containers_as must be 'object' or 'array', got '{pack_containers_as}'")
+        Returns:
+            Dict mapping each output name to the same result reverse_map would return for its arguments
+        
+        Raises:
+            ValueError: Same conditions as reverse_map, for any target
+            TypeError: If a target contains an unknown argument
+        """
+        if table_name not in self.__table_names:
+            raise ValueError(f"Table '{table_name}' not registered")
+        
+        if model_values is None:
+            model_values = self.extract_model_values(table_name, model_response)
+        
+        schema_data = self.__tables[self.__table_names[table_name]]
+        return {
+            output_name: self._reverse_map_record(schema_data, model_response, model_values, **target)
+            for output_name, target in targets.items()
+        }
+
+    def reverse_map_delta(
+        self,
+        table_name: str,
+        model_response: Dict[str, Any],
+        previous_response: Optional[Dict[str, Any]] = None,
+        previous_state: Optional[Dict[str, Any]] = None,
+        formatter_name: str = "default",
+        group_by_containers: Optional[List[str]] = None,
+        properties_key: str = "properties",
+        pack_properties_as: str = "object",
+        pack_containers_as: str = "array",
+        metadata_field_overrides: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], List[str], Dict[str, Any]]:
+        """
+        Reverse map a model response that differs from an earlier one in a few fields.
+        
+        Field values are diffed by field path against the earlier response. With previous_state (the
+        state returned by an earlier call) only changed fields run their formatters; the formatted
+        results of unchanged fields are reused and shared with the earlier output. With only
+        previous_response the changed keys are reported but every field is formatted.
+        
+        Args:
+            table_name: The name of the registered table
+            model_response: The new JSON response from the model
+            previous_response: Optional earlier model response to diff against
+            previous_state: Optional state returned by an earlier reverse_map_delta call (takes precedence)
+            formatter_name, group_by_containers, properties_key, pack_properties_as, pack_containers_as,
+            metadata_field_overrides: As in reverse_map
+        
+        Returns:
+            Tuple of (result, changed_keys, state):
+            - result: Same output as reverse_map for model_response
+            - changed_keys: Keys of fields whose value differs, in field order (all keys without a previous response)
+            - state: Pass as previous_state to the next call
+        
+        Raises:
+            ValueError: Same conditions as reverse_map
+        """
+        if table_name not in self.__table_names:
+            raise ValueError(f"Table '{table_name}' not registered")
+        self._check_reverse_map_options(formatter_name, pack_properties_as, pack_containers_as)
         
         table_id = self.__table_names[table_name]
         schema_data = self.__tables[table_id]
-        field_index = schema_data["field_index"]
-        external_schema = schema_data["external_schema"]
+        plan = self._get_formatter_plan(schema_data, formatter_name)
+        model_values = {
+            field_key: self._snapshot_value(value)
+            for field_key, value in self.extract_model_values(table_id, model_response).items()
+        }
         
-        # Step 1: Format fields as before
-        formatted_results = {}
-        for field_meta in field_index:
-            if field_meta.get("is_virtual_container_child"):
-                continue
-            
-            model_value = self._extract_model_value(model_response, field_meta)
-            target_type = field_meta.get("target_type")
-            
-            if not target_type:
-                logger.error(f"Field {field_meta.get('key', 'unknown')} missing target_type")
-                formatted_results[field_meta.get("key", "unknown")] = {"type": "unknown", "value": None}
-                continue
-            
-            field_result = self._format_field(field_meta, model_value, table_name, formatter_name)
-            
-            # Handle both dict (old style) and list (unpacking style) formatters
-            if isinstance(field_result, list):
-                # Formatter returned list of unpacked fields
-                for item in field_result:
-                    if isinstance(item, dict):
-                        store_key = item.get("_storage_key", item.get("key"))
-                        if store_key is not None:
-                            # Keep the item intact; array packers will decide displayed key
-                            formatted_results[store_key] = item
-            elif isinstance(field_result, dict):
-                # Formatter returned dict (existing behavior)
-                formatted_results.update(field_result)
+        previous_values = None
+        reuse = None
+        if previous_state is not None:
+            previous_values = previous_state["model_values"]
+            # Formatted results are only reusable for the same compiled plan (same table registration and formatters)
+            if previous_state["table_id"] == table_id and previous_state["plan"] is plan:
+                reuse = previous_state
+        elif previous_response is not None:
+            previous_values = self.extract_model_values(table_id, previous_response)
+        
+        changed_keys = [
+            field_key for field_key, value in model_values.items()
+            if previous_values is None or field_key not in previous_values
+            or type(previous_values[field_key]) is not type(value) or previous_values[field_key] != value
+        ]
+        
+        if reuse is not None:
+            changed = set(changed_keys)
+            key_to_container = schema_data["container_grouping"]["key_to_container"]
+            changed_containers = {key_to_container.get(field_key) for field_key in changed_keys}
+            reuse = {
+                "field_results": {
+                    field_key: res for field_key, res in reuse["field_results"].items() if field_key not in changed
+                },
+                # Packed containers are reusable when packed the same way and none of their fields changed
+                "containers": {
+                    container_key: packed for container_key, packed in reuse["containers"].items()
+                    if container_key not in changed_containers
+                } if reuse["pack_properties_as"] == pack_properties_as else {},
+            }
+        
+        record: Dict[str, Dict[str, Any]] = {"field_results": {}, "containers": {}}
+        result = self._reverse_map_record(
+            schema_data, model_response, model_values, formatter_name, group_by_containers, properties_key,
+            pack_properties_as, pack_containers_as, metadata_field_overrides, reuse, record
+        )
+        state = {
+            "table_id": table_id,
+            "plan": plan,
+            "pack_properties_as": pack_properties_as,
+            "model_values": model_values,
+            "field_results": record["field_results"],
+            "containers": record["containers"],
+        }
+        return result, changed_keys, state
+
+    @staticmethod
+    def _snapshot_value(value: Any) -> Any:
+        """Copy container values so later in-place edits of a response do not alter a delta state."""
+        if isinstance(value, list):
+            return [SchemaEngine._snapshot_value(item) for item in value]
+        if isinstance(value, dict):
+            return {key: SchemaEngine._snapshot_value(item) for key, item in value.items()}
+        return value
+
+    def extract_model_values(self, table_identifier: Union[int, str], model_response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the model value of every formattable field in one pass over the field index.
+        
+        Args:
+            table_identifier: Either an integer table ID or string table name
+            model_response: The JSON response from the model
+        
+        Returns:
+            Dict mapping field key to the model value (None when absent)
+        """
+        table_id = self.resolve_table_id(table_identifier)
+        return {
+            field_meta.get("key", "unknown"): self._extract_value_at(model_response, field_meta.get("level_keys", []), field_meta.get("property_key"))
+            for field_meta in self.__tables[table_id]["field_index"]
+            if not field_meta.get("is_virtual_container_child")
+        }
+
+    def _reverse_map_record(
+        self,
+        schema_data: Dict[str, Any],
+        model_response: Dict[str, Any],
+        model_values: Optional[Dict[str, Any]],
+        formatter_name: str = "default",
+        group_by_containers: Optional[List[str]] = None,
+        properties_key: str = "properties",
+        pack_properties_as: str = "object",
+        pack_containers_as: str = "array",
+        metadata_field_overrides: Optional[Dict[str, Any]] = None,
+        reuse: Optional[Dict[str, Dict[str, Any]]] = None,
+        record: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        reverse_map for a resolved table record; values come from model_values when given.
+        
+        reuse / record support reverse_map_delta. Both hold "field_results" ({field_key: formatter result})
+        and "containers" ({container_key: packed properties}): entries in reuse are used as-is instead of
+        being formatted / packed again, and record receives every entry built or reused by this call.
+        """
+        reuse = reuse or {}
+        record = record or {}
+        self._check_reverse_map_options(formatter_name, pack_properties_as, pack_containers_as)
+        
+        table_name = schema_data["table_name"]
+        
+        # Step 1: Format fields using the compiled dispatch plan
+        formatted_results = self._format_plan_entries(
+            self._get_formatter_plan(schema_data, formatter_name), model_response, model_values, table_name,
+            reuse.get("field_results"), record.get("field_results")
+        )
+        
+        return self._assemble_reverse_map_output(
+            schema_data, formatted_results, group_by_containers, properties_key, pack_properties_as,
+            pack_containers_as, metadata_field_overrides, reuse.get("containers"), record.get("containers")
+        )
+
+    def _assemble_reverse_map_output(
+        self,
+        schema_data: Dict[str, Any],
+        formatted_results: Dict[str, Any],
+        group_by_containers: Optional[List[str]],
+        properties_key: str,
+        pack_properties_as: str,
+        pack_containers_as: str,
+        metadata_field_overrides: Optional[Dict[str, Any]],
+        cached_packed: Optional[Dict[str, Any]] = None,
+        packed_out: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Structure formatted field results and add schema metadata (Steps 2-3 of reverse_map)."""
+        external_schema = schema_data["external_schema"]
         
         # Step 2: Structure the data
         if group_by_containers:
             # Group by containers and rename "data" to properties_key
-            grouped_data = self._group_by_containers(formatted_results, field_index, group_by_containers, properties_key, pack_properties_as, pack_containers_as)
+            grouped_data = self._group_by_containers(
+                formatted_results, schema_data["container_grouping"], group_by_containers, properties_key,
+                pack_properties_as, pack_containers_as, cached_packed, packed_out
+            )
         else:
             # Flat output: wrap in array with properties_key
-            if pack_properties_as == "object":
-                grouped_data = [{properties_key: formatted_results}]
-            else:  # array
-                array_properties = []
-                for key, value in formatted_results.items():
-                    display_key = (
-                        value.get("_display_key")
-                        if isinstance(value, dict) and value.get("_display_key") is not None
-                        else (value.get("_original_field_key", key) if isinstance(value, dict) else key)
-                    )
-                    array_item = {"key": display_key}
-                    if isinstance(value, dict):
-                        for k, v in value.items():
-                            if k == "key" or (isinstance(k, str) and k.startswith("_")):
-                                continue
-                            array_item[k] = v
-                    array_properties.append(array_item)
-                grouped_data = [{properties_key: array_properties}]
+            grouped_data = [{properties_key: self._pack_properties(formatted_results, pack_properties_as)}]
         
         # Step 3: Extract schema metadata with overrides
         result = {}
@@ -1960,9 +2937,11 @@ class SchemaEngine:
 
     def _extract_model_value(self, model_response: Dict[str, Any], field_meta: Dict[str, Any]) -> Any:
         """Extract value from model response using field metadata."""
-        level_keys = field_meta.get("level_keys", [])
-        property_key = field_meta.get("property_key")
-        
+        return self._extract_value_at(model_response, field_meta.get("level_keys", []), field_meta.get("property_key"))
+
+    @staticmethod
+    def _extract_value_at(model_response: Dict[str, Any], level_keys: List[str], property_key: Optional[str]) -> Any:
+        """Extract value from model response at level_keys / property_key."""
         # Traverse nested structure
         current = model_response
         for key in level_keys:
@@ -1977,6 +2956,18 @@ class SchemaEngine:
             return current.get(property_key)
         return None
 
+    @staticmethod
+    def _resolve_level(model_response: Dict[str, Any], level_keys: List[str]) -> Optional[Dict[str, Any]]:
+        """Return the object holding the properties at level_keys, or None (see _extract_value_at)."""
+        current = model_response
+        for key in level_keys:
+            if not isinstance(current, dict):
+                return None
+            current = current.get(key)
+            if current is None:
+                return None
+        return current if isinstance(current, dict) else None
+
     def _extract_container_key_field(self, level_keys: List[str]) -> Optional[str]:
         """
         Extract container key field from meta-schema based on level_keys.
@@ -2017,172 +3008,459 @@ class SchemaEngine:
         
         return None
 
-    def _format_field(self, field_meta: Dict[str, Any], model_value: Any, 
-                      table_name: str, formatter_name: str) -> Dict[str, Any]:
-        """Format a single field using the named formatter set."""
-        original_schema_type = field_meta.get("original_schema_type")
-        field_key = field_meta.get("key", "unknown")
+    def iter_reverse_map(
+        self,
+        table_name: str,
+        model_response: Dict[str, Any],
+        formatter_name: str = "default",
+        properties_key: str = "properties",
+        pack_properties_as: str = "object",
+        pack_containers_as: str = "array"
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Reverse map a model response one top-level container at a time.
+        
+        Only the fields of the container being yielded are formatted and held in memory, so callers
+        can render or write back each section as soon as it is ready.
+        
+        Args:
+            table_name: The name of the registered table
+            model_response: The JSON response from the model
+            formatter_name: Name of formatter set to use (default: "default")
+            properties_key: Name for the innermost container (default: "properties")
+            pack_properties_as: Format for the innermost container - either "object" or "array" (default: "object")
+            pack_containers_as: Format of each yielded container, as in reverse_map (default: "array"):
+                - "array": {<container_key_field>: <container_key>, <properties_key>: ...}
+                - "object": {<properties_key>: ...}
+        
+        Yields:
+            (container_key, packed_container) pairs in schema order, skipping containers without results.
+            The pairs are the entries reverse_map(..., group_by_containers=[...]) would return.
+        
+        Raises:
+            ValueError: Same conditions as reverse_map, raised on the first iteration
+        """
+        if table_name not in self.__table_names:
+            raise ValueError(f"Table '{table_name}' not registered")
+        
+        self._check_reverse_map_options(formatter_name, pack_properties_as, pack_containers_as)
+        
+        schema_data = self.__tables[self.__table_names[table_name]]
+        key_to_container = schema_data["container_grouping"]["key_to_container"]
+        container_key_fields = schema_data["container_grouping"]["container_key_fields"]
+        
+        for container_key, entries in self._get_container_plans(schema_data, formatter_name):
+            formatted_results = self._format_plan_entries(entries, model_response, None, table_name)
+            
+            # Same membership rule as _group_by_containers
+            properties = {
+                field_key: field_result
+                for field_key, field_result in formatted_results.items()
+                if self._container_of(field_key, field_result, key_to_container) == container_key
+            }
+            if not properties:
+                continue
+            
+            packed = {}
+            if pack_containers_as == "array" and container_key_fields[container_key]:
+                packed[container_key_fields[container_key]] = container_key
+            packed[properties_key] = self._pack_properties(properties, pack_properties_as)
+            yield container_key, packed
+
+    def iter_reverse_map_batch(
+        self,
+        table_name: str,
+        model_responses: Iterable[Dict[str, Any]],
+        formatter_name: str = "default",
+        group_by_containers: Optional[List[str]] = None,
+        properties_key: str = "properties",
+        pack_properties_as: str = "object",
+        pack_containers_as: str = "array",
+        metadata_field_overrides: Optional[Dict[str, Any]] = None,
+        batch_size: int = 64
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Reverse map many model responses of the same table, formatting one field column at a time.
+        
+        Responses are read batch_size at a time and transposed into per-field value columns. Each
+        field's formatter is then dispatched once per column: through the batch formatter registered
+        with register_batch_reverse_formatter when there is one, otherwise through the scalar
+        formatter for each value. Only one batch is held in memory, and its results are yielded
+        before the next batch is read.
+        
+        Args:
+            table_name: The name of the registered table
+            model_responses: Iterable of JSON responses from the model
+            formatter_name, group_by_containers, properties_key, pack_properties_as,
+            pack_containers_as, metadata_field_overrides: Same as reverse_map
+            batch_size: Number of responses formatted together (default: 64)
+        
+        Yields:
+            For each response, in input order, the result reverse_map would return for it
+        
+        Raises:
+            ValueError: Same conditions as reverse_map, or batch_size < 1, raised on the first iteration
+        """
+        if table_name not in self.__table_names:
+            raise ValueError(f"Table '{table_name}' not registered")
+        
+        self._check_reverse_map_options(formatter_name, pack_properties_as, pack_containers_as)
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        
+        schema_data = self.__tables[self.__table_names[table_name]]
+        plan = self._get_formatter_plan(schema_data, formatter_name)
+        batch_formatter_set = self.__named_batch_formatter_sets.get(formatter_name, {})
+        
+        responses = iter(model_responses)
+        while True:
+            batch = list(islice(responses, batch_size))
+            if not batch:
+                return
+            
+            # Fields sharing level_keys share a parent object: resolve it once per response
+            parent_columns: Dict[Tuple[str, ...], List[Optional[Dict[str, Any]]]] = {}
+            batch_results: List[Dict[str, Any]] = [{} for _ in batch]
+            for field_meta, field_key, level_keys, property_key, formatter in plan:
+                if formatter is None:
+                    logger.error(f"Field {field_key} missing target_type")
+                    for formatted_results in batch_results:
+                        formatted_results[field_key] = {"type": "unknown", "value": None}
+                    continue
+                
+                level_path = tuple(level_keys)
+                parents = parent_columns.get(level_path)
+                if parents is None:
+                    parents = [self._resolve_level(model_response, level_keys) for model_response in batch]
+                    parent_columns[level_path] = parents
+                if property_key:
+                    column = [parent.get(property_key) if parent is not None else None for parent in parents]
+                else:
+                    column = [None] * len(batch)
+                
+                batch_formatter = batch_formatter_set.get(field_meta.get("original_schema_type"))
+                field_results = self._format_column(field_meta, field_key, formatter, batch_formatter, column, table_name)
+                for formatted_results, field_result in zip(batch_results, field_results):
+                    if field_result is not None:
+                        self._merge_field_result(formatted_results, field_result)
+            
+            for formatted_results in batch_results:
+                yield self._assemble_reverse_map_output(
+                    schema_data, formatted_results, group_by_containers, properties_key,
+                    pack_properties_as, pack_containers_as, metadata_field_overrides
+                )
+
+    def _format_column(
+        self,
+        field_meta: Dict[str, Any],
+        field_key: str,
+        formatter: Callable,
+        batch_formatter: Optional[Callable],
+        column: List[Any],
+        table_name: str
+    ) -> List[Any]:
+        """
+        Format one field across a batch of responses.
+        
+        Returns one formatter result per value; None marks a value whose formatter raised, which
+        reverse_map leaves out of the output. A batch formatter that raises, or returns the wrong
+        number of results, is logged and the column is formatted value by value instead.
+        """
+        if batch_formatter is not None:
+            try:
+                field_results = list(batch_formatter(self, field_meta, column, table_name))
+                if len(field_results) == len(column):
+                    return field_results
+                logger.error(f"Batch formatter for field '{field_key}' returned {len(field_results)} results "
+                             f"for {len(column)} values")
+            except Exception as e:
+                logger.error(f"Error batch formatting field '{field_key}' with type '{field_meta.get('original_schema_type')}': {e}")
+        
+        field_results = []
+        for model_value in column:
+            try:
+                field_results.append(formatter(self, field_meta, model_value, table_name))
+            except Exception as e:
+                logger.error(f"Error formatting field '{field_key}' with type '{field_meta.get('original_schema_type')}': {e}")
+                field_results.append(None)
+        return field_results
+
+    def _format_plan_entries(
+        self,
+        entries: List[Tuple[Dict[str, Any], str, List[str], Optional[str], Optional[Callable]]],
+        model_response: Dict[str, Any],
+        model_values: Optional[Dict[str, Any]],
+        table_name: str,
+        cached_results: Optional[Dict[str, Any]] = None,
+        field_results: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the formatters of compiled plan entries; values come from model_values when given.
         
-        # Get formatter set
+        Args:
+            cached_results: Optional {field_key: formatter result} reused instead of calling the formatter
+            field_results: Optional dict that receives {field_key: formatter result} for every formatted field
+        """
+        formatted_results = {}
+        for field_meta, field_key, level_keys, property_key, formatter in entries:
+            if formatter is None:
+                logger.error(f"Field {field_key} missing target_type")
+                formatted_results[field_key] = {"type": "unknown", "value": None}
+                continue
+            
+            if cached_results is not None and field_key in cached_results:
+                field_result = cached_results[field_key]
+            else:
+                if model_values is not None:
+                    model_value = model_values.get(field_key)
+                else:
+                    model_value = self._extract_value_at(model_response, level_keys, property_key)
+                try:
+                    field_result = formatter(self, field_meta, model_value, table_name)
+                except Exception as e:
+                    logger.error(f"Error formatting field '{field_key}' with type '{field_meta.get('original_schema_type')}': {e}")
+                    continue
+            
+            if field_results is not None:
+                field_results[field_key] = field_result
+            
+            self._merge_field_result(formatted_results, field_result)
+        return formatted_results
+
+    @staticmethod
+    def _merge_field_result(formatted_results: Dict[str, Any], field_result: Any) -> None:
+        """Add one formatter result to the formatted results of a response."""
+        # Handle both dict (old style) and list (unpacking style) formatters
+        if isinstance(field_result, list):
+            # Formatter returned list of unpacked fields
+            for item in field_result:
+                if isinstance(item, dict):
+                    store_key = item.get("_storage_key", item.get("key"))
+                    if store_key is not None:
+                        # Keep the item intact; array packers will decide displayed key
+                        formatted_results[store_key] = item
+        elif isinstance(field_result, dict):
+            # Formatter returned dict (existing behavior)
+            formatted_results.update(field_result)
+
+    def _get_container_plans(self, schema_data: Dict[str, Any], formatter_name: str) -> List[Tuple[str, List[Tuple]]]:
+        """Return the compiled dispatch plan split into (container_key, plan entries) in schema order."""
+        plans = schema_data["container_plans"]
+        container_plans = plans.get(formatter_name)
+        if container_plans is None:
+            key_to_container = schema_data["container_grouping"]["key_to_container"]
+            by_container: Dict[str, List[Tuple]] = {
+                container_key: [] for container_key in schema_data["container_grouping"]["container_key_fields"]
+            }
+            for entry in self._get_formatter_plan(schema_data, formatter_name):
+                container_key = key_to_container.get(entry[1])
+                if container_key is not None:
+                    by_container[container_key].append(entry)
+            container_plans = list(by_container.items())
+            plans[formatter_name] = container_plans
+        return container_plans
+
+    def _check_reverse_map_options(self, formatter_name: str, pack_properties_as: str, pack_containers_as: str) -> None:
+        """Raise ValueError for an unknown formatter set or invalid packing options."""
+        # Validate formatter set exists
+        if formatter_name not in self.__named_formatter_sets:
+            raise ValueError(f"Formatter set '{formatter_name}' is not registered. "
+                            f"Available formatter sets: {list(self.__named_formatter_sets.keys())}")
+        
+        # Validate pack_properties_as parameter
+        if pack_properties_as not in ["object", "array"]:
+            raise ValueError(f"pack_properties_as must be 'object' or 'array', got '{pack_properties_as}'")
+        
+        # Validate pack_containers_as parameter
+        if pack_containers_as not in ["object", "array"]:
+            raise ValueError(f"pack_containers_as must be 'object' or 'array', got '{pack_containers_as}'")
+
+    def _get_formatter_plan(self, schema_data: Dict[str, Any], formatter_name: str) -> List[Tuple[Dict[str, Any], str, List[str], Optional[str], Optional[Callable]]]:
+        """Return the compiled dispatch plan of a table for a formatter set, compiling it on first use."""
+        plans = schema_data["formatter_plans"]
+        plan = plans.get(formatter_name)
+        if plan is None:
+            plan = self._compile_formatter_plan(schema_data["field_index"], formatter_name)
+            plans[formatter_name] = plan
+        return plan
+
+    def _compile_formatter_plan(self, field_index: List[Dict[str, Any]], formatter_name: str) -> List[Tuple[Dict[str, Any], str, List[str], Optional[str], Optional[Callable]]]:
+        """
+        Resolve, once per (table, formatter set), which formatter handles each field.
+        
+        Args:
+            field_index: Field metadata index of the table
+            formatter_name: Name of the formatter set
+        
+        Returns:
+            List of (field_meta, field_key, level_keys, property_key, formatter) in field order.
+            Virtual container children are left out; formatter is None for fields missing target_type.
+        """
         formatter_set = self.__named_formatter_sets.get(formatter_name, {})
+        plan = []
+        for field_meta in field_index:
+            if field_meta.get("is_virtual_container_child"):
+                continue
+            
+            field_key = field_meta.get("key", "unknown")
+            formatter = None
+            if field_meta.get("target_type"):
+                # Look up formatter by original schema type ONLY
+                original_schema_type = field_meta.get("original_schema_type")
+                formatter = formatter_set.get(original_schema_type)
+                if not formatter:
+                    logger.error(f"No formatter for original type '{original_schema_type}' "
+                                f"in formatter set '{formatter_name}' (field: {field_key})")
+                    continue
+            
+            plan.append((field_meta, field_key, field_meta.get("level_keys", []), field_meta.get("property_key"), formatter))
+        return plan
+
+    def _build_container_grouping(self, field_index: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Precompute the field-key -> top-level container mapping used by _group_by_containers.
         
-        # Look up formatter by original schema type ONLY
-        formatter = formatter_set.get(original_schema_type)
+        Args:
+            field_index: Field metadata index of the table
         
-        if not formatter:
-            logger.error(f"No formatter for original type '{original_schema_type}' "
-                        f"in formatter set '{formatter_name}' (field: {field_key})")
-            return {}
+        Returns:
+            Dict with:
+            - "key_to_container": {field_key: container_key} (e.g., "Cust_A_1" -> "A" for level key "A.Admission")
+            - "container_key_fields": {container_key: key_field} in schema order (the output skeleton)
+        """
+        key_to_container: Dict[str, str] = {}
+        container_key_fields: Dict[str, Optional[str]] = {}
+        container_name = self.__meta_schema.get("container", {}).get("container_name")
         
-        try:
-            return formatter(self, field_meta, model_value, table_name)
-        except Exception as e:
-            logger.error(f"Error formatting field '{field_key}' with type '{original_schema_type}': {e}")
-            return {}
+        for field_meta in field_index:
+            field_key = field_meta.get("key")
+            level_keys = field_meta.get("level_keys", [])
+            key_field = field_meta.get("key_field")
+            
+            if not key_field:
+                continue
+            
+            # Only top-level containers group fields; the next level key is the container key
+            if len(level_keys) > 1 and level_keys[0] == container_name:
+                container_key = level_keys[1].split(".")[0]  # Extract "A" from "A.Admission"
+                key_to_container[field_key] = container_key
+                container_key_fields.setdefault(container_key, key_field)
+            else:
+                key_to_container.pop(field_key, None)
+        
+        return {
+            "key_to_container": key_to_container,
+            "container_key_fields": container_key_fields,
+        }
+
+    @staticmethod
+    def _container_of(field_key: str, field_result: Any, key_to_container: Dict[str, str]) -> Optional[str]:
+        """Return the top-level container key a formatted result belongs to, or None."""
+        container_key = key_to_container.get(field_key)
+        
+        # Unpacked results are stored under a storage key; fall back to the original field key
+        if container_key is None and isinstance(field_result, dict) and "_original_field_key" in field_result:
+            container_key = key_to_container.get(field_result["_original_field_key"])
+        return container_key
+
+    @staticmethod
+    def _pack_properties(properties: Dict[str, Any], pack_properties_as: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Pack formatted field results as an object (as-is) or as an array of items.
+        
+        Array items carry the display key under "key" and drop internal "_"-prefixed metadata.
+        """
+        if pack_properties_as == "object":
+            return properties
+        
+        array_properties = []
+        for key, value in properties.items():
+            if not isinstance(value, dict):
+                array_properties.append({"key": key})
+                continue
+            
+            display_key = value.get("_display_key")
+            if display_key is None:
+                display_key = value.get("_original_field_key", key)
+            array_item = {"key": display_key}
+            for k, v in value.items():
+                if k == "key" or (isinstance(k, str) and k.startswith("_")):
+                    continue
+                array_item[k] = v
+            array_properties.append(array_item)
+        return array_properties
 
     def _group_by_containers(
         self,
         formatted_results: Dict[str, Dict[str, Any]],
-        field_index: List[Dict[str, Any]],
+        container_grouping: Dict[str, Any],
         container_names: List[str],
         properties_key: str = "properties",
         pack_properties_as: str = "object",
-        pack_containers_as: str = "array"
+        pack_containers_as: str = "array",
+        cached_packed: Optional[Dict[str, Any]] = None,
+        packed_out: Optional[Dict[str, Any]] = None
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Group formatted results by container hierarchy.
         
         Args:
             formatted_results: Dict mapping field key to {"type": <label>, "value": <payload>}
-            field_index: Field metadata index
+            container_grouping: Precomputed grouping maps from _build_container_grouping
             container_names: List of container names to group by (e.g., ["sections"])
             properties_key: Name for the innermost container (default: "properties")
             pack_properties_as: Format for the innermost container - either "object" or "array" (default: "object")
             pack_containers_as: Format for container layers - either "array" or "object" (default: "array")
+            cached_packed: Optional {container_key: packed properties} reused instead of packing again
+            packed_out: Optional dict that receives {container_key: packed properties} for every container
         
         Returns:
             List of dicts when pack_containers_as="array", or Dict when pack_containers_as="object"
         """
-        # Build mapping of field keys to their container paths
-        key_to_container = {}
-        for field_meta in field_index:
-            field_key = field_meta.get("key")
-            level_keys = field_meta.get("level_keys", [])
-            key_field = field_meta.get("key_field")
-            
-            if not key_field:
-                continue
-            
-            # Extract container path up to the grouping level
-            container_path = []
-            container_name = self.__meta_schema.get("container", {}).get("container_name")
-            
-            for i, level_key in enumerate(level_keys):
-                # Check if this level matches the container name from meta-schema
-                if level_key == container_name and i == 0:
-                    # This is the top-level container - extract the actual container key
-                    # The next level_key should be the container key (e.g., "A.Admission")
-                    if i + 1 < len(level_keys):
-                        container_key = level_keys[i + 1].split(".")[0]  # Extract "A" from "A.Admission"
-                        container_path.append((container_key, field_meta))
-                    break
-            
-            key_to_container[field_key] = container_path
+        key_to_container = container_grouping["key_to_container"]
+        container_key_fields = container_grouping["container_key_fields"]
         
-        # Group results by container
-        groups = {}
+        # Single linear fill of the precomputed skeleton
+        groups: Dict[str, Dict[str, Any]] = {container_key: {} for container_key in container_key_fields}
         for field_key, field_result in formatted_results.items():
-            # Try to find container path for this field key
-            container_path = key_to_container.get(field_key, [])
-            
-            # If not found, check if the field_result contains original field metadata
-            if not container_path and isinstance(field_result, dict) and "_original_field_key" in field_result:
-                original_field_key = field_result["_original_field_key"]
-                container_path = key_to_container.get(original_field_key, [])
-            
-            if not container_path:
-                # No container, skip or add to root
+            container_key = self._container_of(field_key, field_result, key_to_container)
+            if container_key is None:
+                # No container, skip
                 continue
             
-            # Use the last container in path as grouping key
-            container_key, container_meta = container_path[-1]
-            
-            if container_key not in groups:
-                # Create new group with container key field
-                groups[container_key] = {
-                    "_container_meta": container_meta,
-                    "properties": {}
-                }
-            
             # Store full field_result; we'll strip internal metadata at output assembly time
-            groups[container_key]["properties"][field_key] = field_result
+            groups[container_key][field_key] = field_result
+        
+        packed_groups = {}
+        for container_key, properties in groups.items():
+            if not properties:
+                continue
+            if cached_packed is not None and container_key in cached_packed:
+                packed = cached_packed[container_key]
+            else:
+                packed = self._pack_properties(properties, pack_properties_as)
+            if packed_out is not None:
+                packed_out[container_key] = packed
+            packed_groups[container_key] = packed
         
-        # Convert to list/dict and add container key fields
         if pack_containers_as == "array":
-            # Existing array logic
             result = []
-            for container_key, group_data in groups.items():
-                container_meta = group_data["_container_meta"]
-                
-                # Get container key field name from meta-schema
-                # The container's "key" field tells us which property holds the container identifier
-                container_key_field = container_meta.get("key_field")  # e.g., "sectionCode"
-                
+            for container_key, packed in packed_groups.items():
                 group = {}
+                # The container's "key" field tells us which property holds the container identifier
+                container_key_field = container_key_fields[container_key]  # e.g., "sectionCode"
                 if container_key_field:
                     group[container_key_field] = container_key
-                
-                # Format properties based on pack_properties_as
-                if pack_properties_as == "object":
-                    group[properties_key] = group_data["properties"]
-                else:  # array
-                    array_properties = []
-                    for key, value in group_data["properties"].items():
-                        display_key = (
-                            value.get("_display_key")
-                            if isinstance(value, dict) and value.get("_display_key") is not None
-                            else (value.get("_original_field_key", key) if isinstance(value, dict) else key)
-                        )
-                        array_item = {"key": display_key}
-                        if isinstance(value, dict):
-                            for k, v in value.items():
-                                if k == "key" or (isinstance(k, str) and k.startswith("_")):
-                                    continue
-                                array_item[k] = v
-                        array_properties.append(array_item)
-                    group[properties_key] = array_properties
-                
+                group[properties_key] = packed
                 result.append(group)
             
             return result
         else:  # pack_containers_as == "object"
-            # New object packing logic
-            result = {}
-            for container_key, group_data in groups.items():
-                # Format properties based on pack_properties_as (same as array case)
-                if pack_properties_as == "object":
-                    properties_data = group_data["properties"]
-                else:  # array
-                    array_properties = []
-                    for key, value in group_data["properties"].items():
-                        display_key = (
-                            value.get("_display_key")
-                            if isinstance(value, dict) and value.get("_display_key") is not None
-                            else (value.get("_original_field_key", key) if isinstance(value, dict) else key)
-                        )
-                        array_item = {"key": display_key}
-                        if isinstance(value, dict):
-                            for k, v in value.items():
-                                if k == "key" or (isinstance(k, str) and k.startswith("_")):
-                                    continue
-                                array_item[k] = v
-                        array_properties.append(array_item)
-                    properties_data = array_properties
-                
-                # Use container_key as the object key
-                result[container_key] = {properties_key: properties_data}
-            
-            return result
+            # Use container_key as the object key
+            return {
+                container_key: {properties_key: packed}
+                for container_key, packed in packed_groups.items()
+            }
 
 
 # ----------------------------- Default Schema Builders -----------------------------
@@ -0,0 +1,420 @@
+"""Incremental ingestion of streamed model output (e.g., `stream=True` LLM responses).
+
+The parser consumes text chunks as they arrive, builds the response object on the fly and,
+driven by the registered table's field index and JSON schema, emits events as soon as they
+can be decided instead of after `json.loads` on the complete text:
+
+- {"event": "field", "key", "path", "value", "is_valid", "errors"}
+    A field's value has closed; it was validated on the spot with `SchemaEngine.validate_field`.
+- {"event": "error", "path", "message"}
+    A structural error: a property the schema does not define, a container of the wrong type,
+    or required properties missing when an object closes. Parsing continues.
+- {"event": "syntax_error", "message", "offset"}
+    The text is not valid JSON. The parser stops; further feed() calls raise ValueError.
+- {"event": "complete", "value"}
+    The top-level object closed; value is the full parsed response.
+
+Usage:
+    parser = IncrementalResponseParser(engine, table_name)
+    for chunk in stream:
+        for event in parser.feed(chunk):
+            if event["event"] in ("error", "syntax_error"):
+                ...  # abort or re-prompt early
+    parser.close()
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .schema_engine import SchemaEngine
+
+# Characters that end a run of plain string content
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER_CHARS = frozenset("+-0123456789.eE")
+_LITERALS = {"true": True, "false": False, "null": None}
+_WHITESPACE = frozenset(" \t\r\n")
+
+
+def _schema_allows(node: Dict[str, Any], json_type: str) -> bool:
+    """Check whether a JSON schema node's "type" admits json_type (nodes without a type admit anything)."""
+    node_type = node.get("type")
+    if node_type is None:
+        return True
+    if isinstance(node_type, list):
+        return json_type in node_type
+    return node_type == json_type
+
+
+def _json_type_of(value: Any) -> str:
+    """Return the JSON type name of a parsed value."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+class IncrementalResponseParser:
+    """Incremental JSON parser for one model response of a registered table."""
+
+    def __init__(self, engine: SchemaEngine, table_identifier: Union[int, str], validate_fields: bool = True) -> None:
+        """
+        Args:
+            engine: The schema engine the table is registered with
+            table_identifier: Either an integer table ID or string table name
+            validate_fields: If True, validate each field value as soon as it closes (default: True)
+        """
+        self._engine = engine
+        self._table_id = engine.resolve_table_id(table_identifier)
+        self._schema = engine.get_json_schema(self._table_id)
+        self._validate_fields = validate_fields
+
+        # Response path (level_keys + property_key) -> field key, for every formattable field
+        self._field_paths: Dict[Tuple[str, ...], str] = {}
+        for field_meta in engine.get_field_metadata(self._table_id):
+            if field_meta.get("is_virtual_container_child"):
+                continue
+            path = tuple(field_meta.get("level_keys", [])) + (field_meta.get("property_key"),)
+            self._field_paths[path] = field_meta.get("key")
+
+        # Open containers: {"type", "value", "path", "node", "field_key", "key", "child_node", "child_field_key", "state"}
+        self._stack: List[Dict[str, Any]] = []
+        self._result: Optional[Dict[str, Any]] = None
+        self._done = False
+        self._failed = False
+        self._offset = 0
+        self._events: List[Dict[str, Any]] = []
+
+        # Token in progress: ("string", raw_chars, escape_pending) | ("number", chars) | ("literal", chars)
+        self._token: Optional[List[Any]] = None
+        self._is_key = False
+
+    # ----------------------------- Public API ---------------------------------
+
+    @property
+    def result(self) -> Optional[Dict[str, Any]]:
+        """The response object parsed so far (complete once a "complete" event was emitted)."""
+        return self._result
+
+    @property
+    def done(self) -> bool:
+        """True once the top-level object has closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Consume the next text chunk of the stream.
+
+        Returns:
+            Events decided by this chunk, in stream order
+
+        Raises:
+            ValueError: If called after a syntax error
+        """
+        if self._failed:
+            raise ValueError("Parser stopped after a syntax error")
+
+        self._events = []
+        i = 0
+        n = len(chunk)
+        while i < n and not self._failed:
+            i = self._step(chunk, i, n)
+        self._offset += n
+        return self._events
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Signal the end of the stream.
+
+        Returns:
+            A syntax_error event if the stream ended before the top-level object closed, else no events
+        """
+        self._events = []
+        if not self._failed and not self._done:
+            self._syntax_error("Unexpected end of stream", 0)
+        return self._events
+
+    # --------------------------- Tokenizer ------------------------------------
+
+    def _step(self, chunk: str, i: int, n: int) -> int:
+        """Consume input starting at chunk[i]; return the index of the first unconsumed character."""
+        token = self._token
+        if token is not None:
+            kind = token[0]
+            if kind == "string":
+                return self._continue_string(chunk, i, n)
+            if kind == "number":
+                while i < n and chunk[i] in _NUMBER_CHARS:
+                    token[1].append(chunk[i])
+                    i += 1
+                if i < n:
+                    self._token = None
+                    self._finish_number("".join(token[1]), i)
+                return i
+            # literal
+            while i < n and chunk[i].isalpha():
+                token[1].append(chunk[i])
+                i += 1
+            if i < n:
+                self._token = None
+                self._finish_literal("".join(token[1]), i)
+            return i
+
+        ch = chunk[i]
+        if ch in _WHITESPACE:
+            return i + 1
+
+        if self._done:
+            self._syntax_error("Unexpected data after the top-level object", i)
+            return n
+
+        frame = self._stack[-1] if self._stack else None
+        state = frame["state"] if frame else "value"
+
+        if state == "key":
+            if ch == '"':
+                self._is_key = True
+                self._token = ["string", [], False]
+                return i + 1
+            if ch == "}" and not frame["value"]:
+                self._close_container(i)
+                return i + 1
+            self._syntax_error(f"Expected property name, got {ch!r}", i)
+            return n
+
+        if state == "colon":
+            if ch == ":":
+                frame["state"] = "value"
+                return i + 1
+            self._syntax_error(f"Expected ':', got {ch!r}", i)
+            return n
+
+        if state == "comma":
+            if ch == ",":
+                frame["state"] = "key" if frame["type"] == "object" else "value"
+                return i + 1
+            if (ch == "}" and frame["type"] == "object") or (ch == "]" and frame["type"] == "array"):
+                self._close_container(i)
+                return i + 1
+            self._syntax_error(f"Expected ',' or closing bracket, got {ch!r}", i)
+            return n
+
+        # state == "value"
+        if ch == "]" and frame is not None and frame["type"] == "array" and not frame["value"]:
+            self._close_container(i)
+            return i + 1
+        if frame is None and ch != "{":
+            self._syntax_error("Response must be a JSON object", i)
+            return n
+        if ch == "{":
+            self._open_container("object", {}, i)
+            return i + 1
+        if ch == "[":
+            self._open_container("array", [], i)
+            return i + 1
+        if ch == '"':
+            self._is_key = False
+            self._token = ["string", [], False]
+            return i + 1
+        if ch in _NUMBER_CHARS:
+            self._token = ["number", [ch]]
+            return i + 1
+        if ch.isalpha():
+            self._token = ["literal", [ch]]
+            return i + 1
+        self._syntax_error(f"Unexpected character {ch!r}", i)
+        return n
+
+    def _continue_string(self, chunk: str, i: int, n: int) -> int:
+        """Consume string content; finish the string at its closing quote."""
+        token = self._token
+        raw = token[1]
+        while i < n:
+            if token[2]:
+                # Character after a backslash is always part of the string
+                raw.append(chunk[i])
+                token[2] = False
+                i += 1
+                continue
+            match = _STRING_SPECIAL.search(chunk, i)
+            if match is None:
+                raw.append(chunk[i:])
+                return n
+            j = match.start()
+            raw.append(chunk[i:j])
+            if chunk[j] == "\\":
+                raw.append("\\")
+                token[2] = True
+                i = j + 1
+                continue
+            # Closing quote
+            self._token = None
+            try:
+                text = json.loads('"' + "".join(raw) + '"')
+            except ValueError as e:
+                self._syntax_error(f"Invalid string: {e}", j)
+                return n
+            if self._is_key:
+                self._on_key(text)
+            else:
+                self._on_value(text)
+            return j + 1
+        return n
+
+    def _finish_number(self, text: str, i: int) -> None:
+        try:
+            value = json.loads(text)
+        except ValueError:
+            self._syntax_error(f"Invalid number {text!r}", i)
+            return
+        self._on_value(value)
+
+    def _finish_literal(self, text: str, i: int) -> None:
+        if text not in _LITERALS:
+            self._syntax_error(f"Invalid literal {text!r}", i)
+            return
+        self._on_value(_LITERALS[text])
+
+    def _syntax_error(self, message: str, i: int) -> None:
+        self._failed = True
+        self._events.append({"event": "syntax_error", "message": message, "offset": self._offset + i})
+
+    # ------------------------- Structure tracking -----------------------------
+
+    def _child_context(self) -> Tuple[List[Any], Optional[Dict[str, Any]], Optional[str]]:
+        """Return (path, schema node, field key) of the value about to start in the current container."""
+        if not self._stack:
+            return [], self._schema, None
+        frame = self._stack[-1]
+        if frame["type"] == "array":
+            # Array items are inside a field value (or untracked); they are not checked structurally
+            return frame["path"] + [len(frame["value"])], None, None
+        return frame["path"] + [frame["key"]], frame["child_node"], frame["child_field_key"]
+
+    def _check_container_type(self, path: List[Any], node: Optional[Dict[str, Any]], field_key: Optional[str], json_type: str) -> None:
+        """Report a value whose JSON type cannot match its schema node (field values are left to validation)."""
+        if node is None or field_key is not None:
+            return
+        if not _schema_allows(node, json_type):
+            self._events.append({
+                "event": "error",
+                "path": path,
+                "message": f"Expected {node.get('type')}, got {json_type}",
+            })
+
+    def _open_container(self, container_type: str, value: Any, i: int) -> None:
+        path, node, field_key = self._child_context()
+        self._check_container_type(path, node, field_key, container_type)
+
+        if self._stack:
+            self._attach(value)
+        else:
+            self._result = value
+
+        # Only objects outside field values are followed through the schema
+        if container_type != "object" or field_key is not None:
+            node = None
+        self._stack.append({
+            "type": container_type,
+            "value": value,
+            "path": path,
+            "node": node,
+            "field_key": field_key,
+            "key": None,
+            "child_node": None,
+            "child_field_key": None,
+            "state": "key" if container_type == "object" else "value",
+        })
+
+    def _close_container(self, i: int) -> None:
+        frame = self._stack.pop()
+        node = frame["node"]
+        if node is not None:
+            missing = [key for key in node.get("required", []) if key not in frame["value"]]
+            if missing:
+                self._events.append({
+                    "event": "error",
+                    "path": frame["path"],
+                    "message": f"Missing required properties: {missing}",
+                })
+        self._complete_value(frame["value"], frame["path"], frame["field_key"])
+
+    def _on_key(self, key: str) -> None:
+        frame = self._stack[-1]
+        frame["key"] = key
+        frame["state"] = "colon"
+        frame["child_node"] = None
+        frame["child_field_key"] = None
+
+        node = frame["node"]
+        if node is None:
+            return
+        child_path = tuple(frame["path"]) + (key,)
+        properties = node.get("properties", {})
+        if key not in properties:
+            if node.get("additionalProperties", True) is False:
+                self._events.append({
+                    "event": "error",
+                    "path": list(child_path),
+                    "message": f"Unexpected property '{key}'",
+                })
+            return
+        frame["child_node"] = properties[key]
+        frame["child_field_key"] = self._field_paths.get(child_path)
+
+    def _on_value(self, value: Any) -> None:
+        path, node, field_key = self._child_context()
+        self._check_container_type(path, node, field_key, _json_type_of(value))
+        self._attach(value)
+        self._complete_value(value, path, field_key)
+
+    def _attach(self, value: Any) -> None:
+        frame = self._stack[-1]
+        if frame["type"] == "array":
+            frame["value"].append(value)
+        else:
+            frame["value"][frame["key"]] = value
+        frame["state"] = "comma"
+
+    def _complete_value(self, value: Any, path: List[Any], field_key: Optional[str]) -> None:
+        if field_key is not None:
+            event: Dict[str, Any] = {"event": "field", "key": field_key, "path": path, "value": value}
+            if self._validate_fields:
+                event["is_valid"], event["errors"] = self._engine.validate_field(self._table_id, field_key, value)
+            self._events.append(event)
+        if not self._stack:
+            self._done = True
+            self._events.append({"event": "complete", "value": value})
+
+
+def iter_stream_events(
+    engine: SchemaEngine,
+    table_identifier: Union[int, str],
+    chunks: Iterable[str],
+    validate_fields: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse a chunked model response, yielding parser events as soon as they are decided.
+
+    Stops after the first syntax_error event. A stream that ends early yields a final syntax_error.
+
+    Args:
+        engine: The schema engine the table is registered with
+        table_identifier: Either an integer table ID or string table name
+        chunks: Iterable of text chunks (e.g., deltas of a streamed completion)
+        validate_fields: If True, validate each field value as soon as it closes (default: True)
+    """
+    parser = IncrementalResponseParser(engine, table_identifier, validate_fields=validate_fields)
+    for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+            if event["event"] == "syntax_error":
+                return
+    yield from parser.close()
@@ -4,6 +4,8 @@ Tests for PointClickCare Assessment Schema wrapper.
 
 import json
 import unittest
+import io
+import tempfile
 import logging
 from typing import Dict, Any, Optional
 
@@ -20,6 +22,7 @@ from pcc_schema.pcc_assessment_schema import (
     get_section_state,
     get_all_section_states,
 )
+from schema_engine.stream_ingest import iter_stream_events
 
 logger = logging.getLogger(__name__)
 
@@ -1157,6 +1160,125 @@ class TestPCCAssessmentSchema(unittest.TestCase):
         self.assertEqual(len(result["data"]), 1)
         self.assertEqual(result["data"][0]["properties"]["A_1"], {"type": "radio", "value": "c"})  # Wheelchair -> "c"
 
+    def test_option_lookup_maps_precomputed_at_registration(self):
+        """Test that option lookup maps and html_type are stored with field metadata."""
+        pcc = PCCAssessmentSchema()
+        
+        assessment_schema = {
+            "assessmentDescription": "Lookup Assessment",
+            "templateId": 12346,
+            "sections": [
+                {
+                    "sectionCode": "A",
+                    "sectionDescription": "Admission",
+                    "assessmentQuestionGroups": [
+                        {
+                            "groupNumber": "1",
+                            "groupText": "Basic Info",
+                            "questions": [
+                                {
+                                    "questionKey": "A_1",
+                                    "questionNumber": "1",
+                                    "questionText": "Resident arrived via:",
+                                    "questionType": "radh",
+                                    "responseOptions": [
+                                        {"responseText": "<b>Ambulatory</b>", "responseValue": "a"},
+                                        {"responseText": "Stretcher", "responseValue": "b"},
+                                        {"responseText": "Stretcher", "responseValue": "dup"}
+                                    ]
+                                },
+                                {
+                                    "questionKey": "A_2",
+                                    "questionNumber": "2",
+                                    "questionText": "Devices:",
+                                    "questionType": "mcs",
+                                    "responseOptions": [
+                                        {"responseText": "Cane \"quad\"", "responseValue": "c"},
+                                        {"responseText": "Walker", "responseValue": "w"}
+                                    ]
+                                },
+                                {
+                                    "questionKey": "A_3",
+                                    "questionNumber": "3",
+                                    "questionText": "Wounds:",
+                                    "questionType": "gbdy",
+                                    "responseOptions": [
+                                        {"responseText": "Leg", "responseValue": "1"},
+                                        {"responseText": "Head", "responseValue": "0"},
+                                        {"responseText": "Leg", "responseValue": "9"}
+                                    ]
+                                }
+                            ]
+                        }
+                    ]
+                }
+            ]
+        }
+        
+        assessment_id, assessment_name = pcc.register_assessment(2, assessment_schema)
+        fields = {f["key"]: f for f in pcc.get_field_metadata(assessment_id)}
+        
+        radio = fields["A_1"]
+        self.assertEqual(radio["html_type"], "radio_buttons")
+        self.assertEqual(radio["response_text_to_value"], {"<b>Ambulatory</b>": "a", "Stretcher": "b"})
+        # Sanitized texts match model output; first option wins on duplicates
+        self.assertEqual(radio["sanitized_response_text_to_value"], {"Ambulatory": "a", "Stretcher": "b"})
+        
+        multi = fields["A_2"]
+        self.assertEqual(multi["html_type"], "checkbox_multi")
+        self.assertEqual(multi["sanitized_response_text_to_value"], {"Cane quad": "c", "Walker": "w"})
+        
+        # Object-array (gbdy) lookups keep the last option on duplicates
+        table = fields["A_3"]
+        self.assertEqual(table["response_text_to_value"], {"Leg": "9", "Head": "0"})
+        self.assertEqual(table["sanitized_response_text_to_value"], {"Leg": "9", "Head": "0"})
+        
+        model_response = {
+            "table_name": "Lookup Assessment",
+            "sections": {
+                "A.Admission": {
+                    "assessmentQuestionGroups": {
+                        "1.Basic Info": {
+                            "questions": {
+                                "1. Resident arrived via:": "Ambulatory",
+                                "2. Devices:": ["Walker", "Cane quad", "Unknown"],
+                                "3. Wounds:": [{"entry": "Leg", "description": "red"}]
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        
+        result = pcc.reverse_map(assessment_id, model_response, pack_properties_as="object")
+        fields_out = result["sections"]["A"]["fields"]
+        self.assertEqual(fields_out["A_1"]["value"], "a")
+        self.assertEqual(
+            [fields_out[f"A_2__{i}"]["value"] for i in range(3)],
+            ["w", "c", "Unknown"]
+        )
+        
+        default_result = pcc.engine.reverse_map(assessment_name, model_response)
+        properties = default_result["data"][0]["properties"]
+        self.assertEqual(properties["A_2"], {"type": "multi", "value": ["w"]})
+        self.assertEqual(properties["A_3"], {"type": "table", "value": [{"a0_A_3": "9", "b0_A_3": "red"}]})
+
+    def test_streamed_response_field_events(self):
+        """Test incremental parsing of a chunked full assessment response."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        text = json.dumps(model_response, indent=2)
+        chunks = (text[i:i + 7] for i in range(0, len(text), 7))
+        
+        events = list(iter_stream_events(pcc.engine, assessment_id, chunks))
+        
+        field_events = [e for e in events if e["event"] == "field"]
+        expected_keys = [f["key"] for f in pcc.get_field_metadata(assessment_id) if not f.get("is_virtual_container_child")]
+        self.assertEqual(sorted(e["key"] for e in field_events), sorted(expected_keys))
+        self.assertTrue(all(e["is_valid"] for e in field_events))
+        self.assertEqual(events[-1], {"event": "complete", "value": model_response})
+
     def test_pcc_multi_select_reverse(self):
         """Test PCC multi select reverse formatter."""
         pcc = PCCAssessmentSchema()
@@ -5396,6 +5518,211 @@ class TestPCCDatabaseFormat(unittest.TestCase):
         self.assertEqual(len(text_response["responses"]), 1)
         self.assertEqual(text_response["responses"][0], {})
 
+    def test_reverse_map_many_matches_individual_calls(self):
+        """Test that reverse_map_many produces the same outputs as separate calls."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        
+        outputs = pcc.reverse_map_many(assessment_id, model_response, {
+            "ui": {"formatter_name": "pcc-ui"},
+            "audit": {"formatter_name": "default", "pack_containers_as": "array"},
+            "db": {"target": "pcc_db", "assessment_id": 13450054, "patient_id": 37043607},
+        })
+        
+        self.assertEqual(list(outputs), ["ui", "audit", "db"])
+        self.assertEqual(outputs["ui"], pcc.reverse_map(assessment_id, model_response))
+        self.assertEqual(
+            outputs["audit"],
+            pcc.reverse_map(assessment_id, model_response, formatter_name="default", pack_containers_as="array")
+        )
+        self.assertEqual(outputs["db"], pcc.format_to_pcc_db(assessment_id, model_response, 13450054, 37043607))
+
+    def test_iter_reverse_map_matches_reverse_map(self):
+        """Test that iter_reverse_map yields the sections of reverse_map in template order."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        
+        expected = pcc.reverse_map(assessment_id, model_response)["sections"]
+        sections = list(pcc.iter_reverse_map(assessment_id, model_response))
+        self.assertEqual([code for code, _ in sections], list(expected))
+        self.assertEqual(dict(sections), expected)
+        
+        expected = pcc.reverse_map(assessment_id, model_response, formatter_name="default", pack_containers_as="array")["sections"]
+        sections = list(pcc.iter_reverse_map(assessment_id, model_response, formatter_name="default", pack_containers_as="array"))
+        self.assertEqual([section for _, section in sections], expected)
+
+    def test_reverse_map_delta_matches_reverse_map(self):
+        """Test that reverse_map_delta reports changed fields and matches a full reverse_map."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        
+        result, changed_keys, state = pcc.reverse_map_delta(assessment_id, model_response)
+        self.assertEqual(result, pcc.reverse_map(assessment_id, model_response))
+        
+        text_fields = [f for f in pcc.get_field_metadata(assessment_id) if f["target_type"] == "string"][:2]
+        for field_meta in text_fields:
+            node = model_response
+            for key in field_meta["level_keys"]:
+                node = node[key]
+            node[field_meta["property_key"]] = "Updated by reviewer"
+        
+        result, changed_keys, state = pcc.reverse_map_delta(assessment_id, model_response, previous_state=state)
+        self.assertEqual(sorted(changed_keys), sorted(f["key"] for f in text_fields))
+        self.assertEqual(result, pcc.reverse_map(assessment_id, model_response))
+
+    def test_iter_reverse_map_batch_matches_reverse_map(self):
+        """Test that batch reverse mapping with vectorized pcc-ui formatters matches per-response reverse_map."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_responses = [_build_valid_model_response(pcc, assessment_id) for _ in range(3)]
+        model_responses.append({"table_name": "MHCS Nursing Admission Assessment - V 5", "sections": {}})
+        
+        for options in [{}, {"formatter_name": "default"}, {"pack_properties_as": "object", "pack_containers_as": "array"}]:
+            expected = [pcc.reverse_map(assessment_id, response, **options) for response in model_responses]
+            results = list(pcc.iter_reverse_map_batch(assessment_id, iter(model_responses), batch_size=2, **options))
+            self.assertEqual(results, expected)
+
+    def test_iter_reverse_map_batch_after_formatter_override(self):
+        """Test that overriding a pcc-ui formatter also takes effect in batch reverse mapping."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_responses = [_build_valid_model_response(pcc, assessment_id) for _ in range(2)]
+
+        def custom_text_formatter(engine, field_meta, model_value, table_name):
+            return {field_meta["key"]: {"type": "custom", "value": model_value}}
+
+        pcc.engine.register_reverse_formatter("pcc-ui", "txt", custom_text_formatter)
+        expected = [pcc.reverse_map(assessment_id, response) for response in model_responses]
+        self.assertIn('"type": "custom"', json.dumps(expected[0]))
+        self.assertEqual(list(pcc.iter_reverse_map_batch(assessment_id, model_responses)), expected)
+
+    def test_ingest_matches_validate_and_reverse_map(self):
+        """Test that ingest of raw model output matches json.loads + validate + reverse_map."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        
+        raw_response = json.dumps(model_response).encode("utf-8")
+        is_valid, errors, formatted = pcc.ingest(assessment_id, raw_response)
+        self.assertEqual((is_valid, errors), pcc.validate(assessment_id, model_response))
+        self.assertTrue(is_valid)
+        self.assertEqual(formatted, pcc.reverse_map(assessment_id, model_response))
+        
+        text_field = [f for f in pcc.get_field_metadata(assessment_id) if f["target_type"] == "single_select"][0]
+        node = model_response
+        for key in text_field["level_keys"]:
+            node = node[key]
+        node[text_field["property_key"]] = "Not an option"
+        
+        is_valid, errors, formatted = pcc.ingest(assessment_id, json.dumps(model_response), formatter_name="default")
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, pcc.validate(assessment_id, model_response)[1])
+        self.assertEqual(formatted, pcc.reverse_map(assessment_id, model_response, formatter_name="default"))
+
+    def test_pcc_db_layout_precomputed_per_table(self):
+        """Test that format_to_pcc_db reuses one section/group layout per table and rebuilds it on re-registration."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        
+        first = pcc.format_to_pcc_db(assessment_id, model_response, 1, 2)
+        layout = pcc._get_pcc_db_layout(assessment_id)
+        self.assertIs(pcc._get_pcc_db_layout(assessment_id), layout)
+        
+        sections = first["assessments"]["items"]["1"]["sections"]
+        self.assertEqual([section_code for section_code, _ in layout], [s["section_code"] for s in sections])
+        for section_code, groups in layout:
+            group_numbers = [group_number for group_number, _, _ in groups]
+            self.assertEqual(group_numbers, sorted(group_numbers))
+            for _, _, field_metas in groups:
+                self.assertTrue(all(f["original_schema_type"] != "gbdy" for f in field_metas))
+        
+        # Re-registering the template rebuilds the layout from the new field index
+        external_schema = pcc.engine._SchemaEngine__tables[assessment_id]["external_schema"]
+        pcc.register_assessment(assessment_id, external_schema)
+        self.assertIsNot(pcc._get_pcc_db_layout(assessment_id), layout)
+        self.assertEqual(pcc.format_to_pcc_db(assessment_id, model_response, 1, 2), first)
+
+    def test_format_to_pcc_db_batch_writes_json_lines(self):
+        """Test that batch PCC DB conversion streams JSON Lines matching format_to_pcc_db, in and out of process."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        records = [
+            (model_response, 1000 + i, 2000 + i, {"fac_id": 3} if i % 2 else None)
+            for i in range(5)
+        ]
+        expected = [
+            pcc.format_to_pcc_db(assessment_id, response, a_id, p_id, additional_metadata=metadata)
+            for response, a_id, p_id, metadata in records
+        ]
+        
+        self.assertEqual(list(pcc.iter_format_to_pcc_db(assessment_id, iter(records))), expected)
+        
+        sink = io.StringIO()
+        self.assertEqual(pcc.format_to_pcc_db_batch(assessment_id, iter(records), sink), 5)
+        self.assertEqual([json.loads(line) for line in sink.getvalue().splitlines()], expected)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "write_back.jsonl")
+            count = pcc.format_to_pcc_db_batch(assessment_id, iter(records), path, workers=2, chunksize=2)
+            self.assertEqual(count, 5)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual([json.loads(line) for line in f], expected)
+
+    def test_from_pcc_db_round_trips_with_format_to_pcc_db(self):
+        """Test that from_pcc_db inverts format_to_pcc_db into a valid model response."""
+        pcc = PCCAssessmentSchema()
+        assessment_id = 21244981
+        model_response = _build_valid_model_response(pcc, assessment_id)
+        pcc_db = pcc.format_to_pcc_db(assessment_id, model_response, 1, 2)
+        
+        restored = pcc.from_pcc_db(assessment_id, pcc_db)
+        is_valid, errors = pcc.validate(assessment_id, restored)
+        self.assertTrue(is_valid, errors)
+        self.assertEqual(pcc.format_to_pcc_db(assessment_id, restored, 1, 2), pcc_db)
+        self.assertEqual(pcc.from_pcc_db(assessment_id, pcc_db["assessments"]["items"]["1"]), restored)
+        
+        # Option texts, numbers and checkboxes come back as the model wrote them
+        for field_meta in pcc.get_field_metadata(assessment_id):
+            if field_meta.get("is_virtual_container_child") or field_meta["original_schema_type"] in ("gbdy", "chk"):
+                continue
+            self.assertEqual(pcc._extract_model_value(restored, field_meta),
+                             pcc._extract_model_value(model_response, field_meta), field_meta["key"])
+        
+        # Sanitized option texts map to their response values, so they no longer leak into the PCC DB output
+        multi_select = next(
+            f for f in pcc.get_field_metadata(assessment_id)
+            if f["target_type"] == "multiple_select"
+            and any(_sanitize_text_for_model(o["responseText"]) != o["responseText"]
+                    for o in f["field_schema"]["responseOptions"])
+        )
+        responses = [
+            response
+            for section in pcc_db["assessments"]["items"]["1"]["sections"]
+            for group in section["assessment_question_groups"]
+            for response in group["assessment_responses"]
+            if response["question_key"] == multi_select["key"]
+        ]
+        option_values = {o["responseValue"] for o in multi_select["field_schema"]["responseOptions"]}
+        self.assertTrue(set(responses[0]["responses"][0]["response_value"].split(",")) <= option_values)
+        
+        # Unknown question keys are ignored and empty responses are null
+        assessment = json.loads(json.dumps(pcc_db["assessments"]["items"]["1"]))
+        group = assessment["sections"][0]["assessment_question_groups"][0]
+        group["assessment_responses"].append({"question_key": "not_a_question", "responses": [{"response_value": "x"}]})
+        first_question = group["assessment_responses"][0]
+        first_question["responses"] = [{}]
+        restored = pcc.from_pcc_db(assessment_id, assessment)
+        field_meta = next(f for f in pcc.get_field_metadata(assessment_id) if f["key"] == first_question["question_key"])
+        self.assertIsNone(pcc._extract_model_value(restored, field_meta))
+        
+        with self.assertRaises(ValueError):
+            pcc.from_pcc_db(assessment_id, {"assessments": {"items": {}}})
+
     def test_format_to_pcc_db_outputs_to_file(self):
         """Test format_to_pcc_db and save output to JSON file for inspection."""
         pcc = PCCAssessmentSchema()
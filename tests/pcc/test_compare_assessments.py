@@ -8,7 +8,9 @@ import csv
 import tempfile
 import os
 from pathlib import Path
+from unittest import mock
 
+from pcc_schema import compare_assessments
 from pcc_schema.compare_assessments import (
     normalize_response_value,
     is_empty,
@@ -16,13 +18,51 @@ from pcc_schema.compare_assessments import (
     convert_speakcare_to_pcc_db,
     extract_all_fields,
     compare_fields,
+    classify_field_values,
     process_single_file,
     generate_comparison_csv_single,
     process_directory,
     should_process_file,
+    get_pcc_schema,
+    scan_chart_state,
 )
 
 
+def _write_daily_note_charts(directory: str, count: int, states=("draft",)) -> None:
+    """Write count chart files whose vital signs differ from PCC, cycling through states."""
+    for i in range(count):
+        test_data = {
+            "speakcare_chart": {
+                "schema_id": "21242741",
+                "table_name": "MHCS Nursing Daily Skilled Note",
+                "state": states[i % len(states)],
+                "json_internal_filled": [{"internal_json": {
+                    "table_name": "MHCS Nursing Daily Skilled Note",
+                    "sections": {"Cust.MHCS Nursing Daily Skilled Note": {"assessmentQuestionGroups": {
+                        "A": {"questions": {"1. Vital signs": f"Value {i}"}}
+                    }}}
+                }}]
+            },
+            "pcc_assessment": {
+                "ehr_patient_id": str(36909675 + i),
+                "facility_id": "6",
+                "assessments": {"items": {str(13448374 + i): {
+                    "template_id": 21242741,
+                    "sections": [{"section_code": "Cust", "assessment_question_groups": [{
+                        "group_number": "A",
+                        "assessment_responses": [{
+                            "question_key": "Cust_A_1",
+                            "question_text": "Vital signs",
+                            "responses": [{"response_value": "different"}]
+                        }]
+                    }]}]
+                }}}
+            }
+        }
+        with open(os.path.join(directory, f"test{i}.json"), 'w', encoding='utf-8') as f:
+            json.dump(test_data, f)
+
+
 class TestCompareAssessments(unittest.TestCase):
     """Test cases for compare_assessments module."""
 
@@ -190,6 +230,41 @@ class TestCompareAssessments(unittest.TestCase):
         # Empty SpeakCare should not show as difference
         self.assertEqual(len(differences), 0)
 
+    def test_classify_field_values(self):
+        """Test that every field is classified, consistently with compare_fields."""
+        speakcare_fields = {
+            "Cust_A_1:Same": {"response_value": "a", "response_text": "Yes"},
+            "Cust_A_2:Value": {"response_value": "a", "response_text": ""},
+            "Cust_A_3:Text": {"response_value": "a", "response_text": "Yes"},
+            "Cust_A_4:SpeakCare": {"response_value": "1", "response_text": ""},
+            "Cust_A_5:PCC": {"response_value": "", "response_text": ""},
+            "Cust_A_6:Empty": {"response_value": {}, "response_text": ""},
+        }
+        pcc_fields = {
+            "Cust_A_1:Same": {"response_value": "a", "response_text": "Yes"},
+            "Cust_A_2:Value": {"response_value": "b", "response_text": ""},
+            "Cust_A_3:Text": {"response_value": "a", "response_text": "Oui"},
+            "Cust_A_5:PCC": {"response_value": "x", "response_text": ""},
+            "Cust_A_6:Empty": {"response_value": "", "response_text": ""},
+            "Cust_A_7:PCC only key": {"response_value": "y", "response_text": ""},
+        }
+
+        outcomes = classify_field_values(speakcare_fields, pcc_fields)
+        self.assertEqual(outcomes, {
+            "Cust_A_1:Same": "matched",
+            "Cust_A_2:Value": "mismatched",
+            "Cust_A_3:Text": "mismatched",
+            "Cust_A_4:SpeakCare": "speakcare_only",
+            "Cust_A_5:PCC": "pcc_only",
+            "Cust_A_6:Empty": "both_empty",
+            "Cust_A_7:PCC only key": "pcc_only",
+        })
+        # Differences are exactly the mismatched and SpeakCare-only fields
+        self.assertEqual(
+            set(compare_fields(speakcare_fields, pcc_fields)),
+            {key for key, outcome in outcomes.items() if outcome in ("mismatched", "speakcare_only")}
+        )
+
     def test_compare_fields_multi_select(self):
         """Test comparison with multi-select values."""
         speakcare_fields = {
@@ -742,5 +817,353 @@ class TestCompareAssessments(unittest.TestCase):
             shutil.rmtree(temp_dir)
 
 
+    def test_process_directory_builds_schema_once(self):
+        """Test that one shared PCCAssessmentSchema serves every file and every run."""
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            _write_daily_note_charts(temp_dir, 3)
+            
+            output_csv = os.path.join(temp_dir, "output.csv")
+            schema_class = compare_assessments.PCCAssessmentSchema
+            with mock.patch.object(compare_assessments, "_shared_pcc_schema", None), \
+                    mock.patch.object(compare_assessments, "PCCAssessmentSchema", side_effect=schema_class) as factory:
+                process_directory(temp_dir, output_csv)
+                process_directory(temp_dir, output_csv)
+                self.assertEqual(factory.call_count, 1)
+                self.assertIs(get_pcc_schema(), get_pcc_schema())
+                
+                # An injected schema is used instead of the shared one
+                injected = schema_class()
+                with mock.patch.object(injected, "format_to_pcc_db", wraps=injected.format_to_pcc_db) as format_to_pcc_db:
+                    process_directory(temp_dir, output_csv, pcc_schema=injected)
+                self.assertEqual(format_to_pcc_db.call_count, 3)
+            
+            with open(output_csv, 'r', encoding='utf-8') as f:
+                header = next(csv.reader(f))
+            self.assertEqual(header, ["fields", "6:36909675:13448374", "6:36909676:13448375", "6:36909677:13448376"])
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
+    def test_process_directory_workers_match_serial_run(self):
+        """Test that a process pool run writes the same CSV bytes as a serial run."""
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            _write_daily_note_charts(temp_dir, 6, states=("draft", "draft", "signed"))
+            serial_csv = os.path.join(temp_dir, "serial.csv")
+            parallel_csv = os.path.join(temp_dir, "parallel.csv")
+            
+            process_directory(temp_dir, serial_csv)
+            process_directory(temp_dir, parallel_csv, workers=2)
+            
+            with open(serial_csv, 'rb') as f:
+                serial = f.read()
+            with open(parallel_csv, 'rb') as f:
+                self.assertEqual(f.read(), serial)
+            
+            rows = list(csv.reader(serial.decode("utf-8").splitlines()))
+            self.assertEqual(len(rows[0]), 5)  # fields + 4 draft assessments
+            self.assertEqual(len(rows), 2)
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
+    def test_process_directory_parses_each_file_once(self):
+        """Test that accepted and rejected files are each read and parsed exactly once."""
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            _write_daily_note_charts(temp_dir, 4, states=("draft", "signed"))
+            output_csv = os.path.join(temp_dir, "output.csv")
+            
+            with mock.patch.object(compare_assessments.json, "load", wraps=json.load) as json_load:
+                process_directory(temp_dir, output_csv)
+            # Accepted files are parsed once; rejected files are settled by the state pre-filter
+            self.assertEqual(json_load.call_count, 2)
+            
+            with open(output_csv, 'r', encoding='utf-8') as f:
+                header = next(csv.reader(f))
+            self.assertEqual(header, ["fields", "6:36909675:13448374", "6:36909677:13448376"])
+            
+            # A rejected file reports its state without being parsed again
+            with mock.patch.object(compare_assessments.json, "load", wraps=json.load) as json_load:
+                with self.assertRaisesRegex(ValueError, "'signed'"):
+                    process_single_file(os.path.join(temp_dir, "test1.json"))
+            self.assertEqual(json_load.call_count, 1)
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
+    def test_process_directory_spill_and_long_formats(self):
+        """Test that a spilling wide run matches the in-memory CSV and long rows match its cells."""
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            _write_daily_note_charts(temp_dir, 5, states=("draft", "draft", "signed"))
+            # A second export of the first assessment with another answer replaces it
+            with open(os.path.join(temp_dir, "test0.json"), 'r', encoding='utf-8') as f:
+                duplicate = json.load(f)
+            duplicate["speakcare_chart"]["json_internal_filled"][0]["internal_json"]["sections"][
+                "Cust.MHCS Nursing Daily Skilled Note"]["assessmentQuestionGroups"]["A"]["questions"][
+                "1. Vital signs"] = 'Value "dup", 0'
+            with open(os.path.join(temp_dir, "test9.json"), 'w', encoding='utf-8') as f:
+                json.dump(duplicate, f)
+            
+            wide_csv = os.path.join(temp_dir, "wide.csv")
+            spill_csv = os.path.join(temp_dir, "spill.csv")
+            long_csv = os.path.join(temp_dir, "long.csv")
+            
+            process_directory(temp_dir, wide_csv)
+            process_directory(temp_dir, spill_csv, max_rows_in_memory=1)
+            process_directory(temp_dir, long_csv, output_format="long")
+            
+            with open(wide_csv, 'rb') as f:
+                wide = f.read()
+            with open(spill_csv, 'rb') as f:
+                self.assertEqual(f.read(), wide)
+            
+            wide_rows = list(csv.reader(wide.decode("utf-8").splitlines()))
+            self.assertEqual(len(wide_rows[0]), 5)  # fields + 4 draft assessments
+            wide_cells = {
+                (assessment_key, row[0]): cell
+                for row in wide_rows[1:]
+                for assessment_key, cell in zip(wide_rows[0][1:], row[1:])
+                if cell
+            }
+            
+            with open(long_csv, 'r', newline='', encoding='utf-8') as f:
+                long_rows = list(csv.DictReader(f))
+            # Both exports of the duplicate assessment are streamed
+            self.assertEqual(len(long_rows), 5)
+            long_cells = {
+                (row["assessment_key"], row["field_key"]): f'{row["pcc"]} != {row["speakcare"]}'
+                for row in long_rows
+            }
+            self.assertEqual(long_cells, wide_cells)
+            
+            with self.assertRaises(ValueError):
+                process_directory(temp_dir, long_csv, output_format="tall")
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
+    def test_process_directory_manifest_incremental_and_resume(self):
+        """Test that a manifest run compares only new or changed files, resumes after an interruption and detects stale entries."""
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            _write_daily_note_charts(input_dir, 4, states=("draft", "draft", "signed"))
+            full_csv = os.path.join(temp_dir, "full.csv")
+            output_csv = os.path.join(temp_dir, "output.csv")
+            manifest_path = os.path.join(temp_dir, "output.csv.manifest.jsonl")
+            
+            def run(**kwargs):
+                with mock.patch.object(compare_assessments, "_compare_file", wraps=compare_assessments._compare_file) as compare_file:
+                    process_directory(input_dir, output_csv, manifest_path=manifest_path, **kwargs)
+                with open(output_csv, 'rb') as f:
+                    return compare_file.call_count, f.read()
+            
+            process_directory(input_dir, full_csv)
+            with open(full_csv, 'rb') as f:
+                expected = f.read()
+            
+            self.assertEqual(run(), (4, expected))
+            # Unchanged files, including rejected ones, come from the manifest
+            self.assertEqual(run(), (0, expected))
+            
+            # A changed file is compared again
+            with open(os.path.join(input_dir, "test1.json"), 'r', encoding='utf-8') as f:
+                changed = json.load(f)
+            changed["speakcare_chart"]["state"] = "signed"
+            with open(os.path.join(input_dir, "test1.json"), 'w', encoding='utf-8') as f:
+                json.dump(changed, f)
+            calls, changed_csv = run()
+            self.assertEqual(calls, 1)
+            self.assertEqual(len(next(csv.reader(changed_csv.decode("utf-8").splitlines()))), 3)
+            
+            # A different state filter invalidates every entry
+            self.assertEqual(run(state_filter=["draft", "signed"])[0], 4)
+            
+            # An interrupted run leaves finished files (and maybe a partial line) behind
+            with open(os.path.join(input_dir, "test1.json"), 'w', encoding='utf-8') as f:
+                json.dump(json.loads(json.dumps(changed).replace('"signed"', '"draft"')), f)
+            os.remove(manifest_path)
+            run()
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            self.assertEqual(len(lines), 4)
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines[:2])
+                f.write(lines[2][:20])
+            self.assertEqual(run(), (2, expected))
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 4)
+            
+            # Entries written with other templates or comparison code are stale
+            with mock.patch.object(compare_assessments, "_MANIFEST_LOGIC_VERSION", compare_assessments._MANIFEST_LOGIC_VERSION + 1):
+                with self.assertLogs(compare_assessments.logger, level="WARNING"):
+                    self.assertEqual(run(), (4, expected))
+            self.assertEqual(run()[0], 4)
+            self.assertEqual(run(), (0, expected))
+            
+            # A rebuild compares every file and keeps only the new entries
+            self.assertEqual(run(rebuild_manifest=True), (4, expected))
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 4)
+            self.assertEqual(run(), (0, expected))
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
+    def test_process_directory_field_and_type_stats(self):
+        """Test that per-field and per-type statistics agree with the wide CSV."""
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            _write_daily_note_charts(input_dir, 5, states=("draft", "draft", "signed"))
+            output_csv = os.path.join(temp_dir, "output.csv")
+            field_stats_csv = os.path.join(temp_dir, "fields.csv")
+            type_stats_csv = os.path.join(temp_dir, "types.csv")
+            
+            process_directory(input_dir, output_csv, field_stats_csv=field_stats_csv, type_stats_csv=type_stats_csv)
+            
+            with open(output_csv, 'r', newline='', encoding='utf-8') as f:
+                wide_rows = list(csv.reader(f))
+            with open(field_stats_csv, 'r', newline='', encoding='utf-8') as f:
+                field_rows = list(csv.DictReader(f))
+            with open(type_stats_csv, 'r', newline='', encoding='utf-8') as f:
+                type_rows = {row["question_type"]: row for row in csv.DictReader(f)}
+            
+            field_rows = {row["field_key"]: row for row in field_rows}
+            self.assertTrue(all(row["template_id"] == "21242741" and row["charts"] == "4" for row in field_rows.values()))
+            
+            vital_signs = field_rows["Cust_A_1:Vital signs"]
+            self.assertEqual(vital_signs["question_type"], "radh")
+            self.assertEqual((vital_signs["mismatched"], vital_signs["matched"], vital_signs["agreement"]), ("4", "0", "0.0000"))
+            
+            # Every wide-format cell is a mismatched or SpeakCare-only chart of its field
+            for row in wide_rows[1:]:
+                stats = field_rows[row[0]]
+                self.assertEqual(int(stats["mismatched"]) + int(stats["speakcare_only"]), sum(1 for cell in row[1:] if cell))
+            
+            # Per-type rows sum the per-field rows
+            for question_type, type_row in type_rows.items():
+                rows = [row for row in field_rows.values() if row["question_type"] == question_type]
+                self.assertEqual(int(type_row["fields"]), len(rows))
+                self.assertEqual(int(type_row["both_empty"]), sum(int(row["both_empty"]) for row in rows))
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
+    def test_process_directory_reads_zip_and_tar_archives(self):
+        """Test that zip and tar archive inputs give the same CSV as the extracted directory."""
+        import tarfile
+        import zipfile
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            _write_daily_note_charts(input_dir, 5, states=("draft", "draft", "signed"))
+            names = sorted(os.listdir(input_dir))
+            
+            zip_path = os.path.join(temp_dir, "charts.zip")
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                zip_file.writestr("exports/", "")
+                zip_file.writestr("exports/README.txt", "not a chart")
+                for name in names:
+                    zip_file.write(os.path.join(input_dir, name), f"exports/{name}")
+            tar_path = os.path.join(temp_dir, "charts.tar.gz")
+            with tarfile.open(tar_path, 'w:gz') as tar_file:
+                for name in names:
+                    tar_file.add(os.path.join(input_dir, name), f"exports/{name}")
+            
+            directory_csv = os.path.join(temp_dir, "directory.csv")
+            process_directory(input_dir, directory_csv)
+            with open(directory_csv, 'rb') as f:
+                expected = f.read()
+            self.assertEqual(len(next(csv.reader(expected.decode("utf-8").splitlines()))), 5)
+            
+            for archive_path, workers in [(zip_path, 1), (zip_path, 2), (tar_path, 1), (tar_path, 2)]:
+                archive_csv = os.path.join(temp_dir, "archive.csv")
+                process_directory(archive_path, archive_csv, workers=workers)
+                with open(archive_csv, 'rb') as f:
+                    self.assertEqual(f.read(), expected, f"{archive_path} with {workers} worker(s)")
+            
+            # Archive members are cached in a manifest by name
+            manifest_path = os.path.join(temp_dir, "manifest.jsonl")
+            process_directory(zip_path, archive_csv, manifest_path=manifest_path)
+            with mock.patch.object(compare_assessments, "_compare_chart") as compare_chart:
+                process_directory(zip_path, archive_csv, manifest_path=manifest_path)
+            compare_chart.assert_not_called()
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.assertEqual([json.loads(line)["path"] for line in f], [f"exports/{name}" for name in names])
+            
+            with self.assertRaises(ValueError):
+                process_directory(os.path.join(input_dir, names[0]), archive_csv)
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
+    def test_scan_chart_state_stops_early_and_falls_back(self):
+        """Test that the state pre-filter reads only the start of an export and falls back to a full parse."""
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
+            payload = [{"speaker": "nurse", "text": 'Said "fine", {ok} [sic]'} for _ in range(2000)]
+            early_file = os.path.join(temp_dir, "early.json")
+            with open(early_file, 'w', encoding='utf-8') as f:
+                json.dump({"meta": {"a": [1, 2.5, None]}, "speakcare_chart": {"schema_id": "1", "state": "signed",
+                           "transcript": payload}, "pcc_assessment": {}}, f, indent=2)
+            late_file = os.path.join(temp_dir, "late.json")
+            with open(late_file, 'w', encoding='utf-8') as f:
+                json.dump({"speakcare_chart": {"transcript": payload, "state": "signed"}}, f)
+            
+            self.assertEqual(scan_chart_state(early_file), (True, "signed"))
+            self.assertEqual(scan_chart_state(late_file, max_scan_bytes=4096), (False, None))
+            self.assertEqual(scan_chart_state(late_file, max_scan_bytes=10 ** 6), (True, "signed"))
+            
+            # Rejected by the scan alone, or after a full parse when the state comes too late
+            with mock.patch.object(compare_assessments.json, "load", wraps=json.load) as json_load:
+                self.assertFalse(should_process_file(early_file))
+                self.assertEqual(json_load.call_count, 0)
+                with mock.patch.object(compare_assessments, "STATE_SCAN_BYTES", 4096):
+                    self.assertFalse(should_process_file(late_file))
+                    self.assertTrue(should_process_file(late_file, ["signed"]))
+                self.assertEqual(json_load.call_count, 2)
+            
+            # Exports that are not chart objects are left to the full parse
+            for content in ('[{"speakcare_chart": {"state": "draft"}}]', '{"speakcare_chart": null}', '{"x": tru'):
+                odd_file = os.path.join(temp_dir, "odd.json")
+                with open(odd_file, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                self.assertEqual(scan_chart_state(odd_file), (False, None))
+                self.assertFalse(should_process_file(odd_file))
+        
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for the per-section fill orchestrator.
+"""
+
+import unittest
+import asyncio
+import json
+
+from pcc_schema.pcc_assessment_schema import PCCAssessmentSchema
+from pcc_schema.section_fill import (
+    FakeSectionClient,
+    SectionClient,
+    ThreadedSectionClient,
+    fill_sections,
+)
+from tests.pcc.pcc_assessment_schema_test import _build_valid_model_response
+
+ADMISSION_TEMPLATE_ID = 21244981
+
+
+class TestSectionFill(unittest.TestCase):
+    """Test cases for section_fill module."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pcc = PCCAssessmentSchema()
+        cls.model_response = _build_valid_model_response(cls.pcc, ADMISSION_TEMPLATE_ID)
+        cls.section_keys = cls.pcc.get_section_keys(ADMISSION_TEMPLATE_ID)
+
+    def test_section_schemas_and_validation(self):
+        """Test section keys, section schemas and validating a response to one section."""
+        self.assertEqual(len(self.section_keys), self.pcc.get_num_sections(ADMISSION_TEMPLATE_ID))
+        section_key = self.section_keys[1]
+        section_schema = self.pcc.get_section_schema(ADMISSION_TEMPLATE_ID, section_key)
+        self.assertEqual(list(section_schema["properties"]["sections"]["properties"]), [section_key])
+
+        section_response = {
+            "table_name": self.model_response["table_name"],
+            "sections": {section_key: self.model_response["sections"][section_key]},
+        }
+        container_path = ["sections", section_key]
+        self.assertEqual(self.pcc.validate(ADMISSION_TEMPLATE_ID, section_response, container_path=container_path), (True, []))
+        is_valid, errors = self.pcc.validate(ADMISSION_TEMPLATE_ID, section_response)
+        self.assertFalse(is_valid)
+        is_valid, errors = self.pcc.validate(ADMISSION_TEMPLATE_ID, {**section_response, "sections": {}}, container_path=container_path)
+        self.assertFalse(is_valid)
+
+    def test_fill_sections_merges_all_sections(self):
+        """Test that concurrent section responses merge into the full model response."""
+        client = FakeSectionClient(self.model_response, latency=0.01)
+        result = fill_sections(self.pcc, ADMISSION_TEMPLATE_ID, "transcript", client, max_concurrency=3)
+
+        self.assertEqual(result["failed_sections"], {})
+        self.assertEqual(result["model_response"], self.model_response)
+        self.assertEqual(list(result["model_response"]["sections"]), self.section_keys)
+        self.assertEqual(result["attempts"], {key: 1 for key in self.section_keys})
+        self.assertEqual(client.calls, len(self.section_keys))
+        self.assertEqual(client.max_in_flight, 3)
+        self.assertEqual(self.pcc.validate(ADMISSION_TEMPLATE_ID, result["model_response"]), (True, []))
+
+    def test_fill_sections_retries_failed_sections(self):
+        """Test that invalid responses are retried up to max_attempts and failures are reported."""
+        retried, failed = self.section_keys[0], self.section_keys[2]
+        client = FakeSectionClient(self.model_response, failures={retried: 1, failed: 5})
+        result = fill_sections(self.pcc, ADMISSION_TEMPLATE_ID, "transcript", client, max_attempts=2)
+
+        self.assertEqual(result["attempts"][retried], 2)
+        self.assertEqual(result["attempts"][failed], 2)
+        self.assertEqual(list(result["failed_sections"]), [failed])
+        self.assertIn("JSONDecodeError", result["failed_sections"][failed][0])
+        self.assertEqual(result["model_response"]["sections"][retried], self.model_response["sections"][retried])
+        self.assertNotIn(failed, result["model_response"]["sections"])
+        self.assertEqual(len(result["model_response"]["sections"]), len(self.section_keys) - 1)
+
+    def test_fill_sections_threaded_client(self):
+        """Test a blocking client function, including retrying an exception it raises."""
+        fake = FakeSectionClient(self.model_response)
+        calls = []
+
+        def complete(system_prompt, user_prompt, json_schema):
+            calls.append(user_prompt)
+            if len(calls) == 1:
+                raise RuntimeError("rate limited")
+            return json.loads(asyncio.run(fake.complete(system_prompt, user_prompt, json_schema)))
+
+        section_keys = self.section_keys[:2]
+        result = fill_sections(self.pcc, ADMISSION_TEMPLATE_ID, "transcript", ThreadedSectionClient(complete),
+                               max_concurrency=1, section_keys=section_keys)
+
+        self.assertEqual(result["failed_sections"], {})
+        self.assertEqual(sum(result["attempts"].values()), 3)
+        self.assertEqual(list(result["model_response"]["sections"]), section_keys)
+
+    def test_section_client_requires_complete(self):
+        """Test that a client without complete cannot be built."""
+        class IncompleteClient(SectionClient):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteClient()
+
+    def test_fill_sections_invalid_arguments(self):
+        """Test argument validation."""
+        client = FakeSectionClient(self.model_response)
+        with self.assertRaises(ValueError):
+            fill_sections(self.pcc, ADMISSION_TEMPLATE_ID, "transcript", client, max_concurrency=0)
+        with self.assertRaises(ValueError):
+            fill_sections(self.pcc, ADMISSION_TEMPLATE_ID, "transcript", client, section_keys=["Cust_99.Missing"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2644,6 +2644,230 @@ class TestSchemaEngine(unittest.TestCase):
         self.assertIn("This field contains the patient's full name", field1_schema.get("description", ""))
         self.assertIn("This field contains the patient's age in years", field2_schema.get("description", ""))
 
+    def test_get_container_schema(self):
+        """Test standalone, cached section and group schemas, and overrides scoped to them."""
+        import jsonschema
+        engine = self.nested_engine
+        
+        def question(key, text):
+            return {"questionKey": key, "questionNumber": key, "questionText": text, "questionType": "txt"}
+        
+        table_id, table_name = engine.register_table(1, {
+            "assessmentDescription": "Container Test",
+            "sections": [
+                {"sectionCode": "A", "sectionDescription": "Alpha", "assessmentQuestionGroups": [
+                    {"groupNumber": "1", "groupTitle": "One", "questions": [question("A_1", "First")]},
+                    {"groupNumber": "2", "groupTitle": "Two", "questions": [question("A_2", "Second")]}
+                ]},
+                {"sectionCode": "B", "sectionDescription": "Beta", "assessmentQuestionGroups": [
+                    {"groupNumber": "1", "groupTitle": "One", "questions": [question("B_1", "Third")]}
+                ]}
+            ]
+        })
+        full_schema = engine.get_json_schema(table_id)
+        section_a = full_schema["properties"]["sections"]["properties"]["A.Alpha"]
+        
+        section_schema = engine.get_container_schema(table_name, ["sections", "A.Alpha"])
+        self.assertEqual(section_schema["title"], "Container Test")
+        self.assertEqual(section_schema["required"], ["table_name", "sections"])
+        self.assertEqual(section_schema["properties"]["table_name"], full_schema["properties"]["table_name"])
+        sections = section_schema["properties"]["sections"]
+        self.assertEqual((sections["required"], sections["additionalProperties"]), (["A.Alpha"], False))
+        self.assertEqual(sections["properties"], {"A.Alpha": section_a})
+        self.assertIsNot(sections["properties"]["A.Alpha"], section_a)
+        self.assertIs(engine.get_container_schema(table_id, ("sections", "A.Alpha")), section_schema)
+        
+        group_schema = engine.get_container_schema(table_id, ["sections", "A.Alpha", "assessmentQuestionGroups", "2.Two"])
+        groups = group_schema["properties"]["sections"]["properties"]["A.Alpha"]["properties"]["assessmentQuestionGroups"]
+        self.assertEqual(list(groups["properties"]), ["2.Two"])
+        self.assertEqual(groups["required"], ["2.Two"])
+        
+        # A response to the section schema has the shape reverse mapping expects
+        section_response = {
+            "table_name": "Container Test",
+            "sections": {"A.Alpha": {"assessmentQuestionGroups": {
+                "1.One": {"questions": {"First": "one"}},
+                "2.Two": {"questions": {"Second": "two"}}
+            }}}
+        }
+        jsonschema.validate(section_response, section_schema)
+        with self.assertRaises(jsonschema.ValidationError):
+            jsonschema.validate(dict(section_response, sections={"B.Beta": {}}), section_schema)
+        self.assertEqual(engine.extract_model_values(table_id, section_response), {"A_1": "one", "A_2": "two", "B_1": None})
+        
+        for container_path in ([], ["sections", "C.Gamma"], ["table_name"]):
+            with self.assertRaises(ValueError):
+                engine.get_container_schema(table_id, container_path)
+        
+        # Overrides apply to a copy of the slice; fields outside it are skipped
+        overridden = engine.get_schema_with_overrides(
+            table_id,
+            {"A_2": {"value": "fixed"}, "B_1": {"description": "not in this section"}},
+            container_path=["sections", "A.Alpha"]
+        )
+        overridden_groups = overridden["properties"]["sections"]["properties"]["A.Alpha"]["properties"]["assessmentQuestionGroups"]
+        self.assertEqual(overridden_groups["properties"]["2.Two"]["properties"]["questions"]["properties"]["Second"]["const"], "fixed")
+        self.assertEqual(list(overridden["properties"]["sections"]["properties"]), ["A.Alpha"])
+        self.assertEqual(engine.get_container_schema(table_id, ["sections", "A.Alpha"])["properties"]["sections"]["properties"]["A.Alpha"], section_a)
+        
+        # Enrichment starts a new cache generation
+        engine.enrich_schema(table_id, {"A_1": "Enriched"})
+        enriched = engine.get_container_schema(table_id, ["sections", "A.Alpha"])
+        self.assertIsNot(enriched, section_schema)
+        self.assertIn("Enriched", json.dumps(enriched))
+
+    def test_partition_schema(self):
+        """Test budget-driven partitioning and merging partition responses back into one response."""
+        import jsonschema
+        engine = self.nested_engine
+        
+        def question(key, text):
+            return {"questionKey": key, "questionNumber": key, "questionText": text, "questionType": "txt"}
+        
+        table_id, table_name = engine.register_table(1, {
+            "assessmentDescription": "Partition Test",
+            "sections": [
+                {"sectionCode": "A", "sectionDescription": "Alpha", "assessmentQuestionGroups": [
+                    {"groupNumber": "1", "groupTitle": "One", "questions": [question("A_1", "First")]},
+                    {"groupNumber": "2", "groupTitle": "Two", "questions": [question("A_2", "Second"), question("A_3", "Third")]}
+                ]},
+                {"sectionCode": "B", "sectionDescription": "Beta", "assessmentQuestionGroups": [
+                    {"groupNumber": "1", "groupTitle": "One", "questions": [question("B_1", "Fourth")]}
+                ]}
+            ]
+        })
+        full_schema = engine.get_json_schema(table_id)
+        full_response = {
+            "table_name": "Partition Test",
+            "sections": {
+                "A.Alpha": {"assessmentQuestionGroups": {
+                    "1.One": {"questions": {"First": "one"}},
+                    "2.Two": {"questions": {"Second": "two", "Third": None}}
+                }},
+                "B.Beta": {"assessmentQuestionGroups": {"1.One": {"questions": {"Fourth": "four"}}}}
+            }
+        }
+        
+        # Everything fits: the registered schema itself
+        result = engine.partition_schema(table_name, max_depth=5, max_properties=100)
+        self.assertEqual(len(result["partitions"]), 1)
+        self.assertIs(result["partitions"][0], full_schema)
+        
+        def split_response(merge_plan):
+            responses = []
+            for step in merge_plan["steps"]:
+                node = full_response
+                for key in step["path"]:
+                    node = node[key]
+                responses.append({key: node[key] for key in step["keys"]})
+            return responses
+        
+        # Partitions are re-rooted below the wrappers, so they are shallower than the full schema
+        result = engine.partition_schema(table_id, max_depth=2)
+        self.assertEqual(result["merge_plan"], {"constants": {"table_name": "Partition Test"}, "steps": [
+            {"path": ["sections", "A.Alpha", "assessmentQuestionGroups"], "keys": ["1.One", "2.Two"]},
+            {"path": ["sections", "B.Beta", "assessmentQuestionGroups"], "keys": ["1.One"]}
+        ]})
+        self.assertEqual(result["partitions"][0]["title"], "Partition Test")
+        self.assertEqual(result["partitions"][0]["required"], ["1.One", "2.Two"])
+        
+        # Fitting siblings are packed together; oversized ones are split further
+        result = engine.partition_schema(table_id, max_properties=5)
+        self.assertEqual(result["merge_plan"]["steps"], [
+            {"path": ["sections"], "keys": ["B.Beta"]},
+            {"path": ["sections", "A.Alpha", "assessmentQuestionGroups"], "keys": ["1.One"]},
+            {"path": ["sections", "A.Alpha", "assessmentQuestionGroups"], "keys": ["2.Two"]}
+        ])
+        
+        for budgets in ({"max_depth": 1}, {"max_depth": 3}, {"max_properties": 3}, {"max_tokens": 150}):
+            result = engine.partition_schema(table_id, **budgets)
+            responses = split_response(result["merge_plan"])
+            for partition, response in zip(result["partitions"], responses):
+                depth, num_properties, _ = engine._schema_stats(partition)
+                self.assertLessEqual(depth, budgets.get("max_depth", depth))
+                self.assertLessEqual(num_properties, budgets.get("max_properties", num_properties))
+                self.assertLessEqual(len(json.dumps(partition)) / 4, budgets.get("max_tokens", float("inf")))
+                jsonschema.validate(response, partition)
+            merged = engine.merge_partition_responses(result["merge_plan"], responses)
+            self.assertEqual(merged, full_response)
+            self.assertEqual(engine.validate(table_id, merged), (True, []))
+        
+        with self.assertRaises(ValueError):
+            engine.merge_partition_responses(result["merge_plan"], responses[:-1])
+        with self.assertRaises(ValueError):
+            engine.merge_partition_responses(result["merge_plan"], [{}] * len(responses))
+        
+        # The object holding fields is never split
+        with self.assertRaises(ValueError):
+            engine.partition_schema(table_id, max_properties=2)
+        
+        # A wrapper's own non-container properties get a partition when all its containers are split
+        full_schema["properties"]["sections"]["properties"]["A.Alpha"]["properties"]["note"] = {"type": "string"}
+        full_response["sections"]["A.Alpha"]["note"] = "reviewed"
+        result = engine.partition_schema(table_id, max_properties=5)
+        self.assertEqual(result["merge_plan"]["steps"], [
+            {"path": ["sections"], "keys": ["B.Beta"]},
+            {"path": ["sections", "A.Alpha"], "keys": ["note"]},
+            {"path": ["sections", "A.Alpha", "assessmentQuestionGroups"], "keys": ["1.One"]},
+            {"path": ["sections", "A.Alpha", "assessmentQuestionGroups"], "keys": ["2.Two"]}
+        ])
+        merged = engine.merge_partition_responses(result["merge_plan"], split_response(result["merge_plan"]))
+        self.assertEqual(merged, full_response)
+
+    def test_get_json_schema_bytes(self):
+        """Test cached canonical schema bytes, with overrides spliced in and per container path."""
+        engine = self.nested_engine
+        
+        def question(key, text):
+            return {"questionKey": key, "questionNumber": key, "questionText": text, "questionType": "txt"}
+        
+        def dumps(schema):
+            return json.dumps(schema, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        
+        table_id, table_name = engine.register_table(1, {
+            "assessmentDescription": "Bytes Test",
+            "sections": [
+                {"sectionCode": "A", "sectionDescription": "Alpha", "assessmentQuestionGroups": [
+                    {"groupNumber": "1", "groupTitle": "One", "questions": [question("A_1", "First"), question("A_2", "Second é")]}
+                ]},
+                {"sectionCode": "B", "sectionDescription": "Beta", "assessmentQuestionGroups": [
+                    {"groupNumber": "1", "groupTitle": "One", "questions": [question("B_1", "Third")]}
+                ]}
+            ]
+        })
+        full_schema = engine.get_json_schema(table_id)
+        original = copy.deepcopy(full_schema)
+        
+        schema_bytes = engine.get_json_schema_bytes(table_name)
+        self.assertEqual(schema_bytes, dumps(full_schema))
+        self.assertIs(engine.get_json_schema_bytes(table_id), schema_bytes)
+        self.assertIs(engine.get_json_schema_bytes(table_id, overrides={}), schema_bytes)
+        
+        overrides = {
+            "A_2": {"value": "fixed", "description": "Locked"},
+            "B_1": {"description": "Ask twice", "description_op": "append"},
+            "Z_9": {"description": "not a field"},
+        }
+        self.assertEqual(engine.get_json_schema_bytes(table_id, overrides), dumps(engine.get_schema_with_overrides(table_id, overrides)))
+        self.assertEqual(full_schema, original)
+        self.assertIs(engine.get_json_schema_bytes(table_id), schema_bytes)
+        with self.assertRaises(ValueError):
+            engine.get_json_schema_bytes(table_id, {"A_1": {"value": 5}})
+        self.assertEqual(full_schema, original)
+        
+        container_path = ["sections", "B.Beta"]
+        self.assertEqual(
+            engine.get_json_schema_bytes(table_id, overrides, container_path=container_path),
+            dumps(engine.get_schema_with_overrides(table_id, overrides, container_path=container_path))
+        )
+        self.assertEqual(engine.get_json_schema_bytes(table_id, container_path=container_path), dumps(engine.get_container_schema(table_id, container_path)))
+        
+        # Enrichment starts a new cache generation
+        engine.enrich_schema(table_id, {"A_1": "Enriched"})
+        enriched = engine.get_json_schema_bytes(table_id)
+        self.assertEqual(enriched, dumps(engine.get_json_schema(table_id)))
+        self.assertIn(b"Enriched", enriched)
+
     def test_get_schema_with_overrides_returns_copy(self):
         """The override helper returns a deep-copied schema without mutating the stored version."""
         engine = SchemaEngine(self.flat_meta_schema)
@@ -3712,6 +3936,107 @@ class TestSchemaEngine(unittest.TestCase):
         # Verify registration worked (no direct way to test, but no error should occur)
         self.assertTrue(True)  # Placeholder assertion
 
+    def test_field_metadata_enricher(self):
+        """Test that field metadata enrichers run on every field at registration."""
+        engine = SchemaEngine(self.flat_meta_schema)
+        
+        def upper_name_enricher(engine, field_meta):
+            field_meta["upper_name"] = field_meta["name"].upper()
+        
+        engine.register_field_metadata_enricher(upper_name_enricher)
+        
+        table_schema = {
+            "table_name": "Test Table",
+            "fields": [
+                {"field_id": "field1", "field_number": "1", "field_name": "Patient Name", "field_type": "text"},
+                {"field_id": "field2", "field_number": "2", "field_name": "Patient Age", "field_type": "number"}
+            ]
+        }
+        
+        table_id, table_name = engine.register_table(1, table_schema)
+        
+        field_index = engine.get_field_metadata(table_id)
+        self.assertEqual([f["upper_name"] for f in field_index], ["PATIENT NAME", "PATIENT AGE"])
+        
+        # Enriched metadata is what formatters receive
+        def enriched_formatter(engine, field_meta, model_value, table_name):
+            return {field_meta["key"]: {"type": "text", "value": field_meta["upper_name"]}}
+        
+        engine.register_reverse_formatter("test", "text", enriched_formatter)
+        result = engine.reverse_map(table_name, {"fields": {"Patient Name": "x"}}, formatter_name="test")
+        self.assertEqual(result["data"][0]["properties"]["field1"], {"type": "text", "value": "PATIENT NAME"})
+
+    def test_formatter_plan_invalidated_on_registration(self):
+        """Test that compiled formatter plans are rebuilt when formatters are registered."""
+        engine = SchemaEngine(self.flat_meta_schema)
+        
+        table_schema = {
+            "table_name": "Test Table",
+            "fields": [
+                {"field_id": "field1", "field_number": "1", "field_name": "Patient Name", "field_type": "text"},
+                {"field_id": "field2", "field_number": "2", "field_name": "Patient Age", "field_type": "number"}
+            ]
+        }
+        table_id, table_name = engine.register_table(1, table_schema)
+        
+        def text_formatter(engine, field_meta, model_value, table_name):
+            return {field_meta["key"]: {"type": "text", "value": model_value}}
+        
+        engine.register_reverse_formatter("test", "text", text_formatter)
+        model_response = {"fields": {"Patient Name": "John", "Patient Age": 42}}
+        
+        # No formatter for "number" yet: field2 is left out
+        result = engine.reverse_map(table_name, model_response, formatter_name="test")
+        self.assertEqual(list(result["data"][0]["properties"]), ["field1"])
+        
+        def number_formatter(engine, field_meta, model_value, table_name):
+            return {field_meta["key"]: {"type": "number", "value": model_value}}
+        
+        engine.register_reverse_formatter("test", "number", number_formatter)
+        result = engine.reverse_map(table_name, model_response, formatter_name="test")
+        self.assertEqual(result["data"][0]["properties"]["field2"], {"type": "number", "value": 42})
+
+    def test_reverse_map_many(self):
+        """Test that reverse_map_many matches separate reverse_map calls per target."""
+        engine = SchemaEngine(self.flat_meta_schema)
+        
+        table_schema = {
+            "table_name": "Test Table",
+            "fields": [
+                {"field_id": "field1", "field_number": "1", "field_name": "Patient Name", "field_type": "text"},
+                {"field_id": "field2", "field_number": "2", "field_name": "Patient Age", "field_type": "number"}
+            ]
+        }
+        table_id, table_name = engine.register_table(1, table_schema)
+        
+        def plain_formatter(engine, field_meta, model_value, table_name):
+            return {field_meta["key"]: {"type": field_meta["original_schema_type"], "value": model_value}}
+        
+        def upper_formatter(engine, field_meta, model_value, table_name):
+            return {field_meta["key"]: {"type": "text", "value": str(model_value).upper()}}
+        
+        for schema_type in ["text", "number"]:
+            engine.register_reverse_formatter("plain", schema_type, plain_formatter)
+            engine.register_reverse_formatter("upper", schema_type, upper_formatter)
+        
+        model_response = {"fields": {"Patient Name": "John", "Patient Age": 42}}
+        targets = {
+            "plain": {"formatter_name": "plain"},
+            "upper": {"formatter_name": "upper", "pack_properties_as": "array"}
+        }
+        
+        self.assertEqual(engine.extract_model_values(table_id, model_response), {"field1": "John", "field2": 42})
+        
+        outputs = engine.reverse_map_many(table_name, model_response, targets)
+        self.assertEqual(outputs["plain"], engine.reverse_map(table_name, model_response, formatter_name="plain"))
+        self.assertEqual(
+            outputs["upper"],
+            engine.reverse_map(table_name, model_response, formatter_name="upper", pack_properties_as="array")
+        )
+        
+        with self.assertRaises(ValueError):
+            engine.reverse_map_many(table_name, model_response, {"bad": {"formatter_name": "missing"}})
+
     def test_unknown_formatter_set_error(self):
         """Test error when using unknown formatter set."""
         engine = SchemaEngine(self.flat_meta_schema)
@@ -4744,6 +5069,465 @@ class TestSchemaEngine(unittest.TestCase):
         self.assertIn("field2", section2["properties"])
         self.assertEqual(section2["properties"]["field2"]["value"], "value2")
 
+    def test_container_grouping_precomputed_at_registration(self):
+        """Test that container grouping maps are built once per table and drive reverse_map grouping."""
+        meta_schema = {
+            "schema_name": "tableName",
+            "container": {
+                "container_name": "sections",
+                "container_type": "array",
+                "object": {
+                    "key": "sectionCode",
+                    "name": "sectionName",
+                    "properties": {
+                        "properties_name": "fields",
+                        "property": {
+                            "key": "fieldKey",
+                            "name": "fieldName",
+                            "type": "fieldType",
+                            "validation": {
+                                "allowed_types": ["text"],
+                                "type_constraints": {
+                                    "text": {"target_type": "string", "requires_options": False}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        
+        engine = SchemaEngine(meta_schema)
+        
+        # Unpacked results are stored under a storage key and grouped via _original_field_key
+        def test_formatter(engine_instance, field_meta, model_value, table_name):
+            if model_value is None:
+                return {}
+            return {
+                f"{field_meta['key']}_a": {"type": "text", "value": model_value, "_original_field_key": field_meta["key"]},
+            }
+        
+        engine.register_reverse_formatter("test", "text", test_formatter)
+        
+        external_schema = {
+            "tableName": "Test Table",
+            "sections": [
+                {"sectionCode": "A", "sectionName": "Alpha", "fields": [
+                    {"fieldKey": "field1", "fieldName": "Field 1", "fieldType": "text"}
+                ]},
+                {"sectionCode": "B", "sectionName": "Beta", "fields": [
+                    {"fieldKey": "field2", "fieldName": "Field 2", "fieldType": "text"}
+                ]},
+                {"sectionCode": "C", "sectionName": "Gamma", "fields": [
+                    {"fieldKey": "field3", "fieldName": "Field 3", "fieldType": "text"}
+                ]}
+            ]
+        }
+        
+        table_id, table_name = engine.register_table(1, external_schema)
+        
+        grouping = engine._SchemaEngine__tables[table_id]["container_grouping"]
+        self.assertEqual(grouping["key_to_container"], {"field1": "A", "field2": "B", "field3": "C"})
+        self.assertEqual(list(grouping["container_key_fields"]), ["A", "B", "C"])
+        self.assertEqual(grouping["container_key_fields"]["A"], "sectionCode")
+        
+        # Section B has no answers and is left out; the others keep schema order
+        model_response = {
+            "table_name": "Test Table",
+            "sections": {
+                "C.Gamma": {"fields": {"Field 3": "value3"}},
+                "A.Alpha": {"fields": {"Field 1": "value1"}}
+            }
+        }
+        
+        result = engine.reverse_map(table_name, model_response, formatter_name="test", group_by_containers=["sections"])
+        self.assertEqual([s["sectionCode"] for s in result["sections"]], ["A", "C"])
+        self.assertEqual(result["sections"][0]["properties"], {"field1_a": {"type": "text", "value": "value1", "_original_field_key": "field1"}})
+        
+        result = engine.reverse_map(
+            table_name, model_response, formatter_name="test",
+            group_by_containers=["sections"], pack_properties_as="array", pack_containers_as="object"
+        )
+        self.assertEqual(result["sections"], {
+            "A": {"properties": [{"key": "field1", "type": "text", "value": "value1"}]},
+            "C": {"properties": [{"key": "field3", "type": "text", "value": "value3"}]},
+        })
+
+    def test_iter_reverse_map(self):
+        """Test that iter_reverse_map yields one container at a time, matching reverse_map."""
+        meta_schema = {
+            "schema_name": "tableName",
+            "container": {
+                "container_name": "sections",
+                "container_type": "array",
+                "object": {
+                    "key": "sectionCode",
+                    "name": "sectionName",
+                    "properties": {
+                        "properties_name": "fields",
+                        "property": {
+                            "key": "fieldKey",
+                            "name": "fieldName",
+                            "type": "fieldType",
+                            "validation": {
+                                "allowed_types": ["text"],
+                                "type_constraints": {
+                                    "text": {"target_type": "string", "requires_options": False}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        
+        engine = SchemaEngine(meta_schema)
+        formatted_fields = []
+        
+        def test_formatter(engine_instance, field_meta, model_value, table_name):
+            formatted_fields.append(field_meta["key"])
+            if model_value is None:
+                return {}
+            return {field_meta["key"]: {"type": "text", "value": model_value}}
+        
+        engine.register_reverse_formatter("test", "text", test_formatter)
+        
+        external_schema = {
+            "tableName": "Test Table",
+            "sections": [
+                {"sectionCode": "A", "sectionName": "Alpha", "fields": [
+                    {"fieldKey": "field1", "fieldName": "Field 1", "fieldType": "text"}
+                ]},
+                {"sectionCode": "B", "sectionName": "Beta", "fields": [
+                    {"fieldKey": "field2", "fieldName": "Field 2", "fieldType": "text"}
+                ]},
+                {"sectionCode": "C", "sectionName": "Gamma", "fields": [
+                    {"fieldKey": "field3", "fieldName": "Field 3", "fieldType": "text"}
+                ]}
+            ]
+        }
+        table_id, table_name = engine.register_table(1, external_schema)
+        
+        model_response = {
+            "table_name": "Test Table",
+            "sections": {
+                "A.Alpha": {"fields": {"Field 1": "value1"}},
+                "C.Gamma": {"fields": {"Field 3": "value3"}}
+            }
+        }
+        
+        # Sections are formatted lazily, one per iteration
+        sections = engine.iter_reverse_map(table_name, model_response, formatter_name="test")
+        self.assertEqual(next(sections), ("A", {"sectionCode": "A", "properties": {"field1": {"type": "text", "value": "value1"}}}))
+        self.assertEqual(formatted_fields, ["field1"])
+        
+        # Empty section B is skipped
+        self.assertEqual([key for key, _ in sections], ["C"])
+        
+        for pack_properties_as in ["object", "array"]:
+            for pack_containers_as in ["object", "array"]:
+                options = {"pack_properties_as": pack_properties_as, "pack_containers_as": pack_containers_as}
+                expected = engine.reverse_map(table_name, model_response, formatter_name="test", group_by_containers=["sections"], **options)
+                sections = list(engine.iter_reverse_map(table_name, model_response, formatter_name="test", **options))
+                if pack_containers_as == "object":
+                    self.assertEqual(dict(sections), expected["sections"])
+                else:
+                    self.assertEqual([section for _, section in sections], expected["sections"])
+        
+        with self.assertRaises(ValueError):
+            next(engine.iter_reverse_map(table_name, model_response, formatter_name="missing"))
+
+    def test_reverse_map_delta(self):
+        """Test that reverse_map_delta reformats only changed fields and matches reverse_map."""
+        meta_schema = {
+            "schema_name": "tableName",
+            "container": {
+                "container_name": "sections",
+                "container_type": "array",
+                "object": {
+                    "key": "sectionCode",
+                    "name": "sectionName",
+                    "properties": {
+                        "properties_name": "fields",
+                        "property": {
+                            "key": "fieldKey",
+                            "name": "fieldName",
+                            "type": "fieldType",
+                            "validation": {
+                                "allowed_types": ["text", "list"],
+                                "type_constraints": {
+                                    "text": {"target_type": "string", "requires_options": False},
+                                    "list": {"target_type": "array", "requires_options": False}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        
+        engine = SchemaEngine(meta_schema)
+        formatted_fields = []
+        
+        def test_formatter(engine_instance, field_meta, model_value, table_name):
+            formatted_fields.append(field_meta["key"])
+            return {field_meta["key"]: {"type": "text", "value": model_value}}
+        
+        engine.register_reverse_formatter("test", "text", test_formatter)
+        engine.register_reverse_formatter("test", "list", test_formatter)
+        
+        external_schema = {
+            "tableName": "Test Table",
+            "sections": [
+                {"sectionCode": "A", "sectionName": "Alpha", "fields": [
+                    {"fieldKey": "field1", "fieldName": "Field 1", "fieldType": "text"},
+                    {"fieldKey": "field2", "fieldName": "Field 2", "fieldType": "list"}
+                ]},
+                {"sectionCode": "B", "sectionName": "Beta", "fields": [
+                    {"fieldKey": "field3", "fieldName": "Field 3", "fieldType": "text"}
+                ]}
+            ]
+        }
+        table_id, table_name = engine.register_table(1, external_schema)
+        options = {"formatter_name": "test", "group_by_containers": ["sections"], "pack_properties_as": "array"}
+        
+        response = {
+            "table_name": "Test Table",
+            "sections": {
+                "A.Alpha": {"fields": {"Field 1": "one", "Field 2": ["x"]}},
+                "B.Beta": {"fields": {"Field 3": "three"}}
+            }
+        }
+        
+        # First call formats everything
+        result, changed_keys, state = engine.reverse_map_delta(table_name, response, **options)
+        self.assertEqual(result, engine.reverse_map(table_name, response, **options))
+        self.assertEqual(changed_keys, ["field1", "field2", "field3"])
+        
+        # Edit in place: only field2 is reformatted, section B is reused as-is
+        response["sections"]["A.Alpha"]["fields"]["Field 2"].append("y")
+        formatted_fields.clear()
+        new_result, changed_keys, new_state = engine.reverse_map_delta(table_name, response, previous_state=state, **options)
+        self.assertEqual(changed_keys, ["field2"])
+        self.assertEqual(formatted_fields, ["field2"])
+        self.assertEqual(new_result, engine.reverse_map(table_name, response, **options))
+        self.assertIs(new_result["sections"][1]["properties"], result["sections"][1]["properties"])
+        
+        # Diffing against a plain previous response reports the same keys but formats every field
+        previous = {"table_name": "Test Table", "sections": {"A.Alpha": {"fields": {"Field 1": "one"}}, "B.Beta": {"fields": {"Field 3": "3"}}}}
+        formatted_fields.clear()
+        _, changed_keys, _ = engine.reverse_map_delta(table_name, response, previous_response=previous, **options)
+        self.assertEqual(changed_keys, ["field2", "field3"])
+        self.assertEqual(formatted_fields, ["field1", "field2", "field3"])
+        
+        # Registering a formatter invalidates the cached results
+        engine.register_reverse_formatter("test", "text", test_formatter)
+        formatted_fields.clear()
+        _, changed_keys, _ = engine.reverse_map_delta(table_name, response, previous_state=new_state, **options)
+        self.assertEqual(changed_keys, [])
+        self.assertEqual(formatted_fields, ["field1", "field2", "field3"])
+
+    def test_iter_reverse_map_batch(self):
+        """Test that iter_reverse_map_batch formats field columns and matches reverse_map per response."""
+        meta_schema = {
+            "schema_name": "tableName",
+            "container": {
+                "container_name": "sections",
+                "container_type": "array",
+                "object": {
+                    "key": "sectionCode",
+                    "name": "sectionName",
+                    "properties": {
+                        "properties_name": "fields",
+                        "property": {
+                            "key": "fieldKey",
+                            "name": "fieldName",
+                            "type": "fieldType",
+                            "validation": {
+                                "allowed_types": ["text", "num"],
+                                "type_constraints": {
+                                    "text": {"target_type": "string", "requires_options": False},
+                                    "num": {"target_type": "number", "requires_options": False}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        
+        engine = SchemaEngine(meta_schema)
+        batch_calls = []
+        
+        def text_formatter(engine_instance, field_meta, model_value, table_name):
+            if model_value == "boom":
+                raise ValueError("bad value")
+            return {field_meta["key"]: {"type": "text", "value": model_value}}
+        
+        def text_batch_formatter(engine_instance, field_meta, model_values, table_name):
+            batch_calls.append((field_meta["key"], len(model_values)))
+            if "boom" in model_values:
+                raise ValueError("bad column")
+            return [{field_meta["key"]: {"type": "text", "value": model_value}} for model_value in model_values]
+        
+        def num_formatter(engine_instance, field_meta, model_value, table_name):
+            return [{"key": field_meta["key"], "type": "num", "value": model_value}]
+        
+        engine.register_reverse_formatter("test", "text", text_formatter)
+        engine.register_reverse_formatter("test", "num", num_formatter)
+        engine.register_batch_reverse_formatter("test", "text", text_batch_formatter)
+        
+        external_schema = {
+            "tableName": "Test Table",
+            "sections": [
+                {"sectionCode": "A", "sectionName": "Alpha", "fields": [
+                    {"fieldKey": "field1", "fieldName": "Field 1", "fieldType": "text"},
+                    {"fieldKey": "field2", "fieldName": "Field 2", "fieldType": "num"}
+                ]},
+                {"sectionCode": "B", "sectionName": "Beta", "fields": [
+                    {"fieldKey": "field3", "fieldName": "Field 3", "fieldType": "text"}
+                ]}
+            ]
+        }
+        table_id, table_name = engine.register_table(1, external_schema)
+        
+        model_responses = [
+            {"table_name": "Test Table", "sections": {
+                "A.Alpha": {"fields": {"Field 1": "one", "Field 2": 1}},
+                "B.Beta": {"fields": {"Field 3": "three"}}
+            }},
+            {"table_name": "Test Table", "sections": {"A.Alpha": {"fields": {"Field 2": 2}}}},
+            {"table_name": "Test Table", "sections": {"B.Beta": {"fields": {"Field 3": "boom"}}}},
+            {"table_name": "Test Table", "sections": "not an object"}
+        ]
+        
+        for options in [{}, {"group_by_containers": ["sections"], "pack_properties_as": "array"},
+                        {"group_by_containers": ["sections"], "pack_containers_as": "object"}]:
+            for batch_size in [1, 3, 64]:
+                expected = [engine.reverse_map(table_name, response, formatter_name="test", **options) for response in model_responses]
+                results = engine.iter_reverse_map_batch(table_name, iter(model_responses), formatter_name="test",
+                                                        batch_size=batch_size, **options)
+                self.assertEqual(list(results), expected)
+        
+        # One batch formatter call per text field and batch; the failing column falls back per value
+        batch_calls.clear()
+        results = list(engine.iter_reverse_map_batch(table_name, model_responses, formatter_name="test", batch_size=2))
+        self.assertEqual(batch_calls, [("field1", 2), ("field3", 2), ("field1", 2), ("field3", 2)])
+        self.assertNotIn("field3", results[2]["data"][0]["properties"])
+        self.assertEqual(results[2]["data"][0]["properties"]["field1"], {"type": "text", "value": None})
+        
+        with self.assertRaises(ValueError):
+            next(engine.iter_reverse_map_batch(table_name, model_responses, formatter_name="missing"))
+        with self.assertRaises(ValueError):
+            next(engine.iter_reverse_map_batch(table_name, model_responses, formatter_name="test", batch_size=0))
+
+    def test_ingest(self):
+        """Test that ingest matches json.loads + validate + reverse_map for valid and invalid responses."""
+        meta_schema = {
+            "schema_name": "tableName",
+            "container": {
+                "container_name": "sections",
+                "container_type": "array",
+                "object": {
+                    "key": "sectionCode",
+                    "name": "sectionName",
+                    "properties": {
+                        "properties_name": "fields",
+                        "property": {
+                            "key": "fieldKey",
+                            "name": "fieldName",
+                            "type": "fieldType",
+                            "options": "fieldOptions",
+                            "validation": {
+                                "allowed_types": ["text", "date", "num", "rad", "mcs"],
+                                "type_constraints": {
+                                    "text": {"target_type": "string", "requires_options": False},
+                                    "date": {"target_type": "date", "requires_options": False},
+                                    "num": {"target_type": "positive_number", "requires_options": False},
+                                    "rad": {"target_type": "single_select", "requires_options": True, "options_field": "fieldOptions"},
+                                    "mcs": {"target_type": "multiple_select", "requires_options": True, "options_field": "fieldOptions"}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        
+        engine = SchemaEngine(meta_schema)
+        
+        def test_formatter(engine_instance, field_meta, model_value, table_name):
+            return {field_meta["key"]: {"type": field_meta["original_schema_type"], "value": model_value}}
+        
+        for original_type in ["text", "date", "num", "rad", "mcs"]:
+            engine.register_reverse_formatter("test", original_type, test_formatter)
+        
+        external_schema = {
+            "tableName": "Test Table",
+            "sections": [
+                {"sectionCode": "A", "sectionName": "Alpha", "fields": [
+                    {"fieldKey": "name", "fieldName": "Name", "fieldType": "text"},
+                    {"fieldKey": "arrived", "fieldName": "Arrived", "fieldType": "date"},
+                    {"fieldKey": "weight", "fieldName": "Weight", "fieldType": "num"}
+                ]},
+                {"sectionCode": "B", "sectionName": "Beta", "fields": [
+                    {"fieldKey": "mode", "fieldName": "Mode", "fieldType": "rad", "fieldOptions": ["Walk", "Wheelchair"]},
+                    {"fieldKey": "aids", "fieldName": "Aids", "fieldType": "mcs", "fieldOptions": ["Cane", "Walker"]}
+                ]}
+            ]
+        }
+        table_id, table_name = engine.register_table(1, external_schema)
+        
+        valid = {
+            "table_name": "Test Table",
+            "sections": {
+                "A.Alpha": {"fields": {"Name": "Ray", "Arrived": "2024-01-05", "Weight": 71.5}},
+                "B.Beta": {"fields": {"Mode": "Walk", "Aids": ["Cane"]}}
+            }
+        }
+        
+        def with_value(section, field, value):
+            response = copy.deepcopy(valid)
+            response["sections"][section]["fields"][field] = value
+            return response
+        
+        extra_property = copy.deepcopy(valid)
+        extra_property["sections"]["A.Alpha"]["fields"]["Unknown"] = "x"
+        missing_section = copy.deepcopy(valid)
+        del missing_section["sections"]["B.Beta"]
+        
+        responses = [
+            valid,
+            with_value("A.Alpha", "Name", None),
+            with_value("A.Alpha", "Arrived", "yesterday"),     # custom validator error
+            with_value("A.Alpha", "Weight", -2),                # minimum
+            with_value("A.Alpha", "Weight", True),              # booleans are not numbers
+            with_value("B.Beta", "Mode", "Skateboard"),         # enum
+            with_value("B.Beta", "Aids", ["Cane", "Crutch"]),   # item enum
+            with_value("B.Beta", "Aids", "Cane"),               # type
+            extra_property,
+            missing_section,
+        ]
+        
+        for response in responses:
+            expected_valid, expected_errors = engine.validate(table_id, response)
+            for options in [{}, {"group_by_containers": ["sections"], "pack_properties_as": "array"}]:
+                expected = engine.reverse_map(table_name, response, formatter_name="test", **options)
+                for raw_response in [json.dumps(response), json.dumps(response).encode("utf-8")]:
+                    is_valid, errors, formatted = engine.ingest(table_name, raw_response, formatter_name="test", **options)
+                    self.assertEqual((is_valid, errors), (expected_valid, expected_errors))
+                    self.assertEqual(formatted, expected)
+        
+        self.assertFalse(engine.ingest(table_name, json.dumps(responses[2]), formatter_name="test")[0])
+        
+        is_valid, errors, formatted = engine.ingest(table_id, b'{"table_name": ', formatter_name="test")
+        self.assertFalse(is_valid)
+        self.assertTrue(errors[0].startswith("Invalid JSON"))
+        self.assertIsNone(formatted)
+        
+        with self.assertRaises(ValueError):
+            engine.ingest(table_name, json.dumps(valid), formatter_name="missing")
+
     def test_reverse_map_pack_containers_object_properties_array(self):
         """Test pack_containers_as='object' with pack_properties_as='array'."""
         # Setup: Create simple nested meta-schema (same as above)
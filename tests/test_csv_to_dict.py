@@ -1,5 +1,6 @@
 import pytest
 import tempfile
+import io
 import os
 from pathlib import Path
 import sys
@@ -10,6 +11,9 @@ import sys
 from schema_engine.csv_to_dict import (
     read_key_value_csv_path,
     read_key_value_csv_stream,
+    read_multi_value_csv_path,
+    read_multi_value_csv_s3,
+    read_multi_value_csv_stream,
 )
 
 
@@ -855,3 +859,124 @@ data3,q3,data3,data4,Emoji 😀 "test" [brackets]"""
         finally:
             os.unlink(path)
 
+
+
+class TestMultiValueColumns:
+    """Test extracting several value columns in a single pass."""
+
+    CSV_CONTENT = """Key,Instruction,Notes,Hint
+a,<b>Ask</b> about pain,Clinical note A,hint a
+b,Check skin,Clinical note B,hint b
+a,Repeat pain question,Second note A,hint a2
+,orphan,orphan note,orphan hint"""
+
+    def test_multiple_columns_match_single_column_reads(self):
+        """Each column dict equals what the single-column reader produces."""
+        path = create_temp_csv(self.CSV_CONTENT)
+        try:
+            result = read_multi_value_csv_path(
+                path,
+                key_col="Key",
+                value_cols=["Instruction", "Notes", "Hint"],
+                on_duplicate="concat",
+            )
+            for col in ["Instruction", "Notes", "Hint"]:
+                assert result[col] == read_key_value_csv_path(
+                    path, key_col="Key", value_col=col, on_duplicate="concat"
+                )
+            assert result["Instruction"] == {
+                "a": "Ask about pain. Repeat pain question",
+                "b": "Check skin",
+            }
+        finally:
+            os.unlink(path)
+
+    def test_per_column_policies_and_sanitization(self):
+        """Duplicate policy and sanitization can be chosen per column."""
+        path = create_temp_csv(self.CSV_CONTENT)
+        try:
+            result = read_multi_value_csv_path(
+                path,
+                key_col="Key",
+                value_cols=["Instruction", "Notes", "Hint"],
+                on_duplicate={"Instruction": "first", "Notes": "concat"},
+                sanitize_values={"Instruction": False},
+                key_prefix="Cust",
+            )
+            assert result["Instruction"] == {
+                "Cust_a": "<b>Ask</b> about pain",
+                "Cust_b": "Check skin",
+            }
+            assert result["Notes"] == {
+                "Cust_a": "Clinical note A. Second note A",
+                "Cust_b": "Clinical note B",
+            }
+            # Columns missing from the mapping fall back to "last"
+            assert result["Hint"] == {"Cust_a": "hint a2", "Cust_b": "hint b"}
+        finally:
+            os.unlink(path)
+
+    def test_error_policy_applies_per_column(self):
+        """An "error" policy on one column raises on the duplicate row."""
+        with pytest.raises(ValueError, match="Duplicate key 'a' on CSV line 4"):
+            read_multi_value_csv_stream(
+                io.StringIO(self.CSV_CONTENT),
+                key_col="Key",
+                value_cols=["Instruction", "Notes"],
+                on_duplicate={"Notes": "error"},
+            )
+
+    def test_missing_value_column(self):
+        """Any missing value column raises KeyError before reading rows."""
+        with pytest.raises(KeyError, match="Column 'Missing' not found"):
+            read_multi_value_csv_stream(
+                io.StringIO(self.CSV_CONTENT),
+                key_col="Key",
+                value_cols=["Instruction", "Missing"],
+            )
+
+    def test_value_cols_validation(self):
+        """value_cols must be a non-empty sequence of distinct names."""
+        with pytest.raises(TypeError):
+            read_multi_value_csv_stream(
+                io.StringIO(self.CSV_CONTENT), key_col="Key", value_cols="Instruction"
+            )
+        with pytest.raises(ValueError):
+            read_multi_value_csv_stream(
+                io.StringIO(self.CSV_CONTENT), key_col="Key", value_cols=[]
+            )
+        with pytest.raises(ValueError):
+            read_multi_value_csv_stream(
+                io.StringIO(self.CSV_CONTENT), key_col="Key", value_cols=["Instruction", "Instruction"],
+                on_duplicate="concat"
+            )
+
+    def test_s3_body_read_once(self):
+        """S3 objects are fetched once and decoded the same way as local files."""
+
+        class FakeS3Client:
+            def __init__(self, payload: bytes):
+                self.payload = payload
+                self.calls = 0
+
+            def get_object(self, Bucket, Key):
+                self.calls += 1
+                return {"Body": io.BytesIO(self.payload)}
+
+        client = FakeS3Client(("\ufeff" + self.CSV_CONTENT).encode("utf-8"))
+        path = create_temp_csv(self.CSV_CONTENT)
+        try:
+            from_s3 = read_multi_value_csv_s3(
+                "bucket",
+                "instructions.csv",
+                key_col="Key",
+                value_cols=["Instruction", "Notes", "Hint"],
+                s3_client=client,
+            )
+            from_path = read_multi_value_csv_path(
+                path, key_col="Key", value_cols=["Instruction", "Notes", "Hint"]
+            )
+            assert client.calls == 1
+            assert from_s3 == from_path
+        finally:
+            os.unlink(path)
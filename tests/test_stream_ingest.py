@@ -0,0 +1,185 @@
+"""Tests for stream_ingest module."""
+
+import json
+from typing import Iterator, List
+
+import pytest
+
+from schema_engine.schema_engine import SchemaEngine
+from schema_engine.stream_ingest import IncrementalResponseParser, iter_stream_events
+
+
+META_SCHEMA = {
+    "schema_name": "tableName",
+    "container": {
+        "container_name": "sections",
+        "container_type": "array",
+        "object": {
+            "key": "sectionCode",
+            "name": "sectionName",
+            "properties": {
+                "properties_name": "fields",
+                "property": {
+                    "key": "fieldKey",
+                    "name": "fieldName",
+                    "type": "fieldType",
+                    "options": "fieldOptions",
+                    "validation": {
+                        "allowed_types": ["text", "date", "rad"],
+                        "type_constraints": {
+                            "text": {"target_type": "string", "requires_options": False},
+                            "date": {"target_type": "date", "requires_options": False},
+                            "rad": {
+                                "target_type": "single_select",
+                                "requires_options": True,
+                                "options_field": "fieldOptions",
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+EXTERNAL_SCHEMA = {
+    "tableName": "Stream Table",
+    "sections": [
+        {"sectionCode": "A", "sectionName": "Alpha", "fields": [
+            {"fieldKey": "A_1", "fieldName": "Name", "fieldType": "text"},
+            {"fieldKey": "A_2", "fieldName": "Arrived", "fieldType": "date"},
+        ]},
+        {"sectionCode": "B", "sectionName": "Beta", "fields": [
+            {"fieldKey": "B_1", "fieldName": "Mode", "fieldType": "rad", "fieldOptions": ["Walk", "Wheelchair"]},
+        ]},
+    ],
+}
+
+RESPONSE = {
+    "table_name": "Stream Table",
+    "sections": {
+        "A.Alpha": {"fields": {"Name": "Renée \"Ray\" O'Neil", "Arrived": "2024-01-05"}},
+        "B.Beta": {"fields": {"Mode": "Wheelchair"}},
+    },
+}
+
+
+def fake_stream(text: str, chunk_size: int) -> Iterator[str]:
+    """Yield text in fixed-size chunks, like deltas of a streamed completion."""
+    for i in range(0, len(text), chunk_size):
+        yield text[i:i + chunk_size]
+
+
+@pytest.fixture
+def engine_and_table():
+    engine = SchemaEngine(META_SCHEMA)
+    table_id, table_name = engine.register_table(1, EXTERNAL_SCHEMA)
+    return engine, table_name
+
+
+def _events_of(events: List[dict], kind: str) -> List[dict]:
+    return [e for e in events if e["event"] == kind]
+
+
+class TestIncrementalResponseParser:
+    """Test incremental parsing of chunked model responses."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 10000])
+    def test_valid_stream_emits_field_events_and_result(self, engine_and_table, chunk_size):
+        """Test that every field is reported once, validated, and the result matches json.loads."""
+        engine, table_name = engine_and_table
+        text = json.dumps(RESPONSE, indent=2)
+
+        events = list(iter_stream_events(engine, table_name, fake_stream(text, chunk_size)))
+
+        fields = _events_of(events, "field")
+        assert [e["key"] for e in fields] == ["A_1", "A_2", "B_1"]
+        assert all(e["is_valid"] and e["errors"] == [] for e in fields)
+        assert fields[0]["value"] == RESPONSE["sections"]["A.Alpha"]["fields"]["Name"]
+        assert fields[2]["path"] == ["sections", "B.Beta", "fields", "Mode"]
+        assert events[-1] == {"event": "complete", "value": json.loads(text)}
+        assert _events_of(events, "error") == []
+
+    def test_field_event_arrives_before_stream_ends(self, engine_and_table):
+        """Test that an invalid field is reported in the chunk that closes it."""
+        engine, table_name = engine_and_table
+        response = json.loads(json.dumps(RESPONSE))
+        response["sections"]["A.Alpha"]["fields"]["Arrived"] = "yesterday"
+        text = json.dumps(response)
+
+        parser = IncrementalResponseParser(engine, table_name)
+        cut = text.index('"yesterday"') + len('"yesterday"')
+        events = parser.feed(text[:cut])
+
+        arrived = [e for e in _events_of(events, "field") if e["key"] == "A_2"]
+        assert len(arrived) == 1
+        assert arrived[0]["is_valid"] is False
+        assert "yesterday" in arrived[0]["errors"][0]
+        assert not parser.done
+
+        events = parser.feed(text[cut:])
+        assert events[-1]["event"] == "complete"
+        assert parser.close() == []
+
+    def test_enum_violation_reported(self, engine_and_table):
+        """Test that single-select values are validated against the field enum."""
+        engine, table_name = engine_and_table
+        response = json.loads(json.dumps(RESPONSE))
+        response["sections"]["B.Beta"]["fields"]["Mode"] = "Skateboard"
+
+        events = list(iter_stream_events(engine, table_name, fake_stream(json.dumps(response), 5)))
+        mode = [e for e in _events_of(events, "field") if e["key"] == "B_1"][0]
+        assert mode["is_valid"] is False
+        assert mode["errors"][0].startswith("sections.B.Beta.fields.Mode:")
+
+    def test_unexpected_property_reported_at_key(self, engine_and_table):
+        """Test that an unknown property is reported as soon as its key is read."""
+        engine, table_name = engine_and_table
+        parser = IncrementalResponseParser(engine, table_name)
+
+        events = parser.feed('{"table_name": "Stream Table", "sections": {"Z.Zeta"')
+        errors = _events_of(events, "error")
+        assert len(errors) == 1
+        assert errors[0]["path"] == ["sections", "Z.Zeta"]
+        assert "Unexpected property" in errors[0]["message"]
+
+    def test_wrong_container_type_reported(self, engine_and_table):
+        """Test that a container given as the wrong JSON type is reported when it starts."""
+        engine, table_name = engine_and_table
+        parser = IncrementalResponseParser(engine, table_name)
+
+        events = parser.feed('{"table_name": "Stream Table", "sections": [')
+        errors = _events_of(events, "error")
+        assert errors[0]["path"] == ["sections"]
+        assert "got array" in errors[0]["message"]
+
+    def test_missing_required_reported_at_object_close(self, engine_and_table):
+        """Test that missing required properties are reported when their object closes."""
+        engine, table_name = engine_and_table
+        parser = IncrementalResponseParser(engine, table_name)
+
+        events = parser.feed('{"table_name": "Stream Table", "sections": {"A.Alpha": {"fields": {"Name": "x"}}')
+        errors = _events_of(events, "error")
+        assert errors[0]["path"] == ["sections", "A.Alpha", "fields"]
+        assert "Arrived" in errors[0]["message"]
+        assert not parser.done
+
+    def test_syntax_error_stops_parser(self, engine_and_table):
+        """Test that invalid JSON yields a syntax_error and stops the parser."""
+        engine, table_name = engine_and_table
+        events = list(iter_stream_events(engine, table_name, fake_stream('{"table_name": "Stream Table",, "x": 1}', 4)))
+        assert events[-1]["event"] == "syntax_error"
+        assert events[-1]["offset"] == 30
+
+        parser = IncrementalResponseParser(engine, table_name)
+        parser.feed('{"table_name": tru')
+        assert parser.feed('x}')[0]["event"] == "syntax_error"
+        with pytest.raises(ValueError):
+            parser.feed("}")
+
+    def test_truncated_stream(self, engine_and_table):
+        """Test that a stream ending before the top-level object closes yields a syntax_error."""
+        engine, table_name = engine_and_table
+        text = json.dumps(RESPONSE)
+        events = list(iter_stream_events(engine, table_name, fake_stream(text[:-10], 7)))
+        assert events[-1] == {"event": "syntax_error", "message": "Unexpected end of stream", "offset": len(text) - 10}
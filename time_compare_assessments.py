@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Script to time compare_assessments.process_directory on a synthetic directory of large chart exports.
+
+Each export pairs a complete model response (speakcare_chart), built with the generator used by the
+PCC tests, with its PCC DB form (pcc_assessment), with some PCC answers changed and a transcript
+payload of the requested size before or after speakcare_chart.state.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from pcc_schema.compare_assessments import get_pcc_schema, process_directory
+from tests.pcc.pcc_assessment_schema_test import _build_valid_model_response
+
+
+
+def write_exports(directory, num_files, payload_mb, reject_ratio, state_first=False):
+    """Write num_files synthetic chart exports; reject_ratio of them are in state 'signed'."""
+    pcc = get_pcc_schema()
+    samples = [(template_id, _build_valid_model_response(pcc, template_id)) for template_id in pcc.list_assessments()]
+
+    rng = random.Random(0)
+    line = {"speaker": "nurse", "text": "Resident reports mild discomfort in lower back, no acute distress. " * 3}
+    transcript = [dict(line, t=i) for i in range(int(payload_mb * 1e6 / 230))]
+
+    for i in range(num_files):
+        template_id, model_response = samples[i % len(samples)]
+        assessment_id, patient_id = 13000000 + i, 36000000 + i
+        pcc_db = pcc.format_to_pcc_db(template_id, model_response, assessment_id, patient_id)
+        for section in pcc_db["assessments"]["items"][str(assessment_id)]["sections"]:
+            for group in section["assessment_question_groups"]:
+                for response in group["assessment_responses"]:
+                    if rng.random() < 0.2:
+                        response["responses"] = [{"response_value": rng.choice(["a", "b", "1"])}]
+
+        state = "signed" if rng.random() < reject_ratio else "draft"
+        speakcare_chart = {"state": state} if state_first else {}
+        speakcare_chart.update({
+            "transcript": transcript,
+            "schema_id": str(template_id),
+            "table_name": pcc.get_json_schema(template_id)["title"],
+            "json_internal_filled": [{"internal_json": model_response}],
+            "state": state,
+        })
+        export = {
+            "speakcare_chart": speakcare_chart,
+            "pcc_assessment": {"ehr_patient_id": str(patient_id), "facility_id": "6", **pcc_db},
+        }
+        with open(os.path.join(directory, f"export_{i:05d}.json"), 'w', encoding='utf-8') as f:
+            json.dump(export, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time compare_assessments.process_directory")
+    parser.add_argument("--files", type=int, default=100, help="Number of chart exports (default: 100)")
+    parser.add_argument("--payload-mb", type=float, default=3.0, help="Transcript size per export in MB (default: 3)")
+    parser.add_argument("--reject-ratio", type=float, default=0.5,
+                        help="Fraction of exports rejected by the default state filter (default: 0.5)")
+    parser.add_argument("--state-first", action="store_true",
+                        help="Write speakcare_chart.state before the transcript instead of after it")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory:
+        write_exports(directory, args.files, args.payload_mb, args.reject_ratio, args.state_first)
+        output_csv = os.path.join(directory, "comparison.csv")
+
+        start_time = time.perf_counter()
+        process_directory(directory, output_csv, workers=args.workers)
+        elapsed = time.perf_counter() - start_time
+
+    state_position = "first" if args.state_first else "last"
+    print(f"{args.files} exports of ~{args.payload_mb:g} MB, {args.reject_ratio:.0%} rejected, state {state_position}, "
+          f"{args.workers} worker(s): {elapsed:.2f} s, {elapsed / args.files * 1000:.1f} ms/file")
+
+
+if __name__ == "__main__":
+    main()
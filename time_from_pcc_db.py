@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Script to time from_pcc_db against format_to_pcc_db on large batches of PCC DB assessments.
+"""
+
+import logging
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from pcc_schema.pcc_assessment_schema import PCCAssessmentSchema
+from tests.pcc.pcc_assessment_schema_test import _build_valid_model_response
+
+BATCH_SIZE = 2000
+
+
+def time_batch_ms(func, items):
+    """Return the total time of func over items, in milliseconds."""
+    start_time = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start_time) * 1000
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    pcc = PCCAssessmentSchema()
+
+    print("=" * 80)
+    print("from_pcc_db vs format_to_pcc_db (%d assessments per template)" % BATCH_SIZE)
+    print("=" * 80)
+    print(f"{'Template':<50} {'to DB ms':>9} {'from DB ms':>10} {'from/s':>8}")
+    print("-" * 80)
+
+    for template in PCCAssessmentSchema.TEMPLATES:
+        template_id = template["template_id"]
+        model_response = _build_valid_model_response(pcc, template_id)
+
+        pcc_db = pcc.format_to_pcc_db(template_id, model_response, 1, 2)
+        if pcc.format_to_pcc_db(template_id, pcc.from_pcc_db(template_id, pcc_db), 1, 2) != pcc_db:
+            print(f"{template['name'][:50]:<50} ROUND TRIP MISMATCH")
+            continue
+
+        model_responses = [model_response] * BATCH_SIZE
+        pcc_db_objs = [pcc_db] * BATCH_SIZE
+        to_db = time_batch_ms(lambda m: pcc.format_to_pcc_db(template_id, m, 1, 2), model_responses)
+        from_db = time_batch_ms(lambda d: pcc.from_pcc_db(template_id, d), pcc_db_objs)
+        print(f"{template['name'][:50]:<50} {to_db:>9.1f} {from_db:>10.1f} {BATCH_SIZE / from_db * 1000:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
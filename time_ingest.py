@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Script to time the fused ingest() against json.loads + validate + reverse_map.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from pcc_schema.pcc_assessment_schema import PCCAssessmentSchema
+from tests.pcc.pcc_assessment_schema_test import _build_valid_model_response
+
+REPEATS = 30
+
+
+def best_time_ms(func):
+    """Return the best of REPEATS runs of func, in milliseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings) * 1000
+
+
+def three_calls(pcc, template_id, raw_response, formatter_name):
+    """The unfused sequence: parse, validate, reverse map."""
+    model_response = json.loads(raw_response)
+    is_valid, errors = pcc.validate(template_id, model_response)
+    return is_valid, errors, pcc.reverse_map(template_id, model_response, formatter_name=formatter_name)
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    pcc = PCCAssessmentSchema()
+
+    print("=" * 80)
+    print("ingest() vs json.loads + validate + reverse_map (best of %d, ms)" % REPEATS)
+    print("=" * 80)
+    print(f"{'Template':<50} {'Formatter':<10} {'3 calls':>8} {'ingest':>8} {'Speedup':>8}")
+    print("-" * 80)
+
+    for template in PCCAssessmentSchema.TEMPLATES:
+        template_id = template["template_id"]
+        raw_response = json.dumps(_build_valid_model_response(pcc, template_id)).encode("utf-8")
+
+        for formatter_name in ["pcc-ui", "default"]:
+            expected = three_calls(pcc, template_id, raw_response, formatter_name)
+            if pcc.ingest(template_id, raw_response, formatter_name=formatter_name) != expected:
+                print(f"{template['name']:<50} {formatter_name:<10} MISMATCH")
+                continue
+
+            unfused = best_time_ms(lambda: three_calls(pcc, template_id, raw_response, formatter_name))
+            fused = best_time_ms(lambda: pcc.ingest(template_id, raw_response, formatter_name=formatter_name))
+            print(f"{template['name'][:50]:<50} {formatter_name:<10} {unfused:>8.2f} {fused:>8.2f} {unfused / fused:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
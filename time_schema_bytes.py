@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Script to time get_json_schema_bytes against json.dumps of get_json_schema / get_schema_with_overrides,
+i.e. the per-request cost of serializing a schema for an LLM call.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from pcc_schema.pcc_assessment_schema import PCCAssessmentSchema
+from tests.pcc.pcc_assessment_schema_test import _build_valid_model_response
+
+REPEATS = 30
+NUM_OVERRIDES = 5
+
+
+def best_time_ms(func):
+    """Return the best of REPEATS runs of func, in milliseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings) * 1000
+
+
+def value_overrides(engine, template_id, model_response):
+    """Lock the first NUM_OVERRIDES scalar fields to their values in the sample model response."""
+    overrides = {}
+    for field_meta in engine.get_field_metadata(template_id):
+        value = model_response
+        for key in field_meta["level_keys"] + [field_meta["property_key"]]:
+            value = value[key]
+        if isinstance(value, (str, int, float)):
+            overrides[field_meta["key"]] = {"value": value, "description": "Confirmed earlier"}
+        if len(overrides) == NUM_OVERRIDES:
+            break
+    return overrides
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    pcc = PCCAssessmentSchema()
+    engine = pcc.engine
+
+    print("=" * 80)
+    print("Schema serialization per request (best of %d, ms; %d value overrides)" % (REPEATS, NUM_OVERRIDES))
+    print("=" * 80)
+    print(f"{'Template':<40} {'KB':>4} {'dumps':>7} {'bytes':>7} {'ovr dumps':>10} {'ovr bytes':>10}")
+    print("-" * 80)
+
+    for template in PCCAssessmentSchema.TEMPLATES:
+        template_id = template["template_id"]
+        model_response = _build_valid_model_response(pcc, template_id)
+        overrides = value_overrides(engine, template_id, model_response)
+
+        def dumps(schema):
+            return json.dumps(schema, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        json_schema = engine.get_json_schema(template_id)
+        if (engine.get_json_schema_bytes(template_id) != dumps(json_schema)
+                or engine.get_json_schema_bytes(template_id, overrides)
+                != dumps(engine.get_schema_with_overrides(template_id, overrides))):
+            print(f"{template['name'][:40]:<40} MISMATCH")
+            continue
+
+        plain_dumps = best_time_ms(lambda: dumps(engine.get_json_schema(template_id)))
+        plain_bytes = best_time_ms(lambda: engine.get_json_schema_bytes(template_id))
+        override_dumps = best_time_ms(lambda: dumps(engine.get_schema_with_overrides(template_id, overrides)))
+        override_bytes = best_time_ms(lambda: engine.get_json_schema_bytes(template_id, overrides))
+        print(f"{template['name'][:40]:<40} {len(dumps(json_schema)) // 1024:>4} {plain_dumps:>7.3f} {plain_bytes:>7.4f} "
+              f"{override_dumps:>10.2f} {override_bytes:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
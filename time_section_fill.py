@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Script to time fill_sections against a single full-schema request, using a local fake model client.
+
+The fake client answers with a complete model response to each template, built with the
+generator used by the PCC tests, after a fixed latency plus a latency per KB of response, which
+stands in for token generation time.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from pcc_schema.pcc_assessment_schema import PCCAssessmentSchema
+from pcc_schema.section_fill import FakeSectionClient, fill_sections
+from tests.pcc.pcc_assessment_schema_test import _build_valid_model_response
+
+
+def time_single_request(pcc, template_id, client):
+    """One request with the full schema; return (elapsed seconds, is_valid)."""
+    start_time = time.perf_counter()
+    content = asyncio.run(client.complete("", "transcript", pcc.get_json_schema(template_id)))
+    is_valid, _ = pcc.validate(template_id, json.loads(content))
+    return time.perf_counter() - start_time, is_valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time per-section fills against one full-schema request")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fixed seconds per request (default: 0.05)")
+    parser.add_argument("--latency-per-kb", type=float, default=0.3,
+                        help="Additional seconds per KB of response (default: 0.3)")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="Requests in flight (default: 4)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    pcc = PCCAssessmentSchema()
+
+    print("=" * 80)
+    print(f"Fake client: {args.latency:g} s + {args.latency_per_kb:g} s/KB per request, "
+          f"max concurrency {args.max_concurrency}")
+    print("=" * 80)
+    print(f"{'Template':<46} {'Sections':>8} {'1 call s':>9} {'Sections s':>10} {'Speedup':>8}")
+    print("-" * 80)
+
+    for template in PCCAssessmentSchema.TEMPLATES:
+        template_id = template["template_id"]
+        model_response = _build_valid_model_response(pcc, template_id)
+
+        client = FakeSectionClient(model_response, latency=args.latency, latency_per_kb=args.latency_per_kb)
+        single, single_valid = time_single_request(pcc, template_id, client)
+
+        start_time = time.perf_counter()
+        result = fill_sections(pcc, template_id, "transcript", client, max_concurrency=args.max_concurrency)
+        sections = time.perf_counter() - start_time
+
+        if not single_valid or result["failed_sections"] or result["model_response"] != model_response:
+            print(f"{template['name'][:46]:<46} MISMATCH")
+            continue
+        print(f"{template['name'][:46]:<46} {len(result['attempts']):>8} {single:>9.2f} {sections:>10.2f} "
+              f"{single / sections:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()